@@ -0,0 +1,4 @@
+#!/bin/sh
+
+# Run Celery beat, which schedules the outbox drain and cleanup tasks
+celery -A src.config.celery beat --loglevel=info --schedule /tmp/celerybeat-schedule
@@ -0,0 +1,9 @@
+#!/bin/sh
+
+# Precompile email templates once, before the worker forks its processes
+if [ -n "$EMAIL_TEMPLATES_COMPILED_DIR" ]; then
+    python -m src.tools.compile_email_templates
+fi
+
+# Run Celery worker for the default queue and the outbound email queue
+celery -A src.config.celery worker -Q celery,emails --loglevel=info
@@ -0,0 +1,4 @@
+from src.cache.memory import InMemoryLRUCache
+from src.cache.redis import RedisCache
+from src.cache.catalog import CatalogCache
+from src.cache.etag import make_etag, etag_matches
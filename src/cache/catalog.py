@@ -0,0 +1,99 @@
+import hashlib
+import json
+import logging
+from typing import Any
+from redis.exceptions import RedisError
+from src.cache.memory import InMemoryLRUCache
+from src.cache.redis import RedisCache
+
+
+class CatalogCache:
+    """
+    Two-tier cache for serialized catalog responses.
+
+    Entries are JSON strings keyed by the namespace, the normalized query
+    parameters and the catalog version stamp. Moderator writes bump the
+    version, which orphans every cached entry at once. With Redis enabled
+    both the version and the entries are shared between workers; without
+    it invalidation is local and other workers catch up after the TTL.
+    Responses that must not go stale across workers also key on the
+    database catalog version (see src.catalog.version).
+    """
+
+    _VERSION_KEY = "version"
+
+    def __init__(
+        self,
+        local: InMemoryLRUCache,
+        remote: RedisCache | None,
+        ttl_seconds: int,
+    ):
+        self._local = local
+        self._remote = remote
+        self._ttl_seconds = ttl_seconds
+        self._local_version = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def version(self) -> int:
+        if self._remote is not None:
+            try:
+                return await self._remote.get_int(self._VERSION_KEY)
+            except RedisError as error:
+                logging.warning(f"Catalog cache version lookup failed: {error}")
+        return self._local_version
+
+    async def key(self, namespace: str, **params: Any) -> str:
+        normalized = json.dumps(
+            {name: value for name, value in params.items() if value is not None},
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha1(normalized.encode()).hexdigest()
+        return f"{await self.version()}:{namespace}:{digest}"
+
+    async def get(self, key: str) -> str | None:
+        value = self._local.get(key)
+        if value is None and self._remote is not None:
+            try:
+                value = await self._remote.get(key)
+            except RedisError as error:
+                logging.warning(f"Catalog cache read failed: {error}")
+            if value is not None:
+                self._local.set(key, value)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        self._local.set(key, value)
+        if self._remote is not None:
+            try:
+                await self._remote.set(key, value, self._ttl_seconds)
+            except RedisError as error:
+                logging.warning(f"Catalog cache write failed: {error}")
+
+    async def invalidate(self) -> None:
+        self._local_version += 1
+        self._local.clear()
+        if self._remote is not None:
+            try:
+                await self._remote.incr(self._VERSION_KEY)
+            except RedisError as error:
+                logging.error(f"Catalog cache invalidation failed: {error}")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "local_entries": len(self._local),
+        }
+
+    async def close(self) -> None:
+        if self._remote is not None:
+            await self._remote.close()
@@ -0,0 +1,28 @@
+from redis.asyncio import Redis
+
+
+class RedisCache:
+    """
+    Thin async wrapper over the shared Redis instance used as a second cache tier.
+    """
+
+    def __init__(self, url: str, prefix: str):
+        self._client = Redis.from_url(url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> str | None:
+        value = await self._client.get(self._prefix + key)
+        return value.decode() if value is not None else None
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await self._client.set(self._prefix + key, value, ex=ttl_seconds)
+
+    async def get_int(self, key: str) -> int:
+        value = await self._client.get(self._prefix + key)
+        return int(value) if value is not None else 0
+
+    async def incr(self, key: str) -> int:
+        return await self._client.incr(self._prefix + key)
+
+    async def close(self) -> None:
+        await self._client.aclose()
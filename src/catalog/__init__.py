@@ -0,0 +1,5 @@
+from src.catalog.genre_stats import adjust_genre_stats
+from src.catalog.version import bump_catalog_version, get_catalog_version
+from src.catalog.importer import MovieImporter, read_records, IMPORT_FORMATS
+from src.catalog.export import MovieExporter, EXPORT_MEDIA_TYPES
+from src.catalog.dependencies import get_movie_importer, get_movie_exporter
@@ -0,0 +1,24 @@
+from fastapi import Depends
+from src.catalog.export import MovieExporter
+from src.catalog.importer import MovieImporter
+from src.config import get_settings, BaseAppSettings
+from src.database import get_db_contextmanager
+from src.search import MovieSearchEngineInterface, get_movie_search_engine
+
+
+def get_movie_importer(
+    settings: BaseAppSettings = Depends(get_settings),
+    search_engine: MovieSearchEngineInterface = Depends(get_movie_search_engine),
+) -> MovieImporter:
+    return MovieImporter(
+        search_engine=search_engine, batch_size=settings.MOVIE_IMPORT_BATCH_SIZE
+    )
+
+
+def get_movie_exporter(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> MovieExporter:
+    return MovieExporter(
+        session_factory=get_db_contextmanager,
+        chunk_size=settings.MOVIE_EXPORT_CHUNK_SIZE,
+    )
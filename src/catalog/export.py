@@ -0,0 +1,114 @@
+import csv
+import io
+from datetime import datetime, timezone
+from typing import AsyncContextManager, AsyncIterator, Callable
+from sqlalchemy import column, func, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from src.catalog.importer import CSV_LIST_FIELDS, CSV_LIST_SEPARATOR
+from src.database.models import Movie
+from src.schemas.movies import MovieExportSchema
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+CSV_EXPORT_FIELDS = list(MovieExportSchema.model_fields)
+
+
+class MovieExporter:
+    """
+    Streams the catalog as NDJSON or CSV through a server-side cursor.
+
+    Movies are fetched `chunk_size` rows at a time in (updated_at, id) order
+    and their genres, stars and directors are loaded with one batched
+    SELECT per chunk, so memory stays flat regardless of catalog size.
+    CSV output uses the same list separator as the importer.
+
+    Incremental exports cover the half-open window [since, until), where
+    `until` comes from `watermark()` and becomes the next run's `since`.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        chunk_size: int,
+    ):
+        self._session_factory = session_factory
+        self._chunk_size = chunk_size
+
+    async def watermark(self) -> datetime:
+        """
+        Return the upper bound for an export that no later commit can fall below.
+
+        `updated_at` is the writing transaction's start time, but the row only
+        becomes visible when that transaction commits, so `now()` would skip
+        rows of transactions still open at export time. On PostgreSQL the
+        bound is the start of the oldest open transaction in the database;
+        every change stamped before it is already committed.
+        """
+        async with self._session_factory() as db:
+            if db.get_bind().dialect.name != "postgresql":
+                return datetime.now(timezone.utc)
+            activity = table(
+                "pg_stat_activity",
+                column("datname"),
+                column("pid"),
+                column("xact_start"),
+            )
+            return await db.scalar(
+                select(
+                    func.least(
+                        func.now(),
+                        func.coalesce(func.min(activity.c.xact_start), func.now()),
+                    )
+                ).where(
+                    activity.c.datname == func.current_database(),
+                    activity.c.pid != func.pg_backend_pid(),
+                )
+            )
+
+    async def stream(
+        self,
+        export_format: str,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[str]:
+        stmt = (
+            select(Movie)
+            .options(
+                selectinload(Movie.certification),
+                selectinload(Movie.genres),
+                selectinload(Movie.stars),
+                selectinload(Movie.directors),
+            )
+            .order_by(Movie.updated_at, Movie.id)
+            .execution_options(yield_per=self._chunk_size)
+        )
+        if since is not None:
+            stmt = stmt.where(Movie.updated_at >= since)
+        if until is not None:
+            stmt = stmt.where(Movie.updated_at < until)
+
+        if export_format == "csv":
+            yield self._csv_rows([CSV_EXPORT_FIELDS])
+
+        async with self._session_factory() as db:
+            result = await db.stream(stmt)
+            async for movies in result.scalars().partitions():
+                records = [MovieExportSchema.from_movie(movie) for movie in movies]
+                if export_format == "csv":
+                    yield self._csv_rows(self._csv_values(record) for record in records)
+                else:
+                    yield "".join(record.model_dump_json() + "\n" for record in records)
+
+    @staticmethod
+    def _csv_values(record: MovieExportSchema) -> list:
+        values = record.model_dump()
+        for field in CSV_LIST_FIELDS:
+            values[field] = CSV_LIST_SEPARATOR.join(values[field])
+        values["updated_at"] = record.updated_at.isoformat()
+        return [values[field] for field in CSV_EXPORT_FIELDS]
+
+    @staticmethod
+    def _csv_rows(rows) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
@@ -0,0 +1,32 @@
+from typing import Mapping
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.models import GenreStats
+
+
+async def adjust_genre_stats(db: AsyncSession, deltas: Mapping[int, int]) -> None:
+    """
+    Shift the maintained per-genre movie counts in `genre_stats`.
+
+    Called in the same transaction that links or unlinks movies, so the
+    genre list can read one row per genre instead of aggregating movies.
+
+    :param deltas: Change in movie count keyed by genre id.
+    """
+    rows = [
+        {"genre_id": genre_id, "movie_count": delta}
+        for genre_id, delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return
+    dialect_insert = (
+        sqlite.insert if db.get_bind().dialect.name == "sqlite" else postgresql.insert
+    )
+    stmt = dialect_insert(GenreStats).values(rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["genre_id"],
+            set_={"movie_count": GenreStats.movie_count + stmt.excluded.movie_count},
+        )
+    )
@@ -0,0 +1,258 @@
+import csv
+import time
+import uuid
+from collections import Counter
+from itertools import islice
+from typing import Iterable, Iterator
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from src.database.models import (
+    Certification,
+    Director,
+    Genre,
+    Movie,
+    MoviesDirectors,
+    MoviesGenres,
+    MoviesStars,
+    Star,
+)
+from src.catalog.genre_stats import adjust_genre_stats
+from src.catalog.version import bump_catalog_version
+from src.schemas.movies import MovieImportSchema, MovieImportReportSchema
+from src.search.interfaces import MovieSearchEngineInterface
+
+IMPORT_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+CSV_LIST_FIELDS = ("genres", "stars", "directors")
+CSV_LIST_SEPARATOR = "|"
+MAX_REPORTED_ERRORS = 100
+
+
+def read_records(lines: Iterable[str], import_format: str) -> Iterator[str | dict]:
+    """
+    Stream raw records from JSON Lines or CSV input.
+
+    JSON lines are yielded as strings and parsed during validation. In CSV
+    input the genres, stars and directors columns hold `|`-separated names.
+    """
+    if import_format == "jsonl":
+        for line in lines:
+            if line.strip():
+                yield line
+        return
+
+    for row in csv.DictReader(lines):
+        for field in CSV_LIST_FIELDS:
+            value = row.get(field) or ""
+            row[field] = [
+                name.strip() for name in value.split(CSV_LIST_SEPARATOR) if name.strip()
+            ]
+        yield {field: value for field, value in row.items() if value != ""}
+
+
+class MovieImporter:
+    """
+    Bulk movie loader that works in batches instead of per-entity round trips.
+
+    For each batch every certification, genre, star and director name is
+    resolved with one `WHERE name IN (...)` per entity type, missing names
+    are created with `INSERT ... ON CONFLICT DO NOTHING RETURNING`, movies
+    are inserted in one statement (existing ones are skipped), and the
+    association rows are written with executemany. Each batch is committed
+    on its own; a batch the database rejects is rolled back, reported as
+    failed, and the import carries on with the next one.
+
+    Records are read and validated in the threadpool one batch at a time,
+    so a large upload never blocks the event loop on file I/O.
+    """
+
+    def __init__(self, search_engine: MovieSearchEngineInterface, batch_size: int):
+        self._search_engine = search_engine
+        self._batch_size = batch_size
+
+    async def run(
+        self, db: AsyncSession, records: Iterable[str | dict]
+    ) -> MovieImportReportSchema:
+        started = time.perf_counter()
+        created = skipped = failed = 0
+        errors = []
+        numbered = enumerate(records, start=1)
+
+        while True:
+            read, numbers, batch, invalid = await run_in_threadpool(
+                self._read_batch, numbered
+            )
+            if not read:
+                break
+            failed += len(invalid)
+            errors.extend(invalid[: MAX_REPORTED_ERRORS - len(errors)])
+            if not batch:
+                continue
+
+            try:
+                batch_created = await self._import_batch(db, batch)
+            except SQLAlchemyError as error:
+                await db.rollback()
+                failed += len(batch)
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    reason = str(getattr(error, "orig", None) or error).splitlines()[0]
+                    errors.append(
+                        f"Records {numbers[0]}-{numbers[-1]}: batch rolled back: {reason}"
+                    )
+                continue
+            created += batch_created
+            skipped += len(batch) - batch_created
+
+        seconds = time.perf_counter() - started
+        return MovieImportReportSchema(
+            created=created,
+            skipped=skipped,
+            failed=failed,
+            errors=errors,
+            seconds=round(seconds, 3),
+            rows_per_second=round((created + skipped + failed) / seconds, 1)
+            if seconds
+            else 0.0,
+        )
+
+    def _read_batch(
+        self, numbered: Iterator[tuple[int, str | dict]]
+    ) -> tuple[int, list[int], list[MovieImportSchema], list[str]]:
+        """
+        Read and validate up to `batch_size` records.
+
+        Returns how many records were read, the numbers and schemas of the
+        valid ones, and an error message for each invalid one.
+        """
+        read = 0
+        numbers, batch, invalid = [], [], []
+        for number, record in islice(numbered, self._batch_size):
+            read += 1
+            try:
+                if isinstance(record, str):
+                    movie = MovieImportSchema.model_validate_json(record)
+                else:
+                    movie = MovieImportSchema.model_validate(record)
+            except ValidationError as error:
+                invalid.append(f"Record {number}: {error.errors()[0]['msg']}")
+                continue
+            numbers.append(number)
+            batch.append(movie)
+        return read, numbers, batch, invalid
+
+    async def _import_batch(
+        self, db: AsyncSession, movies: list[MovieImportSchema]
+    ) -> int:
+        dialect_insert = (
+            sqlite.insert if db.get_bind().dialect.name == "sqlite" else postgresql.insert
+        )
+        certification_ids = await self._resolve_names(
+            db, dialect_insert, Certification, {movie.certification for movie in movies}
+        )
+        genre_ids = await self._resolve_names(
+            db, dialect_insert, Genre, {name for movie in movies for name in movie.genres}
+        )
+        star_ids = await self._resolve_names(
+            db, dialect_insert, Star, {name for movie in movies for name in movie.stars}
+        )
+        director_ids = await self._resolve_names(
+            db,
+            dialect_insert,
+            Director,
+            {name for movie in movies for name in movie.directors},
+        )
+
+        result = await db.execute(
+            dialect_insert(Movie)
+            .values(
+                [
+                    {
+                        "uuid": movie.uuid or str(uuid.uuid4()),
+                        "name": movie.name,
+                        "year": movie.year,
+                        "time": movie.time,
+                        "imdb": movie.imdb,
+                        "meta_score": movie.meta_score,
+                        "gross": movie.gross,
+                        "description": movie.description,
+                        "price": movie.price,
+                        "certification_id": certification_ids[movie.certification],
+                    }
+                    for movie in movies
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(Movie.id, Movie.name, Movie.year, Movie.time)
+        )
+        created_ids = {(name, year, time): id_ for id_, name, year, time in result}
+        if not created_ids:
+            await db.commit()
+            return 0
+
+        new_movie_ids = []
+        genre_rows, star_rows, director_rows = [], [], []
+        for movie in movies:
+            # Popping links a movie repeated within the batch only once.
+            movie_id = created_ids.pop((movie.name, movie.year, movie.time), None)
+            if movie_id is None:
+                continue
+            new_movie_ids.append(movie_id)
+            genre_rows.extend(
+                {"movie_id": movie_id, "genre_id": genre_ids[name]}
+                for name in set(movie.genres)
+            )
+            star_rows.extend(
+                {"movie_id": movie_id, "star_id": star_ids[name]}
+                for name in set(movie.stars)
+            )
+            director_rows.extend(
+                {"movie_id": movie_id, "director_id": director_ids[name]}
+                for name in set(movie.directors)
+            )
+
+        for table, rows in (
+            (MoviesGenres, genre_rows),
+            (MoviesStars, star_rows),
+            (MoviesDirectors, director_rows),
+        ):
+            if rows:
+                await db.execute(insert(table), rows)
+
+        await adjust_genre_stats(db, Counter(row["genre_id"] for row in genre_rows))
+        await bump_catalog_version(db)
+        await self._search_engine.index_movies(db, new_movie_ids)
+        await db.commit()
+        return len(new_movie_ids)
+
+    @staticmethod
+    async def _resolve_names(
+        db: AsyncSession, dialect_insert, model, names: set[str]
+    ) -> dict[str, int]:
+        if not names:
+            return {}
+        ids = dict(
+            (await db.execute(select(model.name, model.id).where(model.name.in_(names))))
+            .tuples()
+            .all()
+        )
+        missing = [name for name in names if name not in ids]
+        if missing:
+            result = await db.execute(
+                dialect_insert(model)
+                .values([{"name": name} for name in missing])
+                .on_conflict_do_nothing(index_elements=["name"])
+                .returning(model.name, model.id)
+            )
+            ids.update(result.tuples().all())
+        # Names inserted concurrently by another import are not returned above.
+        raced = [name for name in missing if name not in ids]
+        if raced:
+            ids.update(
+                (await db.execute(select(model.name, model.id).where(model.name.in_(raced))))
+                .tuples()
+                .all()
+            )
+        return ids
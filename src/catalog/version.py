@@ -0,0 +1,32 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.models import CatalogVersion
+
+_ROW_ID = 1
+
+
+async def bump_catalog_version(db: AsyncSession) -> None:
+    """
+    Increment the shared catalog version in the caller's transaction.
+
+    Every worker reads the same row, so list ETags change everywhere as
+    soon as the write commits, whichever process or tool made it.
+    """
+    dialect_insert = (
+        sqlite.insert if db.get_bind().dialect.name == "sqlite" else postgresql.insert
+    )
+    stmt = dialect_insert(CatalogVersion).values(id=_ROW_ID, version=1)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={"version": CatalogVersion.version + 1},
+        )
+    )
+
+
+async def get_catalog_version(db: AsyncSession) -> int:
+    version = await db.scalar(
+        select(CatalogVersion.version).where(CatalogVersion.id == _ROW_ID)
+    )
+    return version or 0
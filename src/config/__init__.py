@@ -1,10 +1,16 @@
 from .settings import BaseAppSettings
 from .dependencies import (
     get_settings,
+    shared_instance,
     get_jwt_auth_manager,
-    get_email_notificator,
+    build_email_sender,
     get_current_user_id,
     get_s3_storage_client,
+    get_total_counter,
+    get_catalog_cache,
+    get_password_hasher,
+    init_dependencies,
+    close_dependencies,
 )
 
 settings = BaseAppSettings()
@@ -16,12 +16,23 @@ celery_app.conf.update(
     result_expires=3600,
     timezone="UTC",
     broker_connection_retry_on_startup=True,
+    # Outbound email has its own queue; workers must consume it as well as
+    # the default one (see commands/run_celery_worker.sh).
+    task_routes={"src.tasks.emails.*": {"queue": "emails"}},
 )
 
 celery_app.conf.beat_schedule = {
     "delete_expired_tokens_every_hour": {
-        "task": "src.tasks.delete_expired_activation_tokens",
-        "schedule": crontab(hour="*/1"),
+        "task": "src.tasks.tokens.delete_expired_tokens",
+        "schedule": crontab(minute=0),
+    },
+    "purge_email_outbox_every_hour": {
+        "task": "src.tasks.emails.purge_email_outbox",
+        "schedule": crontab(minute=30),
+    },
+    "drain_email_outbox": {
+        "task": "src.tasks.emails.drain_email_outbox",
+        "schedule": settings.EMAIL_OUTBOX_POLL_SECONDS,
     },
 }
 
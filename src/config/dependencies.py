@@ -1,15 +1,26 @@
+import inspect
 import os
+from functools import lru_cache
+from typing import Callable, TypeVar
 from fastapi import Depends, HTTPException
 from starlette import status
 from .settings import TestingSettings, Settings, BaseAppSettings, LocalSettings
+from src.cache import CatalogCache, InMemoryLRUCache, RedisCache
 from src.exceptions import BaseSecurityError
-from src.notifications import EmailSenderInterface, EmailSender
+from src.notifications import EmailSender
+from src.pagination import TotalCounter
 from src.security.http import get_token
 from src.security.interfaces import JWTAuthManagerInterface
+from src.security.password_hasher import PasswordHasher
+from src.security.token_cache import VerifiedTokenCache
 from src.security.token_manager import JWTAuthManager
 from src.storages import S3StorageInterface, S3StorageClient
 
 
+T = TypeVar("T")
+
+
+@lru_cache
 def get_settings() -> BaseAppSettings:
     env_mode = os.getenv("ENVIRONMENT", "local")
     if env_mode == "testing":
@@ -19,19 +30,45 @@ def get_settings() -> BaseAppSettings:
     return Settings()  # env_mode == "docker" or else
 
 
+_shared_instances: dict[str, tuple[BaseAppSettings, object]] = {}
+
+
+def shared_instance(name: str, settings: BaseAppSettings, factory: Callable[[], T]) -> T:
+    """
+    Return the process-wide instance registered under name.
+
+    The instance is rebuilt when it was created from a different settings
+    object, so overriding get_settings in tests still takes effect. Every
+    registered instance with a `close()` method, sync or async, is closed
+    by `close_dependencies`.
+    """
+    cached = _shared_instances.get(name)
+    if cached is None or cached[0] is not settings:
+        cached = (settings, factory())
+        _shared_instances[name] = cached
+    return cached[1]  # type: ignore[return-value]
+
+
 def get_jwt_auth_manager(
     settings: BaseAppSettings = Depends(get_settings),
 ) -> JWTAuthManagerInterface:
-    return JWTAuthManager(
-        secret_key_access=settings.SECRET_KEY_ACCESS,
-        secret_key_refresh=settings.SECRET_KEY_REFRESH,
-        algorithm=settings.JWT_SIGNING_ALGORITHM,
+    return shared_instance(
+        "jwt_auth_manager",
+        settings,
+        lambda: JWTAuthManager(
+            secret_key_access=settings.SECRET_KEY_ACCESS,
+            secret_key_refresh=settings.SECRET_KEY_REFRESH,
+            algorithm=settings.JWT_SIGNING_ALGORITHM,
+            access_token_cache=(
+                VerifiedTokenCache(max_entries=settings.ACCESS_TOKEN_CACHE_SIZE)
+                if settings.ACCESS_TOKEN_CACHE_SIZE > 0
+                else None
+            ),
+        ),
     )
 
 
-def get_email_notificator(
-    settings: BaseAppSettings = Depends(get_settings),
-) -> EmailSenderInterface:
+def build_email_sender(settings: BaseAppSettings) -> EmailSender:
     return EmailSender(
         hostname=settings.EMAIL_HOST,
         port=settings.EMAIL_PORT,
@@ -47,17 +84,101 @@ def get_email_notificator(
         send_payment_email_template_name=settings.SEND_PAYMENT_EMAIL_TEMPLATE_NAME,
         send_refund_email_template_name=settings.SEND_REFUND_EMAIL_TEMPLATE_NAME,
         send_cancellation_email_template_name=settings.SEND_CANCELLATION_EMAIL_TEMPLATE_NAME,
+        remove_movie_email_template_name=settings.REMOVE_MOVIE_EMAIL_TEMPLATE_NAME,
+        comment_answer_email_template_name=settings.COMMENT_ANSWER_EMAIL_TEMPLATE_NAME,
+        compiled_template_dir=settings.EMAIL_TEMPLATES_COMPILED_DIR or None,
+        smtp_pool_size=settings.EMAIL_SMTP_POOL_SIZE,
+        smtp_idle_timeout=settings.EMAIL_SMTP_IDLE_TIMEOUT_SECONDS,
     )
 
 
 def get_s3_storage_client(
     settings: BaseAppSettings = Depends(get_settings),
 ) -> S3StorageInterface:
-    return S3StorageClient(
-        endpoint_url=settings.s3_storage_endpoint,
-        access_key=settings.S3_STORAGE_ACCESS_KEY,
-        secret_key=settings.S3_STORAGE_SECRET_KEY,
-        bucket_name=settings.S3_BUCKET_NAME,
+    return shared_instance(
+        "s3_storage_client",
+        settings,
+        lambda: S3StorageClient(
+            endpoint_url=settings.s3_storage_endpoint,
+            access_key=settings.S3_STORAGE_ACCESS_KEY,
+            secret_key=settings.S3_STORAGE_SECRET_KEY,
+            bucket_name=settings.S3_BUCKET_NAME,
+        ),
+    )
+
+
+def get_password_hasher(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> PasswordHasher:
+    return shared_instance(
+        "password_hasher",
+        settings,
+        lambda: PasswordHasher(
+            rounds=settings.PASSWORD_HASH_ROUNDS,
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+        ),
+    )
+
+
+def init_dependencies(settings: BaseAppSettings) -> None:
+    """
+    Build the shared clients up front so the first request does not pay for it.
+    """
+    get_jwt_auth_manager(settings)
+    get_s3_storage_client(settings)
+    get_password_hasher(settings)
+    get_total_counter(settings)
+    get_catalog_cache(settings)
+
+
+async def close_dependencies() -> None:
+    """
+    Release the shared instances; the next request builds fresh ones.
+    """
+    instances = [instance for _, instance in _shared_instances.values()]
+    _shared_instances.clear()
+    for instance in instances:
+        close = getattr(instance, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+    get_settings.cache_clear()
+
+
+def get_total_counter(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> TotalCounter:
+    return shared_instance(
+        "total_counter",
+        settings,
+        lambda: TotalCounter(
+            exact_threshold=settings.MOVIE_COUNT_EXACT_THRESHOLD,
+            ttl_seconds=settings.MOVIE_COUNT_CACHE_TTL_SECONDS,
+            max_entries=settings.MOVIE_COUNT_CACHE_SIZE,
+        ),
+    )
+
+
+def get_catalog_cache(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> CatalogCache:
+    return shared_instance(
+        "catalog_cache",
+        settings,
+        lambda: CatalogCache(
+            local=InMemoryLRUCache(
+                max_entries=settings.CATALOG_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+            ),
+            remote=(
+                RedisCache(url=settings.CELERY_BROKER_URL, prefix="catalog:")
+                if settings.CATALOG_CACHE_USE_REDIS
+                else None
+            ),
+            ttl_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+        ),
     )
 
 
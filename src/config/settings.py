@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
@@ -23,14 +24,60 @@ class BaseAppSettings(BaseSettings):
     SEND_PAYMENT_EMAIL_TEMPLATE_NAME: str = "send_payment.html"
     SEND_REFUND_EMAIL_TEMPLATE_NAME: str = "send_refund.html"
     SEND_CANCELLATION_EMAIL_TEMPLATE_NAME: str = "send_cancellation.html"
+    REMOVE_MOVIE_EMAIL_TEMPLATE_NAME: str = "remove_movie.html"
+    COMMENT_ANSWER_EMAIL_TEMPLATE_NAME: str = "comment_answer.html"
+    # Directory of templates precompiled by `python -m src.tools.compile_email_templates`
+    EMAIL_TEMPLATES_COMPILED_DIR: str = os.getenv("EMAIL_TEMPLATES_COMPILED_DIR", "")
 
     LOGIN_TIME_DAYS: int = 7
 
+    MOVIE_COUNT_EXACT_THRESHOLD: int = int(os.getenv("MOVIE_COUNT_EXACT_THRESHOLD", 1000))
+    MOVIE_COUNT_CACHE_TTL_SECONDS: int = int(os.getenv("MOVIE_COUNT_CACHE_TTL_SECONDS", 60))
+    MOVIE_COUNT_CACHE_SIZE: int = int(os.getenv("MOVIE_COUNT_CACHE_SIZE", 1024))
+
+    NAME_FILTER_SIMILARITY_THRESHOLD: float = float(
+        os.getenv("NAME_FILTER_SIMILARITY_THRESHOLD", 0.5)
+    )
+    # Caps only fuzzy (similarity) name matches; substring matches are never capped
+    NAME_FILTER_CANDIDATE_LIMIT: int = int(os.getenv("NAME_FILTER_CANDIDATE_LIMIT", 100))
+
     EMAIL_HOST: str = os.getenv("EMAIL_HOST", "host")
     EMAIL_PORT: int = int(os.getenv("EMAIL_PORT", 25))
     EMAIL_HOST_USER: str = os.getenv("EMAIL_HOST_USER", "testuser")
     EMAIL_HOST_PASSWORD: str = os.getenv("EMAIL_HOST_PASSWORD", "test_password")
     EMAIL_USE_TLS: bool = os.getenv("EMAIL_USE_TLS", "False").lower() == "true"
+    EMAIL_SMTP_POOL_SIZE: int = int(os.getenv("EMAIL_SMTP_POOL_SIZE", 4))
+    EMAIL_SMTP_IDLE_TIMEOUT_SECONDS: float = float(
+        os.getenv("EMAIL_SMTP_IDLE_TIMEOUT_SECONDS", 60)
+    )
+
+    EMAIL_OUTBOX_POLL_SECONDS: float = float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", 5))
+    EMAIL_OUTBOX_BATCH_SIZE: int = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", 100))
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", 8))
+    EMAIL_OUTBOX_BACKOFF_SECONDS: float = float(
+        os.getenv("EMAIL_OUTBOX_BACKOFF_SECONDS", 30)
+    )
+    EMAIL_OUTBOX_BACKOFF_MAX_SECONDS: float = float(
+        os.getenv("EMAIL_OUTBOX_BACKOFF_MAX_SECONDS", 3600)
+    )
+    EMAIL_OUTBOX_DOMAIN_CONCURRENCY: int = int(
+        os.getenv("EMAIL_OUTBOX_DOMAIN_CONCURRENCY", 4)
+    )
+    EMAIL_OUTBOX_LEASE_SECONDS: float = float(
+        os.getenv("EMAIL_OUTBOX_LEASE_SECONDS", 300)
+    )
+    # How long sent and dead-lettered outbox rows are kept before the purge
+    EMAIL_OUTBOX_SENT_RETENTION_DAYS: float = float(
+        os.getenv("EMAIL_OUTBOX_SENT_RETENTION_DAYS", 7)
+    )
+    EMAIL_OUTBOX_DEAD_RETENTION_DAYS: float = float(
+        os.getenv("EMAIL_OUTBOX_DEAD_RETENTION_DAYS", 30)
+    )
+    EMAIL_OUTBOX_PURGE_BATCH_SIZE: int = int(
+        os.getenv("EMAIL_OUTBOX_PURGE_BATCH_SIZE", 1000)
+    )
+
+    TOKEN_PURGE_BATCH_SIZE: int = int(os.getenv("TOKEN_PURGE_BATCH_SIZE", 1000))
     MAILHOG_API_PORT: int = os.getenv("MAILHOG_API_PORT", 8025)
 
     S3_STORAGE_HOST: str = os.getenv("MINIO_HOST", "localhost")
@@ -50,6 +97,56 @@ class BaseAppSettings(BaseSettings):
         "CELERY_RESULT_BACKEND", "redis://127.0.0.1:6379/0"
     )
 
+    CATALOG_CACHE_TTL_SECONDS: int = int(os.getenv("CATALOG_CACHE_TTL_SECONDS", 60))
+    CATALOG_CACHE_MAX_ENTRIES: int = int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", 2048))
+    CATALOG_CACHE_USE_REDIS: bool = (
+        os.getenv("CATALOG_CACHE_USE_REDIS", "False").lower() == "true"
+    )
+
+    AUTH_CONTEXT_TTL_SECONDS: int = int(os.getenv("AUTH_CONTEXT_TTL_SECONDS", 30))
+    AUTH_CONTEXT_CACHE_SIZE: int = int(os.getenv("AUTH_CONTEXT_CACHE_SIZE", 10000))
+    # 0 disables caching of verified access tokens
+    ACCESS_TOKEN_CACHE_SIZE: int = int(os.getenv("ACCESS_TOKEN_CACHE_SIZE", 10000))
+
+    VOTE_INGESTION_ENABLED: bool = (
+        os.getenv("VOTE_INGESTION_ENABLED", "False").lower() == "true"
+    )
+    VOTE_BUFFER_USE_REDIS: bool = (
+        os.getenv("VOTE_BUFFER_USE_REDIS", "False").lower() == "true"
+    )
+    VOTE_FLUSH_INTERVAL_SECONDS: float = float(
+        os.getenv("VOTE_FLUSH_INTERVAL_SECONDS", 1.0)
+    )
+    VOTE_FLUSH_BATCH_SIZE: int = int(os.getenv("VOTE_FLUSH_BATCH_SIZE", 500))
+    VOTE_FLUSH_MAX_ATTEMPTS: int = int(os.getenv("VOTE_FLUSH_MAX_ATTEMPTS", 5))
+
+    MOVIE_IMPORT_BATCH_SIZE: int = int(os.getenv("MOVIE_IMPORT_BATCH_SIZE", 500))
+    MOVIE_EXPORT_CHUNK_SIZE: int = int(os.getenv("MOVIE_EXPORT_CHUNK_SIZE", 1000))
+
+    PASSWORD_HASH_ROUNDS: int = int(os.getenv("PASSWORD_HASH_ROUNDS", 14))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", 4))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 32))
+
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "True").lower() == "true"
+    RATE_LIMIT_USE_REDIS: bool = (
+        os.getenv("RATE_LIMIT_USE_REDIS", "False").lower() == "true"
+    )
+    RATE_LIMIT_IP_CAPACITY: int = int(os.getenv("RATE_LIMIT_IP_CAPACITY", 20))
+    RATE_LIMIT_IP_REFILL_PER_MINUTE: float = Field(
+        float(os.getenv("RATE_LIMIT_IP_REFILL_PER_MINUTE", 20)),
+        gt=0,
+        validate_default=True,
+    )
+    RATE_LIMIT_EMAIL_CAPACITY: int = int(os.getenv("RATE_LIMIT_EMAIL_CAPACITY", 5))
+    RATE_LIMIT_EMAIL_REFILL_PER_MINUTE: float = Field(
+        float(os.getenv("RATE_LIMIT_EMAIL_REFILL_PER_MINUTE", 5)),
+        gt=0,
+        validate_default=True,
+    )
+    # Comma-separated proxy addresses or networks whose X-Forwarded-For is
+    # trusted when resolving the client IP, e.g. "172.16.0.0/12,127.0.0.1"
+    TRUSTED_PROXIES: str = os.getenv("TRUSTED_PROXIES", "")
+
     STRIPE_SECRET_KEY: str = os.getenv("STRIPE_SECRET_KEY", "")
     STRIPE_WEBHOOK_SECRET: str = os.getenv("STRIPE_WEBHOOK_SECRET", "")
     STRIPE_CURRENCY: str = os.getenv("STRIPE_CURRENCY", "usd")
@@ -2,5 +2,6 @@ from .session_postgresql import (
     get_postgresql_db_contextmanager as get_db_contextmanager,
     get_postgresql_db as get_db,
     DATABASE_URL,
+    SyncPostgresqlSessionLocal as SyncSessionLocal,
 )
 from .validators import accounts as accounts_validators
@@ -0,0 +1,39 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '2a9e5f47c1d8'
+down_revision: Union[str, None] = '7f3c2d18a6b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('movies', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('movies', sa.Column('dislike_count', sa.Integer(), server_default='0', nullable=False))
+    for table in ('likes', 'dislikes'):
+        op.execute(
+            f"""
+            DELETE FROM {table}
+            WHERE id NOT IN (
+                SELECT MIN(id) FROM {table} GROUP BY user_id, movie_id
+            )
+            """
+        )
+    op.create_unique_constraint('unique_user_movie_like', 'likes', ['user_id', 'movie_id'])
+    op.create_unique_constraint('unique_user_movie_dislike', 'dislikes', ['user_id', 'movie_id'])
+    op.execute(
+        """
+        UPDATE movies SET
+            like_count = (SELECT COUNT(*) FROM likes WHERE likes.movie_id = movies.id),
+            dislike_count = (SELECT COUNT(*) FROM dislikes WHERE dislikes.movie_id = movies.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('unique_user_movie_dislike', 'dislikes', type_='unique')
+    op.drop_constraint('unique_user_movie_like', 'likes', type_='unique')
+    op.drop_column('movies', 'dislike_count')
+    op.drop_column('movies', 'like_count')
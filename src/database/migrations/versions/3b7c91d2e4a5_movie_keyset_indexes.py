@@ -0,0 +1,20 @@
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = '3b7c91d2e4a5'
+down_revision: Union[str, None] = 'f28acf922216'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_movies_price_id', 'movies', ['price', 'id'], unique=False)
+    op.create_index('ix_movies_year_id', 'movies', ['year', 'id'], unique=False)
+    op.create_index('ix_movies_votes_id', 'movies', ['votes', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movies_votes_id', table_name='movies')
+    op.drop_index('ix_movies_year_id', table_name='movies')
+    op.drop_index('ix_movies_price_id', table_name='movies')
@@ -0,0 +1,19 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '4c8e1b5d7f20'
+down_revision: Union[str, None] = '9b6d3e2f0a71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('movies', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.create_index('ix_movies_updated_at_id', 'movies', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movies_updated_at_id', table_name='movies')
+    op.drop_column('movies', 'updated_at')
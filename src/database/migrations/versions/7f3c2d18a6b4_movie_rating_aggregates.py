@@ -0,0 +1,49 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '7f3c2d18a6b4'
+down_revision: Union[str, None] = 'e1a4b7c90d23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('movies', sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('movies', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('movies', sa.Column('rating_average', sa.Float(), server_default='0', nullable=False))
+    # Keep only the latest rating per user and movie before enforcing uniqueness.
+    op.execute(
+        """
+        DELETE FROM ratings
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM ratings GROUP BY user_id, movie_id
+        )
+        """
+    )
+    op.create_unique_constraint('unique_user_movie_rating', 'ratings', ['user_id', 'movie_id'])
+    op.execute(
+        """
+        UPDATE movies SET
+            rating_sum = COALESCE((SELECT SUM(rating) FROM ratings WHERE ratings.movie_id = movies.id), 0),
+            rating_count = (SELECT COUNT(*) FROM ratings WHERE ratings.movie_id = movies.id)
+        """
+    )
+    # votes mirrors the rating count once a movie has been rated; unrated
+    # movies keep their imported value.
+    op.execute(
+        """
+        UPDATE movies SET
+            rating_average = CAST(rating_sum AS FLOAT) / rating_count,
+            votes = rating_count
+        WHERE rating_count > 0
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('unique_user_movie_rating', 'ratings', type_='unique')
+    op.drop_column('movies', 'rating_average')
+    op.drop_column('movies', 'rating_count')
+    op.drop_column('movies', 'rating_sum')
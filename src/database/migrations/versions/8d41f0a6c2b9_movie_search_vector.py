@@ -0,0 +1,35 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '8d41f0a6c2b9'
+down_revision: Union[str, None] = '3b7c91d2e4a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('movies', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(
+        """
+        UPDATE movies SET search_vector =
+            setweight(to_tsvector('english', coalesce(movies.name, '')), 'A') ||
+            setweight(to_tsvector('english', concat_ws(' ',
+                (SELECT string_agg(stars.name, ' ') FROM stars
+                 JOIN movie_stars ON movie_stars.star_id = stars.id
+                 WHERE movie_stars.movie_id = movies.id),
+                (SELECT string_agg(directors.name, ' ') FROM directors
+                 JOIN movie_directors ON movie_directors.director_id = directors.id
+                 WHERE movie_directors.movie_id = movies.id)
+            )), 'B') ||
+            setweight(to_tsvector('english', coalesce(movies.description, '')), 'C')
+        """
+    )
+    op.create_index('ix_movies_search_vector', 'movies', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movies_search_vector', table_name='movies', postgresql_using='gin')
+    op.drop_column('movies', 'search_vector')
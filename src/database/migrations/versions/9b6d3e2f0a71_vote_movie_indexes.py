@@ -0,0 +1,22 @@
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = '9b6d3e2f0a71'
+down_revision: Union[str, None] = '2a9e5f47c1d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_likes_movie_id'), 'likes', ['movie_id'], unique=False)
+    op.create_index(op.f('ix_dislikes_movie_id'), 'dislikes', ['movie_id'], unique=False)
+    op.create_index(op.f('ix_favorites_movie_id'), 'favorites', ['movie_id'], unique=False)
+    op.create_index(op.f('ix_ratings_movie_id'), 'ratings', ['movie_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ratings_movie_id'), table_name='ratings')
+    op.drop_index(op.f('ix_favorites_movie_id'), table_name='favorites')
+    op.drop_index(op.f('ix_dislikes_movie_id'), table_name='dislikes')
+    op.drop_index(op.f('ix_likes_movie_id'), table_name='likes')
@@ -0,0 +1,20 @@
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = 'a8d4f6e1b372'
+down_revision: Union[str, None] = '5e7b2c9d4a16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_activation_tokens_expires_at'), 'activation_tokens', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_password_reset_tokens_expires_at'), 'password_reset_tokens', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens')
+    op.drop_index(op.f('ix_password_reset_tokens_expires_at'), table_name='password_reset_tokens')
+    op.drop_index(op.f('ix_activation_tokens_expires_at'), table_name='activation_tokens')
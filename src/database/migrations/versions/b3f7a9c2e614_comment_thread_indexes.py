@@ -0,0 +1,18 @@
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = 'b3f7a9c2e614'
+down_revision: Union[str, None] = '4c8e1b5d7f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_comments_movie_id'), 'comments', ['movie_id'], unique=False)
+    op.create_index(op.f('ix_answer_comments_comment_id'), 'answer_comments', ['comment_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_answer_comments_comment_id'), table_name='answer_comments')
+    op.drop_index(op.f('ix_comments_movie_id'), table_name='comments')
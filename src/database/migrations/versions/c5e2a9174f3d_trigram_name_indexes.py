@@ -0,0 +1,27 @@
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = 'c5e2a9174f3d'
+down_revision: Union[str, None] = '8d41f0a6c2b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_genres_name_trgm', 'genres', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_stars_name_trgm', 'stars', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_directors_name_trgm', 'directors', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index(op.f('ix_movie_genres_genre_id'), 'movie_genres', ['genre_id'], unique=False)
+    op.create_index(op.f('ix_movie_stars_star_id'), 'movie_stars', ['star_id'], unique=False)
+    op.create_index(op.f('ix_movie_directors_director_id'), 'movie_directors', ['director_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_movie_directors_director_id'), table_name='movie_directors')
+    op.drop_index(op.f('ix_movie_stars_star_id'), table_name='movie_stars')
+    op.drop_index(op.f('ix_movie_genres_genre_id'), table_name='movie_genres')
+    op.drop_index('ix_directors_name_trgm', table_name='directors', postgresql_using='gin')
+    op.drop_index('ix_stars_name_trgm', table_name='stars', postgresql_using='gin')
+    op.drop_index('ix_genres_name_trgm', table_name='genres', postgresql_using='gin')
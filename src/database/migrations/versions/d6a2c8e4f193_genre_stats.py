@@ -0,0 +1,28 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd6a2c8e4f193'
+down_revision: Union[str, None] = 'b3f7a9c2e614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('genre_stats',
+    sa.Column('genre_id', sa.Integer(), nullable=False),
+    sa.Column('movie_count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['genre_id'], ['genres.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('genre_id')
+    )
+    op.execute(
+        """
+        INSERT INTO genre_stats (genre_id, movie_count)
+        SELECT genre_id, COUNT(*) FROM movie_genres GROUP BY genre_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('genre_stats')
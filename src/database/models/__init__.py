@@ -14,6 +14,8 @@ from .movies import (
     MoviesDirectors,
     MoviesStars,
     Genre,
+    GenreStats,
+    CatalogVersion,
     Star,
     Director,
     Certification,
@@ -27,3 +29,4 @@ from .movies import (
 )
 from .payments import Payment, PaymentItem, PaymentStatus
 from .orders import OrderItem, Order
+from .notifications import EmailKind, OutboxStatus, EmailOutbox
@@ -1,4 +1,6 @@
 import enum
+import hashlib
+import uuid
 from datetime import datetime, date, timedelta, timezone
 from typing import List, Optional
 from sqlalchemy import (
@@ -135,6 +137,18 @@ class User(Base):
         """
         return verify_password(raw_password, self._hashed_password)
 
+    @property
+    def hashed_password(self) -> str:
+        return self._hashed_password
+
+    def set_hashed_password(self, hashed_password: str) -> None:
+        """
+        Store a hash produced elsewhere, e.g. by the async PasswordHasher.
+
+        The raw password must already have passed strength validation.
+        """
+        self._hashed_password = hashed_password
+
     @validates("email")
     def validate_email(self, key, value):
         return validators.validate_email(value.lower())
@@ -169,12 +183,10 @@ class TokenBase(Base):
     __abstract__ = True
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    token: Mapped[str] = mapped_column(
-        String(64), unique=True, nullable=False, default=generate_secure_token
-    )
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        index=True,
         default=lambda: datetime.now(timezone.utc) + timedelta(days=1),
     )
 
@@ -183,7 +195,17 @@ class TokenBase(Base):
     )
 
 
-class ActivationToken(TokenBase):
+class SecureTokenMixin:
+    """
+    Adds the random, single-use token sent to the user by email.
+    """
+
+    token: Mapped[str] = mapped_column(
+        String(64), unique=True, nullable=False, default=generate_secure_token
+    )
+
+
+class ActivationToken(TokenBase, SecureTokenMixin):
     __tablename__ = "activation_tokens"
 
     user: Mapped[User] = relationship("User", back_populates="activation_token")
@@ -204,7 +226,7 @@ class ActivationToken(TokenBase):
         return cls(user_id=user_id, token=new_token, expires_at=expiration_time)
 
 
-class PasswordResetToken(TokenBase):
+class PasswordResetToken(TokenBase, SecureTokenMixin):
     __tablename__ = "password_reset_tokens"
 
     user: Mapped[User] = relationship("User", back_populates="password_reset_token")
@@ -219,23 +241,48 @@ class RefreshToken(TokenBase):
     __tablename__ = "refresh_tokens"
 
     user: Mapped[User] = relationship("User", back_populates="refresh_tokens")
-    token: Mapped[str] = mapped_column(
-        String(512), unique=True, nullable=False, default=generate_secure_token
+    # Only the SHA-256 digest of the JWT is stored; see hash_token().
+    token_hash: Mapped[str] = mapped_column(
+        String(64), unique=True, index=True, nullable=False
+    )
+    family_id: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
+    @staticmethod
+    def hash_token(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @staticmethod
+    def new_family_id() -> str:
+        return uuid.uuid4().hex
+
     @classmethod
     def create(
-        cls, user_id: int | Mapped[int], days_valid: int, token: str
+        cls,
+        user_id: int | Mapped[int],
+        days_valid: int,
+        token: str,
+        family_id: str,
     ) -> "RefreshToken":
         """
         Factory method to create a new RefreshToken instance.
 
         This method simplifies the creation of a new refresh token by calculating
         the expiration date based on the provided number of valid days and setting
-        the required attributes.
+        the required attributes. The token itself is stored as its SHA-256 digest.
         """
         expires_at = datetime.now(timezone.utc) + timedelta(days=days_valid)
-        return cls(user_id=user_id, expires_at=expires_at, token=token)
+        return cls(
+            user_id=user_id,
+            expires_at=expires_at,
+            token_hash=cls.hash_token(token),
+            family_id=family_id,
+        )
 
     def __repr__(self):
-        return f"<RefreshTokenModel(id={self.id}, token={self.token}, expires_at={self.expires_at})>"
+        return (
+            f"<RefreshTokenModel(id={self.id}, family_id={self.family_id}, "
+            f"expires_at={self.expires_at})>"
+        )
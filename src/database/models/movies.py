@@ -1,5 +1,8 @@
 import uuid
+from datetime import datetime
 from sqlalchemy import (
+    DateTime,
+    func,
     String,
     Float,
     Text,
@@ -9,7 +12,9 @@ from sqlalchemy import (
     Table,
     Column,
     Integer,
+    Index,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 from src.database.base import Base
 from .accounts import User
@@ -29,6 +34,7 @@ MoviesGenres = Table(
         ForeignKey("genres.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False,
+        index=True,
     ),
 )
 
@@ -46,6 +52,7 @@ MoviesDirectors = Table(
         ForeignKey("directors.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False,
+        index=True,
     ),
 )
 
@@ -63,6 +70,7 @@ MoviesStars = Table(
         ForeignKey("stars.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False,
+        index=True,
     ),
 )
 
@@ -77,10 +85,45 @@ class Genre(Base):
         "Movie", secondary=MoviesGenres, back_populates="genres"
     )
 
+    __table_args__ = (
+        Index(
+            "ix_genres_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
     def __repr__(self):
         return f"<Genre(name='{self.name}')>"
 
 
+class GenreStats(Base):
+    __tablename__ = "genre_stats"
+
+    genre_id: Mapped[int] = mapped_column(
+        ForeignKey("genres.id", ondelete="CASCADE"), primary_key=True
+    )
+    movie_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    genre: Mapped["Genre"] = relationship("Genre")
+
+
+class CatalogVersion(Base):
+    """
+    Single-row counter bumped in every transaction that changes the catalog.
+    """
+
+    __tablename__ = "catalog_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+
 class Star(Base):
     __tablename__ = "stars"
 
@@ -91,6 +134,15 @@ class Star(Base):
         "Movie", secondary=MoviesStars, back_populates="stars"
     )
 
+    __table_args__ = (
+        Index(
+            "ix_stars_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
     def __repr__(self):
         return f"<Star(name='{self.name}')>"
 
@@ -105,6 +157,15 @@ class Director(Base):
         "Movie", secondary=MoviesDirectors, back_populates="directors"
     )
 
+    __table_args__ = (
+        Index(
+            "ix_directors_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
     def __repr__(self):
         return f"<Director(name='{self.name}')>"
 
@@ -135,10 +196,38 @@ class Movie(Base):
     time: Mapped[int] = mapped_column(Integer, nullable=False)
     imdb: Mapped[float] = mapped_column(Float, nullable=False)
     votes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    like_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    dislike_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_sum: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_average: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0, server_default="0"
+    )
     meta_score: Mapped[float] = mapped_column(Float, nullable=True)
     gross: Mapped[float] = mapped_column(Float, nullable=True)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     price: Mapped[float] = mapped_column(DECIMAL(10, 2), nullable=False)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+    # Set explicitly on catalog edits only, so vote counter updates do not
+    # show up as changes in incremental exports.
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"), nullable=True, deferred=True
+    )
     certification_id: Mapped[int] = mapped_column(
         ForeignKey("certifications.id"), nullable=False
     )
@@ -166,7 +255,14 @@ class Movie(Base):
         "OrderItem", back_populates="movie"
     )
 
-    __table_args__ = (UniqueConstraint("name", "year", "time", name="unique_movie"),)
+    __table_args__ = (
+        UniqueConstraint("name", "year", "time", name="unique_movie"),
+        Index("ix_movies_price_id", "price", "id"),
+        Index("ix_movies_year_id", "year", "id"),
+        Index("ix_movies_votes_id", "votes", "id"),
+        Index("ix_movies_updated_at_id", "updated_at", "id"),
+        Index("ix_movies_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     @classmethod
     def default_order_by(cls):
@@ -181,7 +277,13 @@ class Like(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id"), nullable=False, index=True
+    )
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "movie_id", name="unique_user_movie_like"),
+    )
 
 
 class Dislike(Base):
@@ -189,7 +291,13 @@ class Dislike(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id"), nullable=False, index=True
+    )
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "movie_id", name="unique_user_movie_dislike"),
+    )
 
 
 class Comment(Base):
@@ -197,7 +305,9 @@ class Comment(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id"), nullable=False, index=True
+    )
     comment: Mapped[str] = mapped_column(Text, nullable=False)
 
     user: Mapped[User] = relationship("User", back_populates="comments")
@@ -212,7 +322,9 @@ class AnswerComment(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    comment_id: Mapped[int] = mapped_column(ForeignKey("comments.id"), nullable=False)
+    comment_id: Mapped[int] = mapped_column(
+        ForeignKey("comments.id"), nullable=False, index=True
+    )
     text: Mapped[str] = mapped_column(Text, nullable=False)
 
     comment: Mapped["Comment"] = relationship("Comment", back_populates="answers")
@@ -224,7 +336,9 @@ class Favorite(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id"), nullable=False, index=True
+    )
 
     user: Mapped[User] = relationship("User", back_populates="favorites")
     movie: Mapped[Movie] = relationship("Movie", back_populates="favorites")
@@ -237,8 +351,14 @@ class Rating(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id"), nullable=False, index=True
+    )
     rating: Mapped[int] = mapped_column(Integer, nullable=False)
 
     user: Mapped[User] = relationship("User", back_populates="ratings")
     movie: Mapped[Movie] = relationship("Movie", back_populates="ratings")
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "movie_id", name="unique_user_movie_rating"),
+    )
@@ -0,0 +1,65 @@
+from datetime import datetime
+import enum
+from typing import Optional
+from sqlalchemy import Integer, DateTime, Enum, String, Text, JSON, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+from src.database.base import Base
+
+
+class EmailKind(enum.Enum):
+    """
+    Kinds of outbound email; each value names the EmailSenderInterface method
+    that renders and sends it.
+    """
+
+    activation = "send_activation_email"
+    activation_complete = "send_activation_complete_email"
+    password_reset = "send_password_reset_email"
+    password_reset_complete = "send_password_reset_complete_email"
+    password_change = "send_password_change"
+    remove_movie = "send_remove_movie"
+    comment_answer = "send_comment_answer"
+    payment = "send_payment_email"
+    refund = "send_refund_email"
+    cancellation = "send_cancellation_email"
+
+
+class OutboxStatus(enum.Enum):
+    pending = "pending"
+    sending = "sending"
+    sent = "sent"
+    dead = "dead"
+
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[EmailKind] = mapped_column(Enum(EmailKind), nullable=False)
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    status: Mapped[OutboxStatus] = mapped_column(
+        Enum(OutboxStatus), nullable=False, default=OutboxStatus.pending
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self):
+        return (
+            f"<EmailOutbox(id={self.id}, kind={self.kind}, "
+            f"recipient={self.recipient}, status={self.status})>"
+        )
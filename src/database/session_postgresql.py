@@ -24,6 +24,12 @@ AsyncPostgresqlSessionLocal = sessionmaker(  # type: ignore
 
 sync_database_url = DATABASE_URL.replace("postgresql+asyncpg", "postgresql")
 sync_postgresql_engine = create_engine(sync_database_url, echo=False)
+SyncPostgresqlSessionLocal = sessionmaker(
+    bind=sync_postgresql_engine,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
 async def get_postgresql_db() -> AsyncGenerator[AsyncSession, None]:
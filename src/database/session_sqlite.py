@@ -3,17 +3,16 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     AsyncSession,
 )
-from sqlalchemy.orm import declarative_base
 from typing import AsyncGenerator
 from contextlib import asynccontextmanager
-from config.dependencies import get_settings
+from src.config.dependencies import get_settings
+from src.database.base import Base
 
 settings = get_settings()
 DATABASE_URL = f"sqlite+aiosqlite:///{settings.PATH_TO_DB}"
 engine = create_async_engine(DATABASE_URL, echo=True)
 
 async_session = async_sessionmaker(bind=engine, expire_on_commit=False)
-Base = declarative_base()
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -2,6 +2,7 @@ from src.exceptions.security import (
     BaseSecurityError,
     InvalidTokenError,
     TokenExpiredError,
+    PasswordHasherBusyError,
 )
 from src.exceptions.email import BaseEmailError
 from src.exceptions.storage import (
@@ -12,3 +13,4 @@ from src.exceptions.storage import (
     S3FileNotFoundError,
     S3PermissionError,
 )
+from src.exceptions.pagination import BasePaginationError, InvalidCursorError
@@ -0,0 +1,10 @@
+class BasePaginationError(Exception):
+    def __init__(self, message=None):
+        if message is None:
+            message = "A pagination error occurred."
+        super().__init__(message)
+
+
+class InvalidCursorError(BasePaginationError):
+    def __init__(self, message="Invalid pagination cursor."):
+        super().__init__(message)
@@ -13,3 +13,8 @@ class TokenExpiredError(BaseSecurityError):
 class InvalidTokenError(BaseSecurityError):
     def __init__(self, message="Invalid token."):
         super().__init__(message)
+
+
+class PasswordHasherBusyError(BaseSecurityError):
+    def __init__(self, message="Password hashing capacity exceeded."):
+        super().__init__(message)
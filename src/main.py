@@ -1,6 +1,9 @@
 import os
+from contextlib import asynccontextmanager
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from src.config import get_settings, init_dependencies, close_dependencies
 from src.routes import (
     accounts_router,
     profiles_router,
@@ -9,15 +12,44 @@ from src.routes import (
     orders_router,
     payment_router,
 )
+from src.exceptions import PasswordHasherBusyError
+from src.votes import get_vote_flusher
 
 if "ENVIRONMENT" not in os.environ:
     os.environ["ENVIRONMENT"] = "local"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    init_dependencies(settings)
+    vote_flusher = get_vote_flusher(settings)
+    if vote_flusher is not None:
+        vote_flusher.start()
+    yield
+    if vote_flusher is not None:
+        await vote_flusher.stop()
+    await close_dependencies()
+
+
 app = FastAPI(
     title="Cinema",
     description="Online Cinema — FastAPI project for managing movies",
+    lifespan=lifespan,
 )
 
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(
+    request: Request, exc: PasswordHasherBusyError
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, please retry shortly."},
+        headers={"Retry-After": "1"},
+    )
+
+
 app.include_router(accounts_router, prefix="/accounts", tags=["accounts"])
 app.include_router(profiles_router, prefix="/profiles", tags=["profiles"])
 app.include_router(movies_router, prefix="/movies", tags=["movies"])
@@ -1,2 +1,3 @@
 from src.notifications.interfaces import EmailSenderInterface
 from src.notifications.emails import EmailSender
+from src.notifications.templates import TemplateRegistry, load_template_registry
@@ -1,11 +1,13 @@
 import logging
 from decimal import Decimal
+from typing import Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import aiosmtplib
-from jinja2 import Environment, FileSystemLoader
 from src.exceptions import BaseEmailError
 from src.notifications.interfaces import EmailSenderInterface
+from src.notifications.smtp_pool import SMTPConnectionPool
+from src.notifications.templates import load_template_registry
 
 
 class EmailSender(EmailSenderInterface):
@@ -25,6 +27,11 @@ class EmailSender(EmailSenderInterface):
         send_payment_email_template_name: str,
         send_refund_email_template_name: str,
         send_cancellation_email_template_name: str,
+        remove_movie_email_template_name: str = "remove_movie.html",
+        comment_answer_email_template_name: str = "comment_answer.html",
+        compiled_template_dir: Optional[str] = None,
+        smtp_pool_size: int = 4,
+        smtp_idle_timeout: float = 60.0,
     ):
         self._hostname = hostname
         self._port = port
@@ -43,7 +50,18 @@ class EmailSender(EmailSenderInterface):
         self._send_payment_email_template_name = send_payment_email_template_name
         self._send_refund_email_template_name = send_refund_email_template_name
         self._send_cancellation_email_template_name = send_cancellation_email_template_name
-        self._env = Environment(loader=FileSystemLoader(template_dir))
+        self._remove_movie_email_template_name = remove_movie_email_template_name
+        self._comment_answer_email_template_name = comment_answer_email_template_name
+        self._templates = load_template_registry(template_dir, compiled_template_dir)
+        self._smtp_pool = SMTPConnectionPool(
+            hostname=hostname,
+            port=port,
+            username=email,
+            password=password,
+            use_tls=use_tls,
+            size=smtp_pool_size,
+            idle_timeout=smtp_idle_timeout,
+        )
 
     async def _send_email(
         self, recipient: str, subject: str, html_content: str
@@ -55,81 +73,100 @@ class EmailSender(EmailSenderInterface):
         message.attach(MIMEText(html_content, "html"))
 
         try:
-            smtp = aiosmtplib.SMTP(
-                hostname=self._hostname, port=self._port, start_tls=self._use_tls
+            await self._smtp_pool.send_message(
+                self._email, [recipient], message.as_string()
             )
-            await smtp.connect()
-            if self._use_tls:
-                await smtp.starttls()
-            await smtp.login(self._email, self._password)
-            await smtp.sendmail(self._email, [recipient], message.as_string())
-            await smtp.quit()
-        except aiosmtplib.SMTPException as error:
+        except (aiosmtplib.SMTPException, OSError) as error:
             logging.error(f"Failed to send email to {recipient}: {error}")
             raise BaseEmailError(f"Failed to send email to {recipient}: {error}")
 
     async def send_activation_email(self, email: str, activation_link: str) -> None:
-        template = self._env.get_template(self._activation_email_template_name)
-        html_content = template.render(email=email, activation_link=activation_link)
+        html_content = self._templates.render(
+            self._activation_email_template_name,
+            email=email,
+            activation_link=activation_link,
+        )
         subject = "Account Activation"
         await self._send_email(email, subject, html_content)
 
     async def send_activation_complete_email(self, email: str, login_link: str) -> None:
-        template = self._env.get_template(self._activation_complete_email_template_name)
-        html_content = template.render(email=email, login_link=login_link)
+        html_content = self._templates.render(
+            self._activation_complete_email_template_name,
+            email=email,
+            login_link=login_link,
+        )
         subject = "Account Activated Successfully"
         await self._send_email(email, subject, html_content)
 
     async def send_password_reset_email(self, email: str, reset_link: str) -> None:
-        template = self._env.get_template(self._password_email_template_name)
-        html_content = template.render(email=email, reset_link=reset_link)
+        html_content = self._templates.render(
+            self._password_email_template_name,
+            email=email,
+            reset_link=reset_link,
+        )
         subject = "Password Reset Request"
         await self._send_email(email, subject, html_content)
 
     async def send_password_reset_complete_email(
         self, email: str, login_link: str
     ) -> None:
-        template = self._env.get_template(self._password_complete_email_template_name)
-        html_content = template.render(email=email, login_link=login_link)
+        html_content = self._templates.render(
+            self._password_complete_email_template_name,
+            email=email,
+            login_link=login_link,
+        )
         subject = "Your Password Has Been Successfully Reset"
         await self._send_email(email, subject, html_content)
 
     async def send_password_change(self, email: str) -> None:
-        template = self._env.get_template(self._password_change_email_template_name)
-        html_content = template.render(email=email)
+        html_content = self._templates.render(
+            self._password_change_email_template_name,
+            email=email,
+        )
         subject = "Password Successfully Changed"
         await self._send_email(email, subject, html_content)
 
     async def send_remove_movie(
         self, email: str, movie_name: str, cart_id: int
     ) -> None:
-        html_content = f"""
-            <p>Movie "{movie_name}" removed from cart with ID: {cart_id}</p>
-        """
+        html_content = self._templates.render(
+            self._remove_movie_email_template_name,
+            movie_name=movie_name,
+            cart_id=cart_id,
+        )
         subject = f"{movie_name} removed from cart with id: {cart_id}"
         await self._send_email(email, subject, html_content)
 
     async def send_comment_answer(self, email: str, answer_text: str) -> None:
-        html_content = f"""
-            <p>You have got answer on your comment: {answer_text}</p>
-        """
+        html_content = self._templates.render(
+            self._comment_answer_email_template_name, answer_text=answer_text
+        )
         subject = "New Reply to Your Comment."
         await self._send_email(email, subject, html_content)
 
     async def send_payment_email(self, email: str, amount: Decimal) -> None:
-        template = self._env.get_template(self._send_payment_email_template_name)
-        html_content = template.render(amount=amount)
+        html_content = self._templates.render(
+            self._send_payment_email_template_name,
+            amount=amount,
+        )
         subject = "Payment Confirmation"
         await self._send_email(email, subject, html_content)
 
     async def send_refund_email(self, email: str, amount: Decimal) -> None:
-        template = self._env.get_template(self._send_refund_email_template_name)
-        html_content = template.render(amount=amount)
+        html_content = self._templates.render(
+            self._send_refund_email_template_name,
+            amount=amount,
+        )
         subject = "Refund Processed"
         await self._send_email(email, subject, html_content)
 
     async def send_cancellation_email(self, email: str, amount: Decimal) -> None:
-        template = self._env.get_template(self._send_cancellation_email_template_name)
-        html_content = template.render(amount=amount)
+        html_content = self._templates.render(
+            self._send_cancellation_email_template_name,
+            amount=amount,
+        )
         subject = "Payment Canceled"
         await self._send_email(email, subject, html_content)
+
+    async def close(self) -> None:
+        await self._smtp_pool.close()
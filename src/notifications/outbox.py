@@ -0,0 +1,175 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, NamedTuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.database.models import EmailKind, EmailOutbox, OutboxStatus
+from src.notifications.emails import EmailSender
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_email(
+    db: AsyncSession, kind: EmailKind, recipient: str, **payload
+) -> EmailOutbox:
+    """
+    Add an outbound email to the caller's transaction.
+
+    The message is only sent once the transaction commits, and is lost
+    if it rolls back. Payload values must be JSON-serialisable; they are
+    passed as keyword arguments to the EmailSender method named by `kind`.
+    """
+    message = EmailOutbox(kind=kind, recipient=recipient, payload=payload)
+    db.add(message)
+    return message
+
+
+class _ClaimedEmail(NamedTuple):
+    id: int
+    kind: EmailKind
+    recipient: str
+    payload: dict
+
+
+class OutboxDispatcher:
+    """
+    Drains the email outbox in batches from a synchronous worker process.
+
+    The dispatcher owns one event loop and one EmailSender for its whole
+    life, so pooled SMTP sessions stay open between batches. Create one per
+    worker process and call `close()` when the process exits.
+
+    Rows are claimed with FOR UPDATE SKIP LOCKED and leased for
+    `lease_seconds`. A row left in "sending" after a worker crash becomes
+    claimable again once the lease runs out. Failed sends are retried with
+    exponential backoff. After `max_attempts` failures the row is moved to
+    the "dead" status and left for inspection.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        sender: EmailSender,
+        batch_size: int,
+        max_attempts: int,
+        backoff_seconds: float,
+        backoff_max_seconds: float,
+        domain_concurrency: int,
+        lease_seconds: float,
+    ):
+        self._session_factory = session_factory
+        self._sender = sender
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._backoff_seconds = backoff_seconds
+        self._backoff_max_seconds = backoff_max_seconds
+        self._domain_concurrency = domain_concurrency
+        self._lease_seconds = lease_seconds
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def _claim(self) -> list[_ClaimedEmail]:
+        now = datetime.now(timezone.utc)
+        with self._session_factory() as db:
+            rows = db.scalars(
+                select(EmailOutbox)
+                .where(
+                    EmailOutbox.status.in_(
+                        [OutboxStatus.pending, OutboxStatus.sending]
+                    ),
+                    EmailOutbox.next_attempt_at <= now,
+                )
+                .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            claimed = []
+            for row in rows:
+                row.status = OutboxStatus.sending
+                row.next_attempt_at = now + timedelta(seconds=self._lease_seconds)
+                claimed.append(
+                    _ClaimedEmail(row.id, row.kind, row.recipient, dict(row.payload))
+                )
+            db.commit()
+        return claimed
+
+    async def _send_all(self, emails: list[_ClaimedEmail]) -> dict[int, str | None]:
+        domains: dict[str, asyncio.Semaphore] = {}
+
+        async def send(email: _ClaimedEmail) -> tuple[int, str | None]:
+            domain = email.recipient.rpartition("@")[2].lower()
+            semaphore = domains.setdefault(
+                domain, asyncio.Semaphore(self._domain_concurrency)
+            )
+            async with semaphore:
+                try:
+                    method = getattr(self._sender, email.kind.value)
+                    await method(email.recipient, **email.payload)
+                except Exception as error:
+                    return email.id, str(error) or type(error).__name__
+            return email.id, None
+
+        results = await asyncio.gather(*(send(email) for email in emails))
+        return dict(results)
+
+    def _record(self, results: dict[int, str | None]) -> None:
+        now = datetime.now(timezone.utc)
+        with self._session_factory() as db:
+            rows = db.scalars(
+                select(EmailOutbox).where(EmailOutbox.id.in_(list(results)))
+            ).all()
+            for row in rows:
+                error = results[row.id]
+                if error is None:
+                    row.status = OutboxStatus.sent
+                    row.sent_at = now
+                    row.last_error = None
+                    # Finished rows keep their completion time here, so the
+                    # retention purge can use the (status, next_attempt_at) index.
+                    row.next_attempt_at = now
+                    continue
+                row.attempts += 1
+                row.last_error = error
+                if row.attempts >= self._max_attempts:
+                    row.status = OutboxStatus.dead
+                    row.next_attempt_at = now
+                    logger.error(
+                        "Email %s to %s dead-lettered after %s attempts: %s",
+                        row.id, row.recipient, row.attempts, error,
+                    )
+                else:
+                    delay = min(
+                        self._backoff_seconds * 2 ** (row.attempts - 1),
+                        self._backoff_max_seconds,
+                    )
+                    row.status = OutboxStatus.pending
+                    row.next_attempt_at = now + timedelta(seconds=delay)
+            db.commit()
+
+    def run_batch(self) -> int:
+        """
+        Claim, send and record one batch; returns the number of emails claimed.
+        """
+        emails = self._claim()
+        if emails:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+            self._record(self._loop.run_until_complete(self._send_all(emails)))
+        return len(emails)
+
+    def close(self) -> None:
+        """
+        Close the pooled SMTP sessions and the dispatcher's event loop.
+        """
+        if self._loop is None:
+            return
+        try:
+            self._loop.run_until_complete(self._sender.close())
+        finally:
+            self._loop.close()
+            self._loop = None
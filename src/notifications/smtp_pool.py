@@ -0,0 +1,114 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+import aiosmtplib
+
+
+class SMTPConnectionPool:
+    """
+    Keeps up to `size` authenticated SMTP sessions open for reuse.
+
+    Idle sessions older than `idle_timeout` seconds are closed instead of
+    reused, sessions idle for longer than `health_check_after` seconds are
+    probed with NOOP first, and a session that drops mid-send is replaced
+    and the message retried once on a fresh connection. A session is only
+    discarded after a connection-level error; when the server refuses a
+    command (e.g. a recipient), aiosmtplib resets the envelope and the
+    session goes back to the pool.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str,
+        password: str,
+        use_tls: bool,
+        size: int,
+        idle_timeout: float,
+        health_check_after: float = 5.0,
+        timeout: float = 30.0,
+    ):
+        self._hostname = hostname
+        self._port = port
+        self._username = username
+        self._password = password
+        self._use_tls = use_tls
+        self._idle_timeout = idle_timeout
+        self._health_check_after = health_check_after
+        self._timeout = timeout
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self._hostname,
+            port=self._port,
+            start_tls=self._use_tls,
+            timeout=self._timeout,
+        )
+        await smtp.connect()
+        if self._username:
+            await smtp.login(self._username, self._password)
+        return smtp
+
+    @staticmethod
+    async def _discard(smtp: aiosmtplib.SMTP) -> None:
+        try:
+            await smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            smtp.close()
+
+    async def _checkout(self, fresh: bool) -> aiosmtplib.SMTP:
+        while self._idle and not fresh:
+            smtp, released_at = self._idle.pop()
+            idle_for = time.monotonic() - released_at
+            if not smtp.is_connected or idle_for > self._idle_timeout:
+                await self._discard(smtp)
+                continue
+            if idle_for > self._health_check_after:
+                try:
+                    await smtp.noop()
+                except (aiosmtplib.SMTPException, OSError):
+                    smtp.close()
+                    continue
+            return smtp
+        return await self._connect()
+
+    @asynccontextmanager
+    async def connection(self, fresh: bool = False) -> AsyncIterator[aiosmtplib.SMTP]:
+        async with self._slots:
+            smtp = await self._checkout(fresh)
+            reusable = False
+            try:
+                yield smtp
+                reusable = True
+            except OSError:
+                # Timeouts and disconnects leave the session in an unknown state.
+                raise
+            except Exception:
+                reusable = True
+                raise
+            finally:
+                if reusable and smtp.is_connected:
+                    self._idle.append((smtp, time.monotonic()))
+                else:
+                    smtp.close()
+
+    async def send_message(
+        self, sender: str, recipients: list[str], message: str
+    ) -> None:
+        try:
+            async with self.connection() as smtp:
+                await smtp.sendmail(sender, recipients, message)
+        except (aiosmtplib.SMTPServerDisconnected, ConnectionError):
+            # A pooled session may have been dropped by the server since its
+            # last use; retry once on a freshly opened connection.
+            async with self.connection(fresh=True) as smtp:
+                await smtp.sendmail(sender, recipients, message)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            await self._discard(smtp)
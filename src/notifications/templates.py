@@ -0,0 +1,66 @@
+from functools import lru_cache
+from typing import Optional
+from jinja2 import (
+    Environment,
+    FileSystemLoader,
+    ModuleLoader,
+    Template,
+    select_autoescape,
+)
+
+_AUTOESCAPE = select_autoescape(["html", "xml"])
+_EXTENSIONS = ["html", "txt"]
+
+
+def compile_templates(template_dir: str, compiled_dir: str) -> None:
+    """
+    Compile every email template in `template_dir` to Python modules.
+
+    Run once per deployment, before any worker starts, through
+    `python -m src.tools.compile_email_templates`.
+    """
+    env = Environment(loader=FileSystemLoader(template_dir), autoescape=_AUTOESCAPE)
+    env.compile_templates(compiled_dir, extensions=_EXTENSIONS, zip=None)
+
+
+class TemplateRegistry:
+    """
+    Loads and compiles every email template once, with HTML autoescaping.
+
+    When `compiled_dir` is given the templates are loaded from modules
+    produced by `compile_templates`, so the process skips Jinja's parser
+    entirely. The directory is only read here, never written.
+    """
+
+    def __init__(self, template_dir: str, compiled_dir: Optional[str] = None):
+        env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=_AUTOESCAPE,
+            auto_reload=False,
+        )
+        names = env.list_templates(extensions=_EXTENSIONS)
+        if compiled_dir:
+            env = Environment(
+                loader=ModuleLoader(compiled_dir),
+                autoescape=_AUTOESCAPE,
+                auto_reload=False,
+            )
+        self._templates: dict[str, Template] = {
+            name: env.get_template(name) for name in names
+        }
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._templates
+
+    def render(self, name: str, **context) -> str:
+        return self._templates[name].render(**context)
+
+
+@lru_cache
+def load_template_registry(
+    template_dir: str, compiled_dir: Optional[str] = None
+) -> TemplateRegistry:
+    """
+    Return the process-wide registry for a template directory.
+    """
+    return TemplateRegistry(template_dir, compiled_dir)
@@ -0,0 +1,7 @@
+from src.pagination.cursor import (
+    encode_cursor,
+    decode_cursor,
+    decode_id_cursor,
+    keyset_predicate,
+)
+from src.pagination.counts import TotalCounter, count_cache_key
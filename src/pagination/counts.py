@@ -0,0 +1,95 @@
+import json
+from typing import Any, Hashable
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.cache.memory import InMemoryLRUCache
+
+
+def count_cache_key(scope: str, catalog_version: int, **filters: Any) -> tuple:
+    """
+    Build a cache key from the catalog version and the filters that affect
+    a total count.
+
+    Every catalog write bumps the version, so cached totals never outlive
+    the data they counted. Unset filters are dropped and text filters are
+    lower-cased, because the movie filters are case-insensitive.
+    """
+    normalized = tuple(
+        sorted(
+            (name, value.lower() if isinstance(value, str) else value)
+            for name, value in filters.items()
+            if value is not None
+        )
+    )
+    return scope, catalog_version, normalized
+
+
+class TotalCounter:
+    """
+    Count strategy for paginated list queries.
+
+    Small results are counted exactly with a bounded `LIMIT threshold + 1`
+    subquery. Larger ones fall back to the planner row estimate from
+    `EXPLAIN`, so a broad filter never costs a full scan. Results are kept
+    in a TTL cache keyed by the catalog version and the normalized filter set.
+    """
+
+    def __init__(
+        self, exact_threshold: int, ttl_seconds: float, max_entries: int
+    ):
+        self._exact_threshold = exact_threshold
+        self._cache = InMemoryLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    async def count(
+        self, db: AsyncSession, stmt: Select, cache_key: Hashable | None
+    ) -> tuple[int, bool]:
+        """
+        Return `(total, is_exact)` for the rows matched by `stmt`.
+
+        Pass `cache_key=None` for per-user lists that must not be served stale.
+        """
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        stmt = stmt.order_by(None)
+        bounded_stmt = select(func.count()).select_from(
+            stmt.limit(self._exact_threshold + 1).subquery()
+        )
+        total = (await db.execute(bounded_stmt)).scalar_one()
+        is_exact = True
+
+        if total > self._exact_threshold:
+            estimate = await self._estimate(db, stmt)
+            if estimate is None:
+                exact_stmt = select(func.count()).select_from(stmt.subquery())
+                total = (await db.execute(exact_stmt)).scalar_one()
+            else:
+                total = max(estimate, total)
+                is_exact = False
+
+        if cache_key is not None:
+            self._cache.set(cache_key, (total, is_exact))
+        return total, is_exact
+
+    @staticmethod
+    async def _estimate(db: AsyncSession, stmt: Select) -> int | None:
+        dialect = db.get_bind().dialect
+        if dialect.name != "postgresql":
+            return None
+
+        # Named placeholders let text() bind the filter values instead of
+        # inlining them into the EXPLAIN statement.
+        compiled = stmt.compile(
+            dialect=postgresql.dialect(paramstyle="named"),
+            compile_kwargs={"render_postcompile": True},
+        )
+        result = await db.execute(
+            text(f"EXPLAIN (FORMAT JSON) {compiled.string}"), compiled.params
+        )
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,75 @@
+import base64
+import json
+from decimal import Decimal
+from typing import Any
+from sqlalchemy import tuple_
+from sqlalchemy.sql import ColumnElement
+from src.exceptions import InvalidCursorError
+
+
+def encode_cursor(sort_key: str, value: Any, last_id: int) -> str:
+    """
+    Build an opaque cursor from the sort key of the last row on a page.
+
+    The cursor stores the name of the sort key, its value and the row id,
+    which is used as a tiebreaker for non-unique sort keys.
+    """
+    payload = {"s": sort_key, "id": last_id}
+    if sort_key != "id":
+        if isinstance(value, Decimal):
+            payload["v"] = str(value)
+            payload["d"] = True
+        else:
+            payload["v"] = value
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, Any, int]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Returns a `(sort_key, value, last_id)` tuple and raises
+    `InvalidCursorError` for anything that was not issued by the API.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_key = payload["s"]
+        last_id = payload["id"]
+        value = payload.get("v")
+        if payload.get("d"):
+            value = Decimal(value)
+    except (ValueError, KeyError, TypeError, ArithmeticError):
+        raise InvalidCursorError
+
+    if not isinstance(sort_key, str) or not isinstance(last_id, int):
+        raise InvalidCursorError
+    return sort_key, value, last_id
+
+
+def decode_id_cursor(cursor: str) -> int:
+    """
+    Decode a cursor for a listing ordered by id alone and return the last id.
+    """
+    sort_key, _, last_id = decode_cursor(cursor)
+    if sort_key != "id":
+        raise InvalidCursorError
+    return last_id
+
+
+def keyset_predicate(
+    sort_column: ColumnElement | None,
+    id_column: ColumnElement,
+    value: Any,
+    last_id: int,
+) -> ColumnElement:
+    """
+    Predicate selecting rows that come after the cursor in descending order.
+
+    A row value comparison lets the planner walk a composite
+    `(sort_column, id)` index instead of skipping rows with OFFSET.
+    """
+    if sort_column is None:
+        return id_column < last_id
+    return tuple_(sort_column, id_column) < tuple_(value, last_id)
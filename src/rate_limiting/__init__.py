@@ -0,0 +1,4 @@
+from src.rate_limiting.interfaces import RateLimiterInterface, TokenBucket
+from src.rate_limiting.memory import InMemoryRateLimiter
+from src.rate_limiting.redis import RedisRateLimiter
+from src.rate_limiting.dependencies import get_rate_limiter, limit_auth_requests
@@ -0,0 +1,124 @@
+import ipaddress
+import json
+from functools import lru_cache
+from fastapi import Depends, HTTPException, Request
+from starlette import status
+from src.config import get_settings, shared_instance, BaseAppSettings
+from src.rate_limiting.interfaces import RateLimiterInterface, TokenBucket
+from src.rate_limiting.memory import InMemoryRateLimiter
+from src.rate_limiting.redis import RedisRateLimiter
+
+
+def get_rate_limiter(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> RateLimiterInterface:
+    if settings.RATE_LIMIT_USE_REDIS:
+        return shared_instance(
+            "rate_limiter",
+            settings,
+            lambda: RedisRateLimiter(url=settings.CELERY_BROKER_URL),
+        )
+    return shared_instance("rate_limiter", settings, InMemoryRateLimiter)
+
+
+@lru_cache
+def _trusted_networks(
+    trusted_proxies: str,
+) -> tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]:
+    return tuple(
+        ipaddress.ip_network(entry.strip(), strict=False)
+        for entry in trusted_proxies.split(",")
+        if entry.strip()
+    )
+
+
+def _is_trusted(address: str, networks) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in networks)
+
+
+def client_ip(request: Request, trusted_proxies: str) -> str | None:
+    """
+    Return the address of the client that sent the request.
+
+    When the direct peer is a trusted proxy, X-Forwarded-For is walked from
+    the right and the first address not belonging to a trusted proxy wins,
+    so a client cannot pick its own bucket by forging the header.
+    """
+    if request.client is None:
+        return None
+    host = request.client.host
+    networks = _trusted_networks(trusted_proxies)
+    if not networks or not _is_trusted(host, networks):
+        return host
+    forwarded = [
+        address.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for address in header.split(",")
+        if address.strip()
+    ]
+    for address in reversed(forwarded):
+        if not _is_trusted(address, networks):
+            return address
+    return forwarded[0] if forwarded else host
+
+
+async def _request_email(request: Request) -> str | None:
+    try:
+        body = await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    email = body.get("email") if isinstance(body, dict) else None
+    return email.strip().lower() if isinstance(email, str) and email else None
+
+
+async def limit_auth_requests(
+    request: Request,
+    settings: BaseAppSettings = Depends(get_settings),
+    rate_limiter: RateLimiterInterface = Depends(get_rate_limiter),
+) -> None:
+    """
+    Throttle credential endpoints per client IP and per submitted email.
+
+    Declared as a route dependency so it runs before the handler touches the
+    database or hashes a password. Raises 429 with Retry-After when either
+    bucket is empty.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+
+    checks = []
+    ip = client_ip(request, settings.TRUSTED_PROXIES)
+    if ip is not None:
+        checks.append(
+            (
+                f"auth:ip:{ip}",
+                TokenBucket(
+                    settings.RATE_LIMIT_IP_CAPACITY,
+                    settings.RATE_LIMIT_IP_REFILL_PER_MINUTE / 60,
+                ),
+            )
+        )
+    email = await _request_email(request)
+    if email is not None:
+        checks.append(
+            (
+                f"auth:email:{email}",
+                TokenBucket(
+                    settings.RATE_LIMIT_EMAIL_CAPACITY,
+                    settings.RATE_LIMIT_EMAIL_REFILL_PER_MINUTE / 60,
+                ),
+            )
+        )
+
+    for key, bucket in checks:
+        wait = await rate_limiter.consume(key, bucket)
+        if wait > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many attempts. Please try again later.",
+                headers={"Retry-After": str(max(1, round(wait)))},
+            )
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+
+class TokenBucket(NamedTuple):
+    capacity: int
+    refill_per_second: float
+
+
+class RateLimiterInterface(ABC):
+
+    @abstractmethod
+    async def consume(self, key: str, bucket: TokenBucket) -> float:
+        """
+        Take one token from the bucket stored under `key`.
+
+        :param key: The identity being limited, e.g. "auth:ip:10.0.0.1".
+        :param bucket: The capacity and refill rate of the bucket.
+        :return: 0.0 if a token was taken, otherwise the number of seconds
+            until the next token becomes available.
+        """
+        pass
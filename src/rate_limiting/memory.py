@@ -0,0 +1,33 @@
+import time
+from collections import OrderedDict
+from src.rate_limiting.interfaces import RateLimiterInterface, TokenBucket
+
+
+class InMemoryRateLimiter(RateLimiterInterface):
+    """
+    Token buckets kept in process memory, for single-worker deployments.
+
+    The least recently used buckets are dropped past `max_keys`; a dropped
+    bucket comes back full, which only ever errs on the side of allowing.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, bucket: TokenBucket) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (bucket.capacity, now))
+        tokens = min(
+            bucket.capacity, tokens + (now - updated_at) * bucket.refill_per_second
+        )
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / bucket.refill_per_second
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return wait
@@ -0,0 +1,45 @@
+from redis.asyncio import Redis
+from src.rate_limiting.interfaces import RateLimiterInterface, TokenBucket
+
+# Refill and take a token atomically, using the Redis clock so that all
+# workers agree on elapsed time. Returns the wait in seconds as a string.
+_CONSUME_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisRateLimiter(RateLimiterInterface):
+    """
+    Token buckets shared by all workers through Redis.
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        self._client = Redis.from_url(url)
+        self._prefix = prefix
+        self._consume = self._client.register_script(_CONSUME_SCRIPT)
+
+    async def consume(self, key: str, bucket: TokenBucket) -> float:
+        wait = await self._consume(
+            keys=[self._prefix + key],
+            args=[bucket.capacity, bucket.refill_per_second],
+        )
+        return float(wait)
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -1,5 +1,6 @@
+import uuid
 from datetime import datetime, timezone
-from fastapi import APIRouter, status, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, status, Depends, HTTPException
 from sqlalchemy import delete
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,14 +16,15 @@ from src.database.models import (
     ActivationToken,
     RefreshToken,
     PasswordResetToken,
+    EmailKind,
 )
 from src.exceptions import BaseSecurityError
-from src.notifications import EmailSenderInterface
+from src.notifications.outbox import enqueue_email
 from src.config.dependencies import (
-    get_email_notificator,
     get_settings,
     get_jwt_auth_manager,
     get_current_user_id,
+    get_password_hasher,
 )
 from src.schemas.accounts import (
     UserRegistrationResponseSchema,
@@ -36,15 +38,48 @@ from src.schemas.accounts import (
     PasswordChangeRequestSchema,
     TokenRefreshResponseSchema,
     TokenRefreshRequestSchema,
+    TokenCacheStatsSchema,
 )
 from src.security.interfaces import JWTAuthManagerInterface
+from src.security.password_hasher import PasswordHasher
+from src.rate_limiting import limit_auth_requests
+from src.security.auth_context import (
+    AuthContext,
+    get_auth_context,
+    get_auth_context_cache,
+)
+from src.cache import InMemoryLRUCache
 
 router = APIRouter()
 BASE_URL = "http://127.0.0.1/accounts"
 
 
+def _issue_refresh_token(
+    db: AsyncSession,
+    jwt_manager: JWTAuthManagerInterface,
+    user_id: int,
+    family_id: str,
+    days_valid: int,
+) -> str:
+    """
+    Create a refresh token in `family_id` and add its row to the session.
+
+    The random "jti" keeps tokens issued within the same second distinct.
+    """
+    token = jwt_manager.create_refresh_token(
+        {"user_id": user_id, "fid": family_id, "jti": uuid.uuid4().hex}
+    )
+    db.add(
+        RefreshToken.create(
+            user_id=user_id, days_valid=days_valid, token=token, family_id=family_id
+        )
+    )
+    return token
+
+
 @router.post(
     "/register/",
+    dependencies=[Depends(limit_auth_requests)],
     response_model=UserRegistrationResponseSchema,
     summary="User Registration",
     description="Register a new user with an email and password.",
@@ -72,10 +107,10 @@ BASE_URL = "http://127.0.0.1/accounts"
 )
 async def register_user(
     user_data: UserRegistrationRequestSchema,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    email_sender: EmailSenderInterface = Depends(get_email_notificator),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
 ) -> UserRegistrationResponseSchema:
+    hashed_password = await password_hasher.hash(user_data.password)
     try:
         user_group_enum = UserGroupEnum[user_data.group.upper()]
         group_result = await db.execute(
@@ -87,7 +122,8 @@ async def register_user(
             db.add(group)
             await db.flush()
 
-        new_user = User(email=user_data.email, password=user_data.password, group=group)
+        new_user = User(email=user_data.email, group=group)
+        new_user.set_hashed_password(hashed_password)
         db.add(new_user)
         await db.flush()
 
@@ -95,13 +131,13 @@ async def register_user(
         db.add(activation_token)
         await db.flush()
 
-        await db.commit()
-
-        background_tasks.add_task(
-            email_sender.send_activation_email,
+        enqueue_email(
+            db,
+            EmailKind.activation,
             new_user.email,
-            f"{BASE_URL}/activate/?token={activation_token.token}",
+            activation_link=f"{BASE_URL}/activate/?token={activation_token.token}",
         )
+        await db.commit()
         return UserRegistrationResponseSchema(
             id=new_user.id, email=new_user.email, group=new_user.group.name.value  # type: ignore
         )
@@ -148,6 +184,7 @@ async def register_user(
 async def activate_account(
     activation_data: UserActivationRequestSchema,
     db: AsyncSession = Depends(get_db),
+    auth_context_cache: InMemoryLRUCache = Depends(get_auth_context_cache),
 ) -> MessageResponseSchema:
     stmt = (
         select(ActivationToken)
@@ -181,6 +218,7 @@ async def activate_account(
     user.is_active = True
     await db.delete(token_record)
     await db.commit()
+    auth_context_cache.delete(user.id)
 
     return MessageResponseSchema(message="User account activated successfully.")
 
@@ -207,9 +245,7 @@ async def activate_account(
 )
 async def resend_activation_token(
     user_data: UserRegistrationRequestSchema,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    email_sender: EmailSenderInterface = Depends(get_email_notificator),
 ):
     result = await db.execute(select(User).filter(User.email == user_data.email))
     db_user = result.scalars().first()
@@ -233,19 +269,20 @@ async def resend_activation_token(
     db.add(new_activation_token)
     await db.flush()
     await db.refresh(new_activation_token)
-    await db.commit()
-
-    background_tasks.add_task(
-        email_sender.send_activation_email,
+    enqueue_email(
+        db,
+        EmailKind.activation,
         db_user.email,
-        f"{BASE_URL}/activate/?token={new_activation_token.token}",
+        activation_link=f"{BASE_URL}/activate/?token={new_activation_token.token}",
     )
+    await db.commit()
 
     return MessageResponseSchema(message="Activation token resent successfully.")
 
 
 @router.post(
     "/login/",
+    dependencies=[Depends(limit_auth_requests)],
     response_model=UserLoginResponseSchema,
     summary="User Login",
     description="Authenticate a user and return access and refresh tokens.",
@@ -284,15 +321,27 @@ async def login_user(
     db: AsyncSession = Depends(get_db),
     settings: BaseAppSettings = Depends(get_settings),
     jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
 ) -> UserLoginResponseSchema:
     result = await db.execute(select(User).filter_by(email=login_data.email))
     user = result.scalars().first()
     user = cast(User, user)
-    if not user or not user.verify_password(login_data.password):
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
         )
+    is_valid, new_hash = await password_hasher.verify_and_update(
+        login_data.password, user.hashed_password
+    )
+    if not is_valid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password.",
+        )
+    if new_hash is not None:
+        # Stored hash predates the configured cost; saved with the refresh token.
+        user.set_hashed_password(new_hash)
 
     if not user.is_active:
         raise HTTPException(
@@ -300,14 +349,14 @@ async def login_user(
             detail="User account is not activated.",
         )
 
-    jwt_refresh_token = jwt_manager.create_refresh_token({"user_id": user.id})
+    jwt_refresh_token = _issue_refresh_token(
+        db,
+        jwt_manager,
+        user.id,
+        RefreshToken.new_family_id(),
+        settings.LOGIN_TIME_DAYS,
+    )
     try:
-        refresh_token = RefreshToken.create(
-            user_id=user.id,
-            days_valid=settings.LOGIN_TIME_DAYS,
-            token=jwt_refresh_token,
-        )
-        db.add(refresh_token)
         await db.flush()
         await db.commit()
     except SQLAlchemyError:
@@ -348,6 +397,7 @@ async def login_user(
 async def logout_user(
     db: AsyncSession = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
+    jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
 ) -> MessageResponseSchema:
     result = await db.execute(select(User).filter_by(id=current_user_id))
     user = result.scalars().first()
@@ -366,12 +416,14 @@ async def logout_user(
 
     await db.delete(refresh_token_record)
     await db.commit()
+    jwt_manager.evict_cached_access_tokens(user.id)
 
     return MessageResponseSchema(message="Logout successful.")
 
 
 @router.post(
     "/password-reset/request/",
+    dependencies=[Depends(limit_auth_requests)],
     response_model=MessageResponseSchema,
     summary="Request Password Reset Token",
     description=(
@@ -382,9 +434,7 @@ async def logout_user(
 )
 async def request_password_reset_token(
     data: PasswordResetRequestSchema,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    email_sender: EmailSenderInterface = Depends(get_email_notificator),
 ) -> MessageResponseSchema:
     result = await db.execute(select(User).filter_by(email=data.email))
     user = result.scalars().first()
@@ -396,13 +446,14 @@ async def request_password_reset_token(
     await db.execute(delete(PasswordResetToken).filter_by(user_id=user.id))
     new_reset_token = PasswordResetToken(user_id=cast(int, user.id))
     db.add(new_reset_token)
-    await db.commit()
-
-    background_tasks.add_task(
-        email_sender.send_password_reset_email,
+    await db.flush()
+    enqueue_email(
+        db,
+        EmailKind.password_reset,
         str(data.email),
-        f"{BASE_URL}/password-reset/request/?token={new_reset_token.token}",
+        reset_link=f"{BASE_URL}/password-reset/request/?token={new_reset_token.token}",
     )
+    await db.commit()
 
     return MessageResponseSchema(
         message="If you are registered, you will receive an email with instructions."
@@ -411,6 +462,7 @@ async def request_password_reset_token(
 
 @router.post(
     "/password-reset/complete/",
+    dependencies=[Depends(limit_auth_requests)],
     response_model=MessageResponseSchema,
     summary="Reset User Password",
     description="Reset a user's password if a valid token is provided.",
@@ -449,6 +501,8 @@ async def request_password_reset_token(
 async def reset_password(
     data: PasswordResetCompleteRequestSchema,
     db: AsyncSession = Depends(get_db),
+    jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
 ) -> MessageResponseSchema:
     result = await db.execute(select(User).filter_by(email=data.email))
     user = result.scalars().first()
@@ -480,8 +534,9 @@ async def reset_password(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid email or token."
         )
 
+    hashed_password = await password_hasher.hash(data.password)
     try:
-        user.password = data.password
+        user.set_hashed_password(hashed_password)
         await db.delete(token_record)
         await db.commit()
     except SQLAlchemyError:
@@ -490,6 +545,7 @@ async def reset_password(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while resetting the password.",
         )
+    jwt_manager.evict_cached_access_tokens(user.id)
 
     return MessageResponseSchema(message="Password reset successfully.")
 
@@ -523,27 +579,29 @@ async def reset_password(
 )
 async def request_change_password(
     user_data: PasswordChangeRequestSchema,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     user_id: User = Depends(get_current_user_id),
-    email_sender: EmailSenderInterface = Depends(get_email_notificator),
+    jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
 ) -> MessageResponseSchema:
     result = await db.execute(select(User).filter_by(id=user_id))
     user = result.scalars().first()
-    if not user.verify_password(raw_password=user_data.password):
+    if not await password_hasher.verify(user_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid email or password."
         )
 
-    if user.verify_password(raw_password=user_data.new_password):
+    if await password_hasher.verify(user_data.new_password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You cannot assign the same password.",
         )
 
+    hashed_password = await password_hasher.hash(user_data.new_password)
     try:
-        user.password = user_data.new_password
+        user.set_hashed_password(hashed_password)
         await db.execute(delete(RefreshToken).filter_by(user_id=user.id))
+        enqueue_email(db, EmailKind.password_change, str(user_data.email))
         await db.commit()
 
     except SQLAlchemyError:
@@ -552,11 +610,7 @@ async def request_change_password(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while changing the password.",
         )
-
-    background_tasks.add_task(
-        email_sender.send_password_change,
-        str(user_data.email),
-    )
+    jwt_manager.evict_cached_access_tokens(user.id)
 
     return MessageResponseSchema(message="Password changed successfully")
 
@@ -565,7 +619,10 @@ async def request_change_password(
     "/refresh/",
     response_model=TokenRefreshResponseSchema,
     summary="Refresh Access Token",
-    description="Refresh the access token using a valid refresh token.",
+    description=(
+        "Exchange a refresh token for a new access token and a new refresh "
+        "token. Each refresh token works once; reusing one ends the session."
+    ),
     status_code=status.HTTP_200_OK,
     responses={
         400: {
@@ -589,6 +646,7 @@ async def request_change_password(
 async def refresh_access_token(
     token_data: TokenRefreshRequestSchema,
     db: AsyncSession = Depends(get_db),
+    settings: BaseAppSettings = Depends(get_settings),
     jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
 ) -> TokenRefreshResponseSchema:
     try:
@@ -600,11 +658,21 @@ async def refresh_access_token(
             detail=str(error),
         )
 
+    # Deleting the row claims the token, so two concurrent refreshes with
+    # the same token cannot both succeed.
     result = await db.execute(
-        select(RefreshToken).filter_by(token=token_data.refresh_token)
+        delete(RefreshToken)
+        .filter_by(token_hash=RefreshToken.hash_token(token_data.refresh_token))
+        .returning(RefreshToken.family_id)
     )
-    refresh_token_exist = result.scalars().first()
-    if not refresh_token_exist:
+    family_id = result.scalar_one_or_none()
+    if family_id is None:
+        family_id = decoded_token.get("fid")
+        if family_id:
+            # A validly signed token that is no longer stored has already been
+            # used or revoked; treat it as stolen and end the whole session.
+            await db.execute(delete(RefreshToken).filter_by(family_id=family_id))
+        await db.commit()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token not found.",
@@ -613,15 +681,50 @@ async def refresh_access_token(
     result = await db.execute(select(User).filter_by(id=user_id))
     user = result.scalars().first()
     if not user:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found.",
         )
 
-    new_access_token = jwt_manager.create_access_token({"user_id": user_id})
-    await db.execute(delete(RefreshToken).filter_by(token=token_data.refresh_token))
+    new_refresh_token = _issue_refresh_token(
+        db, jwt_manager, user_id, family_id, settings.LOGIN_TIME_DAYS
+    )
     await db.commit()
 
     return TokenRefreshResponseSchema(
-        access_token=new_access_token, token_type="bearer"
+        access_token=jwt_manager.create_access_token({"user_id": user_id}),
+        refresh_token=new_refresh_token,
+        token_type="bearer",
     )
+
+
+@router.get(
+    "/token-cache/stats/",
+    response_model=TokenCacheStatsSchema,
+    summary="Access token cache statistics",
+    description=(
+        "Size and hit ratio of the verified access token cache of the worker "
+        "that serves the request. Available to admins only."
+    ),
+    responses={
+        403: {
+            "description": "Forbidden - The user is not an admin.",
+            "content": {
+                "application/json": {"example": {"detail": "Access forbidden"}}
+            },
+        },
+    },
+)
+async def get_token_cache_stats(
+    current_user: AuthContext = Depends(get_auth_context),
+    jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+) -> TokenCacheStatsSchema:
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden"
+        )
+    stats = jwt_manager.access_token_cache_stats()
+    if stats is None:
+        return TokenCacheStatsSchema(enabled=False)
+    return TokenCacheStatsSchema(enabled=True, **stats)
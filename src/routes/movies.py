@@ -1,15 +1,50 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query, status, BackgroundTasks
-from sqlalchemy import or_, func, and_
+import io
+import json
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlencode
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    status,
+    File,
+    Header,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, delete, exists, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload, selectinload
-from src.config import get_current_user_id, get_email_notificator
+from src.cache import CatalogCache, make_etag, etag_matches
+from src.catalog import (
+    adjust_genre_stats,
+    bump_catalog_version,
+    get_catalog_version,
+    EXPORT_MEDIA_TYPES,
+    IMPORT_FORMATS,
+    MovieExporter,
+    MovieImporter,
+    read_records,
+    get_movie_exporter,
+    get_movie_importer,
+)
+from src.config import (
+    get_current_user_id,
+    get_total_counter,
+    get_catalog_cache,
+)
 from src.database import get_db
+from src.exceptions import InvalidCursorError
 from src.database.models import (
     User,
-    UserGroupEnum,
     Movie,
     Genre,
+    GenreStats,
+    MoviesGenres,
     Director,
     Star,
     Comment,
@@ -20,15 +55,50 @@ from src.database.models import (
     Dislike,
     Rating,
     OrderItem,
+    EmailKind,
+)
+from src.notifications.outbox import enqueue_email
+from src.pagination import (
+    encode_cursor,
+    decode_cursor,
+    decode_id_cursor,
+    keyset_predicate,
+    TotalCounter,
+    count_cache_key,
+)
+from src.security.auth_context import (
+    AuthContext,
+    get_auth_context,
+    get_moderator_context,
+)
+from src.search import (
+    MovieSearchEngineInterface,
+    MovieQuery,
+    MovieQueryBuilder,
+    get_movie_search_engine,
+    get_movie_query_builder,
+)
+from src.votes import (
+    Vote,
+    VoteKind,
+    VoteBufferInterface,
+    get_vote_buffer,
+    movie_counter_values,
+    add_user_movie_row,
 )
-from src.notifications import EmailSenderInterface
 from src.schemas.movies import (
     MovieListItemSchema,
     MovieListResponseSchema,
+    MovieFilterSchema,
     MovieDetailSchema,
     MovieCreateSchema,
+    MovieImportReportSchema,
+    CatalogCacheStatsSchema,
     MovieUpdateSchema,
-    CommentSchema,
+    AnswerCommentSchema,
+    AnswerListResponseSchema,
+    CommentListItemSchema,
+    CommentListResponseSchema,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -36,6 +106,75 @@ from sqlalchemy.future import select
 router = APIRouter()
 
 
+def _link_params(
+    filters: MovieFilterSchema, per_page: int, include_total: bool, **params
+) -> dict:
+    """
+    Query parameters for a prev/next link that keep the active filters and sort.
+
+    A cursor is only valid for the sort order it was issued under, so links
+    that drop `sort_by` or the filters would point at a different listing.
+    """
+    link = filters.model_dump(exclude_none=True)
+    link["per_page"] = per_page
+    if not include_total:
+        link["include_total"] = "false"
+    link.update(params)
+    return link
+
+
+async def fetch_movie_page(
+    db: AsyncSession,
+    movie_query: MovieQuery,
+    page: int,
+    per_page: int,
+    cursor: str | None,
+) -> tuple[list[Movie], str | None]:
+    """
+    Fetch one page of a built movie query with its list relationships.
+
+    Uses a keyset predicate when `cursor` is given and OFFSET otherwise.
+    One extra row is fetched to decide whether a `next_cursor` is returned.
+    """
+    stmt = movie_query.stmt.options(
+        selectinload(Movie.genres),
+        selectinload(Movie.directors),
+        selectinload(Movie.stars),
+    )
+    if cursor:
+        try:
+            cursor_sort_key, last_value, last_id = decode_cursor(cursor)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if cursor_sort_key != movie_query.sort_key:
+            raise HTTPException(
+                status_code=400,
+                detail="Cursor does not match the requested sort order.",
+            )
+        stmt = stmt.where(
+            keyset_predicate(movie_query.sort_column, Movie.id, last_value, last_id)
+        )
+    else:
+        stmt = stmt.offset((page - 1) * per_page)
+
+    result = await db.execute(stmt.limit(per_page + 1))
+    rows = result.all()
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+
+    next_cursor = None
+    if has_next:
+        last_row = rows[-1]
+        last_value = (
+            last_row.search_rank
+            if movie_query.sort_key == "search_rank"
+            else getattr(last_row.Movie, movie_query.sort_key)
+        )
+        next_cursor = encode_cursor(movie_query.sort_key, last_value, last_row.Movie.id)
+
+    return [row.Movie for row in rows], next_cursor
+
+
 @router.get(
     "/",
     response_model=MovieListResponseSchema,
@@ -44,31 +183,41 @@ router = APIRouter()
         "This endpoint retrieves a paginated list of movies from the database. "
         "Clients can specify the `page` number and the number of items per page using `per_page`. "
         "The response includes details about the movies, total pages, and total items, "
-        "along with links to the previous and next pages if applicable."
+        "along with links to the previous and next pages if applicable. "
+        "For deep pagination pass the returned `next_cursor` as `cursor` instead of `page`. "
+        "Large totals are planner estimates (`total_is_estimate`); pass `include_total=false` "
+        "to skip counting altogether."
     ),
     responses={
+        400: {
+            "description": "Invalid pagination cursor.",
+            "content": {
+                "application/json": {"example": {"detail": "Invalid pagination cursor."}}
+            },
+        },
         404: {
             "description": "No movies found.",
             "content": {
                 "application/json": {"example": {"detail": "No movies found."}}
             },
-        }
+        },
     },
 )
 async def get_movie_list(
     page: int = Query(1, ge=1, description="Page number (1-based index)"),
     per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
-    year: int | None = Query(None, description="Filter by year"),
-    min_imdb: float | None = Query(None, description="Filter by min_imdb"),
-    max_imdb: float | None = Query(None, description="Filter by max_imdb"),
-    genre: str | None = Query(None, description="Filter by genre name"),
-    director: str | None = Query(None, description="Filter by director name"),
-    star: str | None = Query(None, description="Filter by star name"),
-    search: str | None = Query(
-        None, description="Search by title, description, actor or director"
+    cursor: str | None = Query(
+        None, description="Opaque cursor from `next_cursor` for keyset pagination"
     ),
-    sort_by: str | None = Query(None, description="Sort by 'price', 'year', 'votes'"),
+    include_total: bool = Query(
+        True, description="Count matching movies; disable when only links are needed"
+    ),
+    filters: MovieFilterSchema = Depends(MovieFilterSchema.from_query),
     db: AsyncSession = Depends(get_db),
+    total_counter: TotalCounter = Depends(get_total_counter),
+    query_builder: MovieQueryBuilder = Depends(get_movie_query_builder),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
+    if_none_match: str | None = Header(None),
 ) -> MovieListResponseSchema:
     """
     Fetch a paginated list of movies from the database.
@@ -76,81 +225,86 @@ async def get_movie_list(
     This function retrieves a paginated list of movies, allowing the client to specify
     the page number and the number of items per page. It calculates the total pages
     and provides links to the previous and next pages when applicable.
+    When a `cursor` is given, rows are fetched with a keyset predicate on the sort key,
+    so every page costs the same regardless of its depth. Search results are ordered
+    by relevance unless `sort_by` is given.
+    Serialized responses are served from the catalog cache when possible,
+    and conditional requests are answered with 304 while the catalog
+    version is unchanged. The version is read from the database, so every
+    worker sees a write as soon as it commits. Orderings by vote counters
+    carry no ETag, since votes do not bump the catalog version.
     """
-    offset = (page - 1) * per_page
-    query = (
-        select(Movie)
-        .options(
-            selectinload(Movie.genres),
-            selectinload(Movie.directors),
-            selectinload(Movie.stars),
-        )
-        .order_by()
-    )
-
-    order_by = Movie.default_order_by()
-    if order_by:
-        query = query.order_by(*order_by)
-
-    if year:
-        query = query.filter(Movie.year == year)
-    if min_imdb:
-        query = query.filter(Movie.imdb >= min_imdb)
-    if max_imdb:
-        query = query.filter(Movie.imdb <= max_imdb)
-    if director:
-        query = query.join(Movie.directors).filter(Director.name.ilike(f"%{director}%"))
-    if star:
-        query = query.join(Movie.stars).filter(Star.name.ilike(f"%{star}%"))
-    if genre:
-        query = query.join(Movie.genres).filter(Genre.name.ilike(f"%{genre}%"))
-
-    if search:
-        query = (
-            query.outerjoin(Movie.directors)
-            .outerjoin(Movie.stars)
-            .filter(
-                or_(
-                    Movie.name.ilike(f"%{search}%"),
-                    Movie.description.ilike(f"%{search}%"),
-                    Director.name.ilike(f"%{search}%"),
-                    Star.name.ilike(f"%{search}%"),
-                )
+    params = dict(
+        page=page,
+        per_page=per_page,
+        cursor=cursor,
+        include_total=include_total,
+        **filters.model_dump(),
+    )
+    catalog_version = await get_catalog_version(db)
+    etag_headers = {}
+    if filters.sort_by not in query_builder.COUNTER_SORT_FIELDS:
+        etag = make_etag("movies", catalog_version, sorted(params.items()))
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
             )
+        etag_headers["ETag"] = etag
+
+    cache_key = await catalog_cache.key(
+        "movies", catalog_version=catalog_version, **params
+    )
+    cached = await catalog_cache.get(cache_key)
+    if cached is not None:
+        return Response(
+            content=cached, media_type="application/json", headers=etag_headers
         )
 
-    sort_fields = {
-        "price": Movie.price,
-        "year": Movie.year,
-        "votes": Movie.votes,
-    }
-    if sort_by in sort_fields:
-        query = query.order_by(sort_fields[sort_by].desc())
+    movie_query = await query_builder.build(db, filters)
 
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count_result = await db.execute(count_stmt)
-    total_items = count_result.scalar_one()
+    total_items, total_pages, total_is_exact = None, None, True
+    if include_total:
+        count_key = count_cache_key(
+            "movies", catalog_version, **filters.model_dump(exclude={"sort_by"})
+        )
+        total_items, total_is_exact = await total_counter.count(
+            db, movie_query.stmt, count_key
+        )
+        total_pages = (total_items + per_page - 1) // per_page
 
-    result = await db.execute(query.offset(offset).limit(per_page))
-    movies = result.scalars().all()
+    movies, next_cursor = await fetch_movie_page(
+        db, movie_query, page=page, per_page=per_page, cursor=cursor
+    )
     if not movies:
         raise HTTPException(status_code=404, detail="No movies found.")
 
-    movie_list = [MovieListItemSchema.model_validate(movie) for movie in movies]
-    total_pages = (total_items + per_page - 1) // per_page
+    def page_link(**params) -> str:
+        return "/movies/?" + urlencode(
+            _link_params(filters, per_page, include_total, **params)
+        )
+
+    if cursor:
+        prev_page = None
+        next_page = page_link(cursor=next_cursor) if next_cursor else None
+    else:
+        prev_page = page_link(page=page - 1) if page > 1 else None
+        next_page = page_link(page=page + 1) if next_cursor else None
+
     response = MovieListResponseSchema(
-        movies=movie_list,
-        prev_page=f"/movies/?page={page - 1}&per_page={per_page}" if page > 1 else None,
-        next_page=(
-            f"/movies/?page={page + 1}&per_page={per_page}"
-            if page < total_pages
-            else None
-        ),
+        movies=[MovieListItemSchema.model_validate(movie) for movie in movies],
+        prev_page=prev_page,
+        next_page=next_page,
         total_pages=total_pages,
         total_items=total_items,
+        total_is_estimate=not total_is_exact,
+        next_cursor=next_cursor,
     )
+    payload = response.model_dump_json()
+    await catalog_cache.set(cache_key, payload)
 
-    return response
+    return Response(
+        content=payload, media_type="application/json", headers=etag_headers
+    )
 
 
 @router.post(
@@ -178,8 +332,10 @@ async def get_movie_list(
 )
 async def create_movie(
     movie_data: MovieCreateSchema,
-    user_id: int = Depends(get_current_user_id),
+    moderator: AuthContext = Depends(get_moderator_context),
     db: AsyncSession = Depends(get_db),
+    search_engine: MovieSearchEngineInterface = Depends(get_movie_search_engine),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
 ) -> MovieDetailSchema:
     """
     Add a new movie to the database.
@@ -188,19 +344,6 @@ async def create_movie(
     name, release date, genres, actors, and languages. It automatically
     handles linking or creating related entities.
     """
-    result = await db.execute(
-        select(User).options(selectinload(User.group)).where(User.id == user_id)
-    )
-    user = result.scalars().first()
-
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    if user.group.name not in (UserGroupEnum.MODERATOR, UserGroupEnum.ADMIN):
-        raise HTTPException(
-            status_code=403, detail="You do not have access to perform this action."
-        )
-
     existing_stmt = select(Movie).where(
         (Movie.name == movie_data.name), (Movie.year == movie_data.year)
     )
@@ -275,7 +418,12 @@ async def create_movie(
             certification=certification,
         )
         db.add(movie)
+        await db.flush()
+        await adjust_genre_stats(db, {genre.id: 1 for genre in genres})
+        await bump_catalog_version(db)
+        await search_engine.index_movie(db, movie.id)
         await db.commit()
+        await catalog_cache.invalidate()
         result = await db.execute(
             select(Movie)
             .options(
@@ -283,7 +431,6 @@ async def create_movie(
                 selectinload(Movie.genres),
                 selectinload(Movie.stars),
                 selectinload(Movie.directors),
-                selectinload(Movie.comments),
             )
             .where(Movie.id == movie.id)
         )
@@ -295,15 +442,112 @@ async def create_movie(
         raise HTTPException(status_code=400, detail="Invalid input data.")
 
 
+@router.get(
+    "/export",
+    summary="Export the movie catalog",
+    description=(
+        "Stream the whole catalog as NDJSON (default) or CSV. "
+        "Pass `since` to export only movies changed at or after that timestamp. "
+        "The `X-Export-Watermark` response header is the `since` for the next run; "
+        "changes still being committed are left for that run. Vote counters "
+        "do not count as changes."
+    ),
+    response_class=StreamingResponse,
+)
+async def export_movies(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    since: datetime | None = Query(None),
+    user_id: int = Depends(get_current_user_id),
+    exporter: MovieExporter = Depends(get_movie_exporter),
+) -> StreamingResponse:
+    until = await exporter.watermark()
+    return StreamingResponse(
+        exporter.stream(export_format, since, until),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="movies.{export_format}"',
+            "X-Export-Watermark": until.isoformat(),
+        },
+    )
+
+
+@router.get(
+    "/cache/stats/",
+    response_model=CatalogCacheStatsSchema,
+    summary="Catalog cache statistics",
+    description=(
+        "Hit and miss counts of the catalog response cache of the worker that "
+        "serves the request. Available to admins only."
+    ),
+    responses={
+        403: {
+            "description": "Forbidden - The user is not an admin.",
+            "content": {
+                "application/json": {"example": {"detail": "Access forbidden"}}
+            },
+        },
+    },
+)
+async def get_catalog_cache_stats(
+    current_user: AuthContext = Depends(get_auth_context),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
+) -> CatalogCacheStatsSchema:
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden"
+        )
+    return CatalogCacheStatsSchema(**catalog_cache.stats())
+
+
+@router.post(
+    "/import/",
+    response_model=MovieImportReportSchema,
+    summary="Bulk import movies",
+    description=(
+        "Import movies from an uploaded JSON Lines (.jsonl) or CSV (.csv) file. "
+        "In CSV files genres, stars and directors are separated by `|`. "
+        "Movies that already exist are skipped."
+    ),
+    status_code=201,
+)
+async def import_movies(
+    file: UploadFile = File(...),
+    moderator: AuthContext = Depends(get_moderator_context),
+    db: AsyncSession = Depends(get_db),
+    importer: MovieImporter = Depends(get_movie_importer),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
+) -> MovieImportReportSchema:
+    import_format = IMPORT_FORMATS.get(Path(file.filename or "").suffix.lower())
+    if import_format is None:
+        raise HTTPException(
+            status_code=400, detail="Only .jsonl and .csv files can be imported."
+        )
+
+    # The importer reads and parses the upload in the threadpool.
+    lines = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        report = await importer.run(db, read_records(lines, import_format))
+    except UnicodeDecodeError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="The file must be UTF-8 encoded.")
+    finally:
+        lines.detach()
+    if report.created:
+        await catalog_cache.invalidate()
+
+    return report
+
+
 @router.get(
     "/favorites/",
     response_model=MovieListResponseSchema,
     summary="Get a paginated list of favorite movies",
     description=(
-        "This endpoint retrieves a paginated list of favorite movies from the database. "
+        "This endpoint retrieves a paginated list of the current user's favorite movies. "
         "Clients can specify the `page` number and the number of items per page using `per_page`. "
         "The response includes details about the movies, total pages, and total items, "
-        "along with links to the previous and next pages if applicable."
+        "along with links to the previous and next pages if applicable. "
+        "Pass `include_total=false` to skip counting."
     ),
     responses={
         404: {
@@ -317,17 +561,17 @@ async def create_movie(
 async def get_favorite_movies(
     page: int = Query(1, ge=1, description="Page number (1-based index)"),
     per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
-    year: int | None = Query(None, description="Filter by year"),
-    min_imdb: float | None = Query(None, description="Filter by min_imdb"),
-    max_imdb: float | None = Query(None, description="Filter by max_imdb"),
-    genre: str | None = Query(None, description="Filter by genre name"),
-    director: str | None = Query(None, description="Filter by director name"),
-    star: str | None = Query(None, description="Filter by star name"),
-    search: str | None = Query(
-        None, description="Search by title, description, actor or director"
+    cursor: str | None = Query(
+        None, description="Opaque cursor from `next_cursor` for keyset pagination"
     ),
-    sort_by: str | None = Query(None, description="Sort by 'price', 'year', 'votes'"),
+    include_total: bool = Query(
+        True, description="Count matching movies; disable when only links are needed"
+    ),
+    filters: MovieFilterSchema = Depends(MovieFilterSchema.from_query),
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
+    total_counter: TotalCounter = Depends(get_total_counter),
+    query_builder: MovieQueryBuilder = Depends(get_movie_query_builder),
 ) -> MovieListResponseSchema:
     """
     Fetch a paginated list of favorite movies from the database.
@@ -336,77 +580,44 @@ async def get_favorite_movies(
     the page number and the number of items per page. It calculates the total pages
     and provides links to the previous and next pages when applicable.
     """
-    offset = (page - 1) * per_page
-    stmt = (
-        select(Movie)
-        .join(Favorite)
-        .options(
-            joinedload(Movie.genres),
-            joinedload(Movie.directors),
-            joinedload(Movie.stars),
-        )
+    favorites_stmt = select(Movie).where(
+        exists().where(Favorite.movie_id == Movie.id, Favorite.user_id == user_id)
     )
+    movie_query = await query_builder.build(db, filters, favorites_stmt)
 
-    if year:
-        stmt = stmt.where(Movie.year == year)
-    if min_imdb:
-        stmt = stmt.where(Movie.imdb >= min_imdb)
-    if max_imdb:
-        stmt = stmt.where(Movie.imdb <= max_imdb)
-    if director:
-        stmt = stmt.join(Movie.directors).where(Director.name.ilike(f"%{director}%"))
-    if star:
-        stmt = stmt.join(Movie.stars).where(Star.name.ilike(f"%{star}%"))
-    if genre:
-        stmt = stmt.join(Movie.genres).where(Genre.name.ilike(f"%{genre}%"))
-    if search:
-        stmt = (
-            stmt.outerjoin(Movie.directors)
-            .outerjoin(Movie.stars)
-            .where(
-                or_(
-                    Movie.name.ilike(f"%{search}%"),
-                    Movie.description.ilike(f"%{search}%"),
-                    Director.name.ilike(f"%{search}%"),
-                    Star.name.ilike(f"%{search}%"),
-                )
-            )
+    total_items, total_pages, total_is_exact = None, None, True
+    if include_total:
+        total_items, total_is_exact = await total_counter.count(
+            db, movie_query.stmt, None
         )
+        total_pages = (total_items + per_page - 1) // per_page
 
-    sort_fields = {
-        "price": Movie.price,
-        "year": Movie.year,
-        "votes": Movie.votes,
-    }
-    if sort_by in sort_fields:
-        stmt = stmt.order_by(sort_fields[sort_by].desc())
-
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    count_result = await db.execute(count_stmt)
-    total_items = count_result.scalar_one()
-
-    result = await db.execute(stmt.offset(offset).limit(per_page))
-    movies = result.unique().scalars().all()
+    movies, next_cursor = await fetch_movie_page(
+        db, movie_query, page=page, per_page=per_page, cursor=cursor
+    )
     if not movies:
         raise HTTPException(status_code=404, detail="No favorite movies found.")
 
-    movie_list = [MovieListItemSchema.model_validate(movie) for movie in movies]
-    total_pages = (total_items + per_page - 1) // per_page
+    def page_link(**params) -> str:
+        return "/movies/favorites/?" + urlencode(
+            _link_params(filters, per_page, include_total, **params)
+        )
+
+    if cursor:
+        prev_page = None
+        next_page = page_link(cursor=next_cursor) if next_cursor else None
+    else:
+        prev_page = page_link(page=page - 1) if page > 1 else None
+        next_page = page_link(page=page + 1) if next_cursor else None
 
     return MovieListResponseSchema(
-        movies=movie_list,
-        prev_page=(
-            f"/movies/favorites/?page={page - 1}&per_page={per_page}"
-            if page > 1
-            else None
-        ),
-        next_page=(
-            f"/movies/favorites/?page={page + 1}&per_page={per_page}"
-            if page < total_pages
-            else None
-        ),
+        movies=[MovieListItemSchema.model_validate(movie) for movie in movies],
+        prev_page=prev_page,
+        next_page=next_page,
         total_pages=total_pages,
         total_items=total_items,
+        total_is_estimate=not total_is_exact,
+        next_cursor=next_cursor,
     )
 
 
@@ -419,30 +630,19 @@ async def add_favorite(
     user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Movie).where(Movie.id == movie_id)
-    result = await db.execute(stmt)
-    existing_movie = result.scalar_one_or_none()
-    if not existing_movie:
+    result = await add_user_movie_row(db, Favorite, user_id, movie_id)
+    await db.commit()
+    if result.movie_name is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Movie with the given ID was not found.",
         )
-
-    stmt = select(Favorite).where(
-        and_(Favorite.user_id == user_id, Favorite.movie_id == movie_id)
-    )
-    result = await db.execute(stmt)
-    existing_favorite = result.scalar_one_or_none()
-    if existing_favorite:
+    if result.created_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Movie already in favorites"
         )
 
-    favorite = Favorite(user_id=user_id, movie_id=movie_id)
-    db.add(favorite)
-    await db.commit()
-
-    return {"detail": f"Movie {existing_movie.name} added to favorites"}
+    return {"detail": f"Movie {result.movie_name} added to favorites"}
 
 
 @router.delete(
@@ -454,30 +654,27 @@ async def remove_favorite(
     user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Movie).where(Movie.id == movie_id)
-    result = await db.execute(stmt)
-    existing_movie = result.scalar_one_or_none()
-    if not existing_movie:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Movie with the given ID was not found.",
+    movie_name = await db.scalar(
+        delete(Favorite)
+        .where(Favorite.user_id == user_id, Favorite.movie_id == movie_id)
+        .returning(
+            select(Movie.name).where(Movie.id == Favorite.movie_id).scalar_subquery()
         )
-
-    stmt = select(Favorite).where(
-        and_(Favorite.user_id == user_id, Favorite.movie_id == movie_id)
     )
-    result = await db.execute(stmt)
-    favorite = result.scalar_one_or_none()
-    if not favorite:
+    await db.commit()
+    if movie_name is None:
+        movie_exists = await db.scalar(select(Movie.id).where(Movie.id == movie_id))
+        if movie_exists is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Movie with the given ID was not found.",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Movie not in favorites"
         )
 
-    await db.delete(favorite)
-    await db.commit()
-
     return {
-        "detail": f"Movie {existing_movie.name} with id: {movie_id} removed from favorites"
+        "detail": f"Movie {movie_name} with id: {movie_id} removed from favorites"
     }
 
 
@@ -494,27 +691,44 @@ async def remove_favorite(
         }
     },
 )
-async def get_genres(db: AsyncSession = Depends(get_db)):
+async def get_genres(
+    db: AsyncSession = Depends(get_db),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
+):
+    cache_key = await catalog_cache.key("genres")
+    cached = await catalog_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     stmt = (
-        select(Genre, func.count(Movie.id).label("movie_count"))
-        .join(Movie.genres)
-        .group_by(Genre.id)
+        select(Genre.name, GenreStats.movie_count)
+        .join(GenreStats, GenreStats.genre_id == Genre.id)
+        .where(GenreStats.movie_count > 0)
     )
     result = await db.execute(stmt)
     genres_with_movie_count = result.all()
     if not genres_with_movie_count:
         raise HTTPException(status_code=404, detail="No genres found.")
 
-    return [
-        {"name": genre.name, "movie_count": movie_count}
-        for genre, movie_count in genres_with_movie_count
-    ]
+    payload = json.dumps(
+        [
+            {"name": name, "movie_count": movie_count}
+            for name, movie_count in genres_with_movie_count
+        ]
+    )
+    await catalog_cache.set(cache_key, payload)
+
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get(
     "/genres/{genre_id}/",
+    response_model=MovieListResponseSchema,
     summary="Get genre details by genre name",
-    description="This endpoint retrieves a genre with all related movies.",
+    description=(
+        "This endpoint retrieves a paginated list of the movies of a genre. "
+        "Movies can be sorted with `sort_by` and paged with `page` or `cursor`."
+    ),
     responses={
         404: {
             "description": "No genres found.",
@@ -525,20 +739,82 @@ async def get_genres(db: AsyncSession = Depends(get_db)):
     },
 )
 async def get_movies_by_genre(
+    request: Request,
     genre_name: str,
+    page: int = Query(1, ge=1, description="Page number (1-based index)"),
+    per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from `next_cursor` for keyset pagination"
+    ),
+    sort_by: str | None = Query(None, description="Sort by 'price', 'year', 'votes'"),
     db: AsyncSession = Depends(get_db),
-):
-    stmt = (
-        select(Genre)
-        .options(selectinload(Genre.movies))
+    query_builder: MovieQueryBuilder = Depends(get_movie_query_builder),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
+) -> MovieListResponseSchema:
+    """
+    Fetch one page of the movies of a genre.
+
+    The total comes from the maintained `genre_stats` row, so no count over
+    the genre's movies is needed.
+    """
+    cache_key = await catalog_cache.key(
+        "genre_movies",
+        genre_name=genre_name.lower(),
+        page=page,
+        per_page=per_page,
+        cursor=cursor,
+        sort_by=sort_by,
+    )
+    cached = await catalog_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    result = await db.execute(
+        select(Genre.id, func.coalesce(GenreStats.movie_count, 0))
+        .outerjoin(GenreStats, GenreStats.genre_id == Genre.id)
         .where(Genre.name.ilike(genre_name))
     )
-    result = await db.execute(stmt)
-    genre = result.scalar_one_or_none()
+    genre = result.first()
     if not genre:
         raise HTTPException(status_code=404, detail="Genre not found")
+    genre_id, total_items = genre
+
+    stmt = select(Movie).where(
+        exists().where(
+            MoviesGenres.c.movie_id == Movie.id, MoviesGenres.c.genre_id == genre_id
+        )
+    )
+    movie_query = await query_builder.build(
+        db, MovieFilterSchema(sort_by=sort_by), stmt=stmt
+    )
+    movies, next_cursor = await fetch_movie_page(
+        db, movie_query, page=page, per_page=per_page, cursor=cursor
+    )
+
+    def page_link(**params) -> str:
+        query = urlencode({"genre_name": genre_name, "per_page": per_page, **params})
+        return f"{request.url.path}?{query}"
+
+    sort_params = {"sort_by": sort_by} if sort_by else {}
+    if cursor:
+        prev_page = None
+        next_page = page_link(cursor=next_cursor, **sort_params) if next_cursor else None
+    else:
+        prev_page = page_link(page=page - 1, **sort_params) if page > 1 else None
+        next_page = page_link(page=page + 1, **sort_params) if next_cursor else None
+
+    response = MovieListResponseSchema(
+        movies=[MovieListItemSchema.model_validate(movie) for movie in movies],
+        prev_page=prev_page,
+        next_page=next_page,
+        total_pages=(total_items + per_page - 1) // per_page,
+        total_items=total_items,
+        next_cursor=next_cursor,
+    )
+    payload = response.model_dump_json()
+    await catalog_cache.set(cache_key, payload)
 
-    return genre.movies
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get(
@@ -565,32 +841,59 @@ async def get_movies_by_genre(
 async def get_movie_by_id(
     movie_id: int,
     db: AsyncSession = Depends(get_db),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
+    if_none_match: str | None = Header(None),
 ) -> MovieDetailSchema:
     """
     Retrieve detailed information about a specific movie by its ID.
 
     This function fetches detailed information about a movie identified by its unique ID.
-    If the movie does not exist, a 404 error is returned.
+    If the movie does not exist, a 404 error is returned. The movie version
+    is checked first, so conditional requests for an unchanged movie are
+    answered with 304 without loading any relationships. Collections are
+    loaded with `selectinload`, one query each, and comments are served
+    separately by the comments endpoint.
     """
+    version = await db.scalar(select(Movie.version).where(Movie.id == movie_id))
+    if version is None:
+        raise HTTPException(
+            status_code=404, detail="Movie with the given ID was not found."
+        )
+
+    etag = make_etag("movie", movie_id, version)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    cache_key = await catalog_cache.key("movie", movie_id=movie_id, version=version)
+    cached = await catalog_cache.get(cache_key)
+    if cached is not None:
+        return Response(
+            content=cached, media_type="application/json", headers={"ETag": etag}
+        )
+
     stmt = (
         select(Movie)
         .options(
-            joinedload(Movie.genres),
-            joinedload(Movie.directors),
-            joinedload(Movie.stars),
             joinedload(Movie.certification),
-            joinedload(Movie.comments).options(selectinload(Comment.answers)),
+            selectinload(Movie.genres),
+            selectinload(Movie.directors),
+            selectinload(Movie.stars),
         )
         .where(Movie.id == movie_id)
     )
     result = await db.execute(stmt)
-    movie = result.unique().scalar_one_or_none()
+    movie = result.scalar_one_or_none()
     if not movie:
         raise HTTPException(
             status_code=404, detail="Movie with the given ID was not found."
         )
 
-    return MovieDetailSchema.model_validate(movie)
+    payload = MovieDetailSchema.model_validate(movie).model_dump_json()
+    await catalog_cache.set(cache_key, payload)
+
+    return Response(
+        content=payload, media_type="application/json", headers={"ETag": etag}
+    )
 
 
 @router.patch(
@@ -601,8 +904,10 @@ async def get_movie_by_id(
 async def update_movie(
     movie_id: int,
     movie_data: MovieUpdateSchema,
-    user_id: int = Depends(get_current_user_id),
+    moderator: AuthContext = Depends(get_moderator_context),
     db: AsyncSession = Depends(get_db),
+    search_engine: MovieSearchEngineInterface = Depends(get_movie_search_engine),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
 ):
     """
     Update a specific movie by its ID.
@@ -610,17 +915,6 @@ async def update_movie(
     This function updates a movie identified by its unique ID.
     If the movie does not exist, a 404 error is raised.
     """
-    stmt = select(User).options(selectinload(User.group)).where(User.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    if user.group.name not in (UserGroupEnum.MODERATOR, UserGroupEnum.ADMIN):
-        raise HTTPException(
-            status_code=403, detail="You do not have access to perform this action."
-        )
-
     stmt = select(Movie).where(Movie.id == movie_id)
     result = await db.execute(stmt)
     movie = result.scalar_one_or_none()
@@ -631,13 +925,20 @@ async def update_movie(
 
     for field, value in movie_data.model_dump(exclude_unset=True).items():
         setattr(movie, field, value)
+    # Incremented in SQL, so concurrent updates never write the same version.
+    movie.version = Movie.version + 1
+    movie.updated_at = func.now()
 
     try:
+        await db.flush()
+        await bump_catalog_version(db)
+        await search_engine.index_movie(db, movie_id)
         await db.commit()
         await db.refresh(movie)
     except IntegrityError:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Invalid input data.")
+    await catalog_cache.invalidate()
 
     return {"detail": f"Movie '{movie.name}' updated successfully."}
 
@@ -649,8 +950,10 @@ async def update_movie(
 )
 async def delete_movie(
     movie_id: int,
-    user_id: int = Depends(get_current_user_id),
+    moderator: AuthContext = Depends(get_moderator_context),
     db: AsyncSession = Depends(get_db),
+    search_engine: MovieSearchEngineInterface = Depends(get_movie_search_engine),
+    catalog_cache: CatalogCache = Depends(get_catalog_cache),
 ):
     """
     Delete a specific movie by its ID.
@@ -658,17 +961,6 @@ async def delete_movie(
     This function deletes a movie identified by its unique ID.
     If the movie does not exist, a 404 error is raised.
     """
-    stmt_user = select(User).options(selectinload(User.group)).where(User.id == user_id)
-    result_user = await db.execute(stmt_user)
-    user = result_user.scalar_one_or_none()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    if user.group.name not in (UserGroupEnum.MODERATOR, UserGroupEnum.ADMIN):
-        raise HTTPException(
-            status_code=403, detail="You do not have access to perform this action."
-        )
-
     stmt_movie = select(Movie).where(Movie.id == movie_id)
     result_movie = await db.execute(stmt_movie)
     movie = result_movie.scalar_one_or_none()
@@ -686,8 +978,15 @@ async def delete_movie(
             detail="Cannot delete movie, it has been purchased by at least one user.",
         )
 
+    genre_ids = await db.scalars(
+        select(MoviesGenres.c.genre_id).where(MoviesGenres.c.movie_id == movie_id)
+    )
+    await adjust_genre_stats(db, {genre_id: -1 for genre_id in genre_ids})
+    await bump_catalog_version(db)
     await db.delete(movie)
     await db.commit()
+    await search_engine.remove_movie(db, movie_id)
+    await catalog_cache.invalidate()
 
     return {"detail": f"Movie {movie.name} deleted successfully."}
 
@@ -698,27 +997,26 @@ async def delete_movie(
 )
 async def like_movie(
     movie_id: int,
+    response: Response,
     user_id: User = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
+    vote_buffer: VoteBufferInterface | None = Depends(get_vote_buffer),
 ):
-    stmt_movie = select(Movie).where(Movie.id == movie_id)
-    result_movie = await db.execute(stmt_movie)
-    movie = result_movie.scalar_one_or_none()
-    if not movie:
-        raise HTTPException(status_code=404, detail="Movie not found")
+    if vote_buffer is not None:
+        await vote_buffer.push(Vote(VoteKind.LIKE, user_id, movie_id))
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"message": "Vote accepted"}
 
-    stmt_like = select(Like).where(Like.movie_id == movie_id, Like.user_id == user_id)
-    result_like = await db.execute(stmt_like)
-    existing_like = result_like.scalar_one_or_none()
-    if existing_like:
-        raise HTTPException(status_code=400, detail="Movie already liked by this user")
-
-    new_like = Like(movie_id=movie_id, user_id=user_id)
-    db.add(new_like)
+    result = await add_user_movie_row(
+        db, Like, user_id, movie_id, exclusive_with=Dislike
+    )
     await db.commit()
-    await db.refresh(new_like)
+    if result.movie_name is None:
+        raise HTTPException(status_code=404, detail="Movie not found")
+    if result.created_id is None:
+        raise HTTPException(status_code=400, detail="Movie already liked by this user")
 
-    return {"message": "Movie liked", "like_id": new_like.id}
+    return {"message": "Movie liked", "like_id": result.created_id}
 
 
 @router.post(
@@ -727,29 +1025,26 @@ async def like_movie(
 )
 async def dislike_movie(
     movie_id: int,
+    response: Response,
     user_id: User = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
+    vote_buffer: VoteBufferInterface | None = Depends(get_vote_buffer),
 ):
-    stmt_movie = select(Movie).where(Movie.id == movie_id)
-    result_movie = await db.execute(stmt_movie)
-    movie = result_movie.scalar_one_or_none()
-    if not movie:
-        raise HTTPException(status_code=404, detail="Movie not found")
+    if vote_buffer is not None:
+        await vote_buffer.push(Vote(VoteKind.DISLIKE, user_id, movie_id))
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"message": "Vote accepted"}
 
-    stmt_dislike = select(Dislike).where(
-        Dislike.movie_id == movie_id, Dislike.user_id == user_id
+    result = await add_user_movie_row(
+        db, Dislike, user_id, movie_id, exclusive_with=Like
     )
-    result_dislike = await db.execute(stmt_dislike)
-    existing_dislike = result_dislike.scalar_one_or_none()
-    if existing_dislike:
-        raise HTTPException(status_code=400, detail="Movie already disliked")
-
-    new_dislike = Dislike(movie_id=movie_id, user_id=user_id)
-    db.add(new_dislike)
     await db.commit()
-    await db.refresh(new_dislike)
+    if result.movie_name is None:
+        raise HTTPException(status_code=404, detail="Movie not found")
+    if result.created_id is None:
+        raise HTTPException(status_code=400, detail="Movie already disliked")
 
-    return {"message": "Movie disliked", "dislike_id": new_dislike.id}
+    return {"message": "Movie disliked", "dislike_id": result.created_id}
 
 
 @router.post(
@@ -780,22 +1075,104 @@ async def create_comment(
 
 @router.get(
     "/{movie_id}/comments/",
-    description="Get the comments for a specific movie by ID",
-    response_model=List[CommentSchema],
+    description=(
+        "Get the comments for a specific movie by ID, oldest first. "
+        "Pass the returned `next_cursor` as `cursor` to fetch the next page; "
+        "each comment carries its `answer_count` so answers can be loaded on demand."
+    ),
+    response_model=CommentListResponseSchema,
 )
-async def get_comments(movie_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Comment)
-        .options(selectinload(Comment.answers))
-        .filter_by(movie_id=movie_id)
+async def get_comments(
+    movie_id: int,
+    cursor: str | None = Query(None),
+    per_page: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+) -> CommentListResponseSchema:
+    answer_count = (
+        select(func.count(AnswerComment.id))
+        .where(AnswerComment.comment_id == Comment.id)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(Comment, answer_count.label("answer_count"))
+        .where(Comment.movie_id == movie_id)
+        .order_by(Comment.id)
+        .limit(per_page + 1)
     )
-    comments = result.scalars().all()
-    if not comments:
+    if cursor:
+        try:
+            stmt = stmt.where(Comment.id > decode_id_cursor(cursor))
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    rows = (await db.execute(stmt)).all()
+    if not rows and not cursor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="No comments found."
         )
 
-    return comments
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor("id", None, rows[-1].Comment.id)
+
+    return CommentListResponseSchema(
+        comments=[
+            CommentListItemSchema(
+                id=row.Comment.id,
+                user_id=row.Comment.user_id,
+                comment=row.Comment.comment,
+                answer_count=row.answer_count,
+            )
+            for row in rows
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/comments/{comment_id}/answers/",
+    description=(
+        "Get the answers to a specific comment, oldest first, "
+        "paginated with `cursor` like the comment listing."
+    ),
+    response_model=AnswerListResponseSchema,
+)
+async def get_comment_answers(
+    comment_id: int,
+    cursor: str | None = Query(None),
+    per_page: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+) -> AnswerListResponseSchema:
+    stmt = (
+        select(AnswerComment)
+        .where(AnswerComment.comment_id == comment_id)
+        .order_by(AnswerComment.id)
+        .limit(per_page + 1)
+    )
+    if cursor:
+        try:
+            stmt = stmt.where(AnswerComment.id > decode_id_cursor(cursor))
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    answers = (await db.scalars(stmt)).all()
+    if not answers and not cursor:
+        comment_exists = await db.scalar(
+            select(Comment.id).where(Comment.id == comment_id)
+        )
+        if comment_exists is None:
+            raise HTTPException(status_code=404, detail="Comment not found")
+
+    next_cursor = None
+    if len(answers) > per_page:
+        answers = answers[:per_page]
+        next_cursor = encode_cursor("id", None, answers[-1].id)
+
+    return AnswerListResponseSchema(
+        answers=[AnswerCommentSchema.model_validate(answer) for answer in answers],
+        next_cursor=next_cursor,
+    )
 
 
 @router.post(
@@ -805,10 +1182,8 @@ async def get_comments(movie_id: int, db: AsyncSession = Depends(get_db)):
 async def reply_to_comment(
     comment_id: int,
     answer_text: str,
-    background_tasks: BackgroundTasks,
     user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
-    email_sender: EmailSenderInterface = Depends(get_email_notificator),
 ):
     result = await db.execute(select(Comment).filter(Comment.id == comment_id))
     comment = result.scalars().first()
@@ -817,21 +1192,18 @@ async def reply_to_comment(
 
     answer = AnswerComment(user_id=user_id, comment_id=comment_id, text=answer_text)
     db.add(answer)
-    await db.commit()
-    await db.refresh(answer)
 
-    result = await db.execute(select(Comment).filter_by(id=answer.comment_id))
-    comment = result.scalars().first()
-
-    result = await db.execute(select(User).filter_by(id=comment.user_id))
-    user = result.scalars().first()
-    user_email = user.email if user else None
+    result = await db.execute(select(User.email).filter_by(id=comment.user_id))
+    user_email = result.scalar_one_or_none()
     if user_email:
-        background_tasks.add_task(
-            email_sender.send_comment_answer,
+        enqueue_email(
+            db,
+            EmailKind.comment_answer,
             user_email,
-            f"New Reply to Your Comment: {answer_text}",
+            answer_text=f"New Reply to Your Comment: {answer_text}",
         )
+    await db.commit()
+    await db.refresh(answer)
 
     return {"message": "Reply created", "reply_id": answer.id}
 
@@ -863,27 +1235,64 @@ async def reply_to_comment(
 )
 async def rate_movie(
     movie_id: int,
+    response: Response,
     rating: int = Query(ge=0, le=10),
     db: AsyncSession = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
+    vote_buffer: VoteBufferInterface | None = Depends(get_vote_buffer),
 ):
-    result = await db.execute(select(Movie).filter(Movie.id == movie_id))
-    movie = result.scalars().first()
-    if not movie:
-        raise HTTPException(status_code=404, detail="Movie not found")
+    """
+    Record or replace the user's rating and update the movie aggregates.
 
-    new_rating = Rating(user_id=user_id, movie_id=movie_id, rating=rating)
-    db.add(new_rating)
-    await db.commit()
+    Each user keeps a single rating per movie; re-rating applies only the
+    difference to `rating_sum`, so the aggregates are maintained in O(1)
+    with an atomic UPDATE instead of re-reading every rating. In vote
+    ingestion mode the rating is buffered and applied by the flusher.
+    """
+    if vote_buffer is not None:
+        await vote_buffer.push(Vote(VoteKind.RATING, user_id, movie_id, rating))
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"message": "Vote accepted"}
 
-    result = await db.execute(select(Rating).filter(Rating.movie_id == movie_id))
-    ratings = result.scalars().all()
-    if not ratings:
-        return 0.0
+    movie_exists = await db.scalar(select(Movie.id).where(Movie.id == movie_id))
+    if movie_exists is None:
+        raise HTTPException(status_code=404, detail="Movie not found")
 
-    total_rating = sum(r.rating for r in ratings)
-    average_rating = total_rating / len(ratings)
-    movie.votes = len(ratings)
+    previous_rating = await db.scalar(
+        select(Rating.rating)
+        .where(Rating.user_id == user_id, Rating.movie_id == movie_id)
+        .with_for_update()
+    )
+    if previous_rating is None:
+        db.add(Rating(user_id=user_id, movie_id=movie_id, rating=rating))
+        try:
+            await db.flush()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail="A rating for this movie is already being saved.",
+            )
+        sum_delta, count_delta = rating, 1
+    else:
+        await db.execute(
+            update(Rating)
+            .where(Rating.user_id == user_id, Rating.movie_id == movie_id)
+            .values(rating=rating)
+        )
+        sum_delta, count_delta = rating - previous_rating, 0
+
+    result = await db.execute(
+        update(Movie)
+        .where(Movie.id == movie_id)
+        .values(
+            **movie_counter_values(
+                rating_sum_delta=sum_delta, rating_count_delta=count_delta
+            )
+        )
+        .returning(Movie.rating_average)
+    )
+    average_rating = float(result.scalar_one())
     await db.commit()
 
     return {"average_rating": average_rating}
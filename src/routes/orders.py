@@ -13,9 +13,9 @@ from src.database.models import (
     Order,
     OrderItem,
     Movie,
-    User,
 )
 from src.config import get_current_user_id
+from src.security.auth_context import AuthContext, get_auth_context
 from fastapi import status
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
@@ -27,29 +27,20 @@ from src.routes.carts import fetch_existing_cart
 router = APIRouter()
 
 
-async def check_user_access(
-    db: AsyncSession,
-    current_user_id: int,
+def check_user_access(
+    current_user: AuthContext,
     resource_owner_id: int
 ) -> None:
     """
-    Checks if the user with current_user_id has access to a resource
+    Checks if the current user has access to a resource
     owned by resource_owner_id.
     Access is granted to the admin or the resource owner.
     Raises HTTPException if access is denied.
     """
-    if current_user_id == resource_owner_id:
+    if current_user.user_id == resource_owner_id:
         return  # Власник ресурсу має доступ
 
-    result = await db.execute(
-        select(User).filter(User.id == current_user_id)
-    )
-    current_user = result.scalar_one_or_none()
-
-    if not current_user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    if current_user.group.name != "admin":
+    if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
 
 
@@ -62,19 +53,10 @@ async def get_orders(
         user_id: Optional[int] = Query(None, description="Filter orders by user ID"),
         order_date: Optional[str] = Query(None, description="Filter orders by a specific date (YYYY-MM-DD)"),
         db: AsyncSession = Depends(get_db),
-        current_user_id: int = Depends(get_current_user_id)
+        current_user: AuthContext = Depends(get_auth_context)
 ) -> OrderListResponseSchema:
-    # Get the current user
-    current_user_result = await db.execute(
-        select(User).options(joinedload(User.group)).filter(User.id == current_user_id)
-    )
-    current_user = current_user_result.scalar_one_or_none()
-
-    if not current_user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     # Check if the current user is an admin or if filters are applied by non-admin users
-    if current_user.group.name != "admin" and (status or user_id or order_date):
+    if not current_user.is_admin and (status or user_id or order_date):
         raise HTTPException(status_code=403, detail="Access forbidden for non-admin users")
 
     # Base query to select orders with joined load for items and movies
@@ -93,8 +75,8 @@ async def get_orders(
     if user_id:
         query = query.filter(Order.user_id == user_id)
     else:
-        if current_user.group.name != "admin":
-            query = query.filter(Order.user_id == current_user.id)
+        if not current_user.is_admin:
+            query = query.filter(Order.user_id == current_user.user_id)
 
     if order_date:
         try:
@@ -202,7 +184,7 @@ async def create_order(
 async def get_order(
         order_id: int,
         db: AsyncSession = Depends(get_db),
-        current_user_id: int = Depends(get_current_user_id),
+        current_user: AuthContext = Depends(get_auth_context),
 ):
     """
     Get the details of a specific order.
@@ -220,7 +202,7 @@ async def get_order(
         raise HTTPException(status_code=404, detail="Order not found")
 
     # Access rights check
-    await check_user_access(db, current_user_id, order.user_id)
+    check_user_access(current_user, order.user_id)
 
     if order.status == OrderStatus.CANCELED:
         raise HTTPException(status_code=400, detail="Order is canceled and cannot be accessed")
@@ -240,7 +222,7 @@ async def update_order_status(
         order_id: int,
         status: str,
         db: AsyncSession = Depends(get_db),
-        current_user_id: int = Depends(get_current_user_id),
+        current_user: AuthContext = Depends(get_auth_context),
 ):
     """
     Update the status of an order.
@@ -260,7 +242,7 @@ async def update_order_status(
         raise HTTPException(status_code=404, detail="Order not found")
 
     # Access rights check
-    await check_user_access(db, current_user_id, order.user_id)
+    check_user_access(current_user, order.user_id)
 
     if order.status in [OrderStatus.PAID, OrderStatus.CANCELED]:
         raise HTTPException(status_code=400, detail="Cannot update a paid or canceled order")
@@ -302,7 +284,7 @@ async def update_order_status(
 async def delete_order(
         order_id: int,
         db: AsyncSession = Depends(get_db),
-        current_user_id: int = Depends(get_current_user_id)
+        current_user: AuthContext = Depends(get_auth_context)
 ):
     """
     Delete an order if its status is "pending".
@@ -316,7 +298,7 @@ async def delete_order(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
 
     # Access rights check
-    await check_user_access(db, current_user_id, order.user_id)
+    check_user_access(current_user, order.user_id)
 
     # Status check
     if order.status != OrderStatus.PENDING:
@@ -339,7 +321,7 @@ async def delete_order(
 async def cancel_order(
         order_id: int,
         db: AsyncSession = Depends(get_db),
-        current_user_id: int = Depends(get_current_user_id),
+        current_user: AuthContext = Depends(get_auth_context),
 ):
     """
     Cancel an order if it is still "pending".
@@ -352,7 +334,7 @@ async def cancel_order(
         raise HTTPException(status_code=404, detail="Order not found")
 
     # Access rights check
-    await check_user_access(db, current_user_id, order.user_id)
+    check_user_access(current_user, order.user_id)
 
     if order.status != OrderStatus.PENDING:
         raise HTTPException(status_code=400, detail="Only pending orders can be canceled")
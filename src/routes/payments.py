@@ -1,12 +1,12 @@
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Request, BackgroundTasks, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 import stripe
 from sqlalchemy.orm import selectinload
-from src.notifications import EmailSenderInterface
+from src.notifications.outbox import enqueue_email
 from src.schemas.payments import PaymentCreate, PaymentResponse, PaymentItemResponse
 from src.database.models import (
     Order,
@@ -15,8 +15,9 @@ from src.database.models import (
     PaymentStatus,
     PaymentItem,
     OrderItem,
+    EmailKind,
 )
-from src.config.dependencies import get_current_user_id, get_email_notificator
+from src.config.dependencies import get_current_user_id
 from src.database import get_db
 from src.config import settings as settings
 
@@ -118,8 +119,6 @@ async def refund_payment(
     payment_id: int,
     db: AsyncSession = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    email_sender: EmailSenderInterface = Depends(get_email_notificator),
 ):
     """
     Processes a refund for a successful payment.
@@ -146,15 +145,14 @@ async def refund_payment(
     # if payment.external_payment_id == "mock-id-123":
     #     # This is a test, return success without calling Stripe
     #     payment.status = PaymentStatus.refunded
-    #     await db.commit()
-    #     await db.refresh(payment)
-    #
     #     user_result = await db.execute(select(User).filter(User.id == current_user_id))
     #     user = user_result.scalars().first()
     #     if user:
-    #         background_tasks.add_task(
-    #             email_sender.send_refund_email, user.email, payment.amount
+    #         enqueue_email(
+    #             db, EmailKind.refund, user.email, amount=str(payment.amount)
     #         )
+    #     await db.commit()
+    #     await db.refresh(payment)
     #
     #     return payment
 
@@ -166,15 +164,12 @@ async def refund_payment(
 
     if refund.status == "succeeded":
         payment.status = PaymentStatus.refunded
-        await db.commit()
-        await db.refresh(payment)
-
         user_result = await db.execute(select(User).filter(User.id == current_user_id))
         user = user_result.scalars().first()
         if user:
-            background_tasks.add_task(
-                email_sender.send_refund_email, user.email, payment.amount
-            )
+            enqueue_email(db, EmailKind.refund, user.email, amount=str(payment.amount))
+        await db.commit()
+        await db.refresh(payment)
 
         return payment
 
@@ -238,9 +233,7 @@ async def get_admin_payment_history(
 @router.post("/stripe/webhook/")
 async def stripe_webhook(
     request: Request,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    email_sender: EmailSenderInterface = Depends(get_email_notificator),
 ):
     payload = await request.body()
     sig_header = request.headers.get("Stripe-Signature")
@@ -269,7 +262,7 @@ async def stripe_webhook(
     async def update_payment_status(
         external_id: str,
         new_status: PaymentStatus,
-        notify_func,
+        email_kind: EmailKind,
     ):
         result = await db.execute(
             select(Payment)
@@ -279,25 +272,24 @@ async def stripe_webhook(
         payment = result.scalars().first()
 
         payment.status = new_status
+        enqueue_email(
+            db, email_kind, payment.user.email, amount=str(payment.amount)
+        )
         await db.commit()
-        user_email = payment.user.email
-        amount = payment.amount
-
-        background_tasks.add_task(notify_func, user_email, amount)
 
     if event_type == "payment_intent.succeeded":
         await update_payment_status(
-            data["id"], PaymentStatus.successful, email_sender.send_payment_email
+            data["id"], PaymentStatus.successful, EmailKind.payment
         )
     elif event_type == "payment_intent.canceled":
         await update_payment_status(
-            data["id"], PaymentStatus.canceled, email_sender.send_cancellation_email
+            data["id"], PaymentStatus.canceled, EmailKind.cancellation
         )
     elif event_type == "charge.refunded":
         await update_payment_status(
             data["payment_intent"],
             PaymentStatus.refunded,
-            email_sender.send_refund_email,
+            EmailKind.refund,
         )
 
     return {"status": "success"}
@@ -10,6 +10,7 @@ from .accounts import (
     PasswordChangeRequestSchema,
     TokenRefreshRequestSchema,
     TokenRefreshResponseSchema,
+    TokenCacheStatsSchema,
 )
 from .profiles import ProfileCreateSchema, ProfileResponseSchema
 from .movies import (
@@ -18,12 +19,20 @@ from .movies import (
     StarSchema,
     CertificationSchema,
     CommentSchema,
+    CommentListItemSchema,
+    CommentListResponseSchema,
+    AnswerListResponseSchema,
     MovieBaseSchema,
     MovieDetailSchema,
     MovieListItemSchema,
     MovieListResponseSchema,
+    MovieFilterSchema,
     MovieCreateSchema,
+    MovieImportSchema,
+    MovieImportReportSchema,
+    MovieExportSchema,
     MovieUpdateSchema,
+    CatalogCacheStatsSchema,
 )
 from .carts import (
     MovieInCartSchema,
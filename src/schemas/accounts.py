@@ -74,4 +74,14 @@ class TokenRefreshRequestSchema(BaseModel):
 
 class TokenRefreshResponseSchema(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str = "bearer"
+
+
+class TokenCacheStatsSchema(BaseModel):
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    hit_ratio: float = 0.0
+    entries: int = 0
+    max_entries: int = 0
@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import Optional, List
+from fastapi import Query
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 
@@ -48,6 +49,25 @@ class CommentSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AnswerListResponseSchema(BaseModel):
+    answers: List[AnswerCommentSchema]
+    next_cursor: Optional[str] = None
+
+
+class CommentListItemSchema(BaseModel):
+    id: int
+    user_id: int
+    comment: str
+    answer_count: int = 0
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CommentListResponseSchema(BaseModel):
+    comments: List[CommentListItemSchema]
+    next_cursor: Optional[str] = None
+
+
 class MovieBaseSchema(BaseModel):
     uuid: str | None = None
     name: str
@@ -78,7 +98,6 @@ class MovieDetailSchema(MovieBaseSchema):
     stars: list[StarSchema]
     directors: list[DirectorSchema]
     certification: CertificationSchema
-    comments: list[CommentSchema]
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -100,12 +119,52 @@ class MovieListResponseSchema(BaseModel):
     movies: List[MovieListItemSchema]
     prev_page: Optional[str]
     next_page: Optional[str]
-    total_pages: int
-    total_items: int
+    total_pages: Optional[int] = None
+    total_items: Optional[int] = None
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class MovieFilterSchema(BaseModel):
+    year: int | None = None
+    min_imdb: float | None = None
+    max_imdb: float | None = None
+    genre: str | None = None
+    director: str | None = None
+    star: str | None = None
+    search: str | None = None
+    sort_by: str | None = None
+
+    @classmethod
+    def from_query(
+        cls,
+        year: int | None = Query(None, description="Filter by year"),
+        min_imdb: float | None = Query(None, description="Filter by min_imdb"),
+        max_imdb: float | None = Query(None, description="Filter by max_imdb"),
+        genre: str | None = Query(None, description="Filter by genre name"),
+        director: str | None = Query(None, description="Filter by director name"),
+        star: str | None = Query(None, description="Filter by star name"),
+        search: str | None = Query(
+            None, description="Search by title, description, actor or director"
+        ),
+        sort_by: str | None = Query(
+            None, description="Sort by 'price', 'year', 'votes'"
+        ),
+    ) -> "MovieFilterSchema":
+        return cls(
+            year=year,
+            min_imdb=min_imdb,
+            max_imdb=max_imdb,
+            genre=genre,
+            director=director,
+            star=star,
+            search=search,
+            sort_by=sort_by,
+        )
+
+
 class MovieCreateSchema(BaseModel):
     uuid: str | None = None
     name: str
@@ -132,6 +191,73 @@ class MovieCreateSchema(BaseModel):
         return [item.title() for item in value]
 
 
+class MovieImportSchema(MovieCreateSchema):
+    likes: int = 0
+    dislikes: int = 0
+
+
+class MovieImportReportSchema(BaseModel):
+    created: int
+    skipped: int
+    failed: int
+    errors: list[str]
+    seconds: float
+    rows_per_second: float
+
+
+class MovieExportSchema(BaseModel):
+    id: int
+    uuid: str
+    name: str
+    year: int
+    time: int
+    imdb: float
+    votes: int
+    rating_average: float
+    like_count: int
+    dislike_count: int
+    meta_score: float | None = None
+    gross: float | None = None
+    description: str
+    price: float
+    certification: str
+    genres: list[str]
+    stars: list[str]
+    directors: list[str]
+    updated_at: datetime
+
+    @classmethod
+    def from_movie(cls, movie) -> "MovieExportSchema":
+        return cls(
+            id=movie.id,
+            uuid=movie.uuid,
+            name=movie.name,
+            year=movie.year,
+            time=movie.time,
+            imdb=movie.imdb,
+            votes=movie.votes,
+            rating_average=movie.rating_average,
+            like_count=movie.like_count,
+            dislike_count=movie.dislike_count,
+            meta_score=movie.meta_score,
+            gross=movie.gross,
+            description=movie.description,
+            price=movie.price,
+            certification=movie.certification.name,
+            genres=[genre.name for genre in movie.genres],
+            stars=[star.name for star in movie.stars],
+            directors=[director.name for director in movie.directors],
+            updated_at=movie.updated_at,
+        )
+
+
+class CatalogCacheStatsSchema(BaseModel):
+    hits: int
+    misses: int
+    hit_ratio: float
+    local_entries: int
+
+
 class MovieUpdateSchema(BaseModel):
     name: str | None = None
     year: int | None = None
@@ -0,0 +1,10 @@
+from src.search.interfaces import MovieSearchEngineInterface
+from src.search.postgres import PostgresMovieSearchEngine
+from src.search.memory import InMemoryMovieSearchEngine
+from src.search.names import NameResolver
+from src.search.filters import MovieQuery, MovieQueryBuilder
+from src.search.dependencies import (
+    get_movie_search_engine,
+    get_name_resolver,
+    get_movie_query_builder,
+)
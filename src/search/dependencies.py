@@ -0,0 +1,42 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config import get_settings, shared_instance, BaseAppSettings
+from src.database import get_db
+from src.search.filters import MovieQueryBuilder
+from src.search.interfaces import MovieSearchEngineInterface
+from src.search.memory import InMemoryMovieSearchEngine
+from src.search.names import NameResolver
+from src.search.postgres import PostgresMovieSearchEngine
+
+
+def get_movie_search_engine(
+    db: AsyncSession = Depends(get_db),
+    settings: BaseAppSettings = Depends(get_settings),
+) -> MovieSearchEngineInterface:
+    if db.get_bind().dialect.name == "postgresql":
+        return shared_instance(
+            "postgres_search_engine", settings, PostgresMovieSearchEngine
+        )
+    return shared_instance(
+        "in_memory_search_engine", settings, InMemoryMovieSearchEngine
+    )
+
+
+def get_name_resolver(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> NameResolver:
+    return shared_instance(
+        "name_resolver",
+        settings,
+        lambda: NameResolver(
+            similarity_threshold=settings.NAME_FILTER_SIMILARITY_THRESHOLD,
+            candidate_limit=settings.NAME_FILTER_CANDIDATE_LIMIT,
+        ),
+    )
+
+
+def get_movie_query_builder(
+    search_engine: MovieSearchEngineInterface = Depends(get_movie_search_engine),
+    name_resolver: NameResolver = Depends(get_name_resolver),
+) -> MovieQueryBuilder:
+    return MovieQueryBuilder(search_engine=search_engine, name_resolver=name_resolver)
@@ -0,0 +1,118 @@
+from typing import NamedTuple
+from sqlalchemy import Select, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+from src.database.models import (
+    Movie,
+    Genre,
+    Director,
+    Star,
+    MoviesGenres,
+    MoviesDirectors,
+    MoviesStars,
+)
+from src.schemas.movies import MovieFilterSchema
+from src.search.interfaces import MovieSearchEngineInterface
+from src.search.names import NameResolver
+
+
+class MovieQuery(NamedTuple):
+    stmt: Select
+    sort_key: str
+    sort_column: ColumnElement | None
+
+
+class MovieQueryBuilder:
+    """
+    Single place where movie list filters, search and ordering are applied.
+
+    Relationship filters are `EXISTS` semi-joins against the association
+    tables, so a movie appears once no matter how many genres, directors
+    or stars match, and LIMIT/COUNT operate on movies rather than on
+    movies x cast rows.
+    """
+
+    SORT_FIELDS = {
+        "price": Movie.price,
+        "year": Movie.year,
+        "votes": Movie.votes,
+    }
+    # Sort keys backed by vote counters, which change without a catalog
+    # version bump and so cannot be validated with the catalog stamp.
+    COUNTER_SORT_FIELDS = frozenset({"votes"})
+
+    def __init__(
+        self,
+        search_engine: MovieSearchEngineInterface,
+        name_resolver: NameResolver,
+    ):
+        self._search_engine = search_engine
+        self._name_resolver = name_resolver
+
+    async def build(
+        self,
+        db: AsyncSession,
+        filters: MovieFilterSchema,
+        stmt: Select | None = None,
+    ) -> MovieQuery:
+        """
+        Apply `filters` to `stmt` (a `select(Movie)` by default).
+
+        When `search` is set the statement gets an extra `search_rank`
+        column, which is also the sort key unless `sort_by` is given.
+        """
+        if stmt is None:
+            stmt = select(Movie)
+
+        if filters.year is not None:
+            stmt = stmt.where(Movie.year == filters.year)
+        if filters.min_imdb is not None:
+            stmt = stmt.where(Movie.imdb >= filters.min_imdb)
+        if filters.max_imdb is not None:
+            stmt = stmt.where(Movie.imdb <= filters.max_imdb)
+        if filters.director:
+            director_id_query = await self._name_resolver.resolve(
+                db, Director, filters.director
+            )
+            stmt = stmt.where(
+                exists().where(
+                    MoviesDirectors.c.movie_id == Movie.id,
+                    MoviesDirectors.c.director_id.in_(director_id_query),
+                )
+            )
+        if filters.star:
+            star_id_query = await self._name_resolver.resolve(db, Star, filters.star)
+            stmt = stmt.where(
+                exists().where(
+                    MoviesStars.c.movie_id == Movie.id,
+                    MoviesStars.c.star_id.in_(star_id_query),
+                )
+            )
+        if filters.genre:
+            genre_id_query = await self._name_resolver.resolve(db, Genre, filters.genre)
+            stmt = stmt.where(
+                exists().where(
+                    MoviesGenres.c.movie_id == Movie.id,
+                    MoviesGenres.c.genre_id.in_(genre_id_query),
+                )
+            )
+
+        sort_column = self.SORT_FIELDS.get(filters.sort_by)
+        sort_key = filters.sort_by if sort_column is not None else "id"
+
+        if filters.search:
+            search_clause, search_rank = await self._search_engine.match(
+                db, filters.search
+            )
+            stmt = stmt.where(search_clause).add_columns(
+                search_rank.label("search_rank")
+            )
+            if sort_column is None:
+                sort_column, sort_key = search_rank, "search_rank"
+
+        if sort_column is not None:
+            stmt = stmt.order_by(sort_column.desc(), Movie.id.desc())
+        else:
+            stmt = stmt.order_by(*Movie.default_order_by())
+
+        return MovieQuery(stmt=stmt, sort_key=sort_key, sort_column=sort_column)
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+
+
+class MovieSearchEngineInterface(ABC):
+
+    @abstractmethod
+    async def index_movie(self, db: AsyncSession, movie_id: int) -> None:
+        pass
+
+    @abstractmethod
+    async def index_movies(self, db: AsyncSession, movie_ids: list[int]) -> None:
+        pass
+
+    @abstractmethod
+    async def remove_movie(self, db: AsyncSession, movie_id: int) -> None:
+        pass
+
+    @abstractmethod
+    async def match(
+        self, db: AsyncSession, query: str
+    ) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+        pass
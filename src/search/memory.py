@@ -0,0 +1,120 @@
+import asyncio
+import re
+from collections import defaultdict
+from sqlalchemy import case, false, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql import ColumnElement
+from src.database.models import Movie
+from src.search.interfaces import MovieSearchEngineInterface
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str | None) -> list[str]:
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class InMemoryMovieSearchEngine(MovieSearchEngineInterface):
+    """
+    Pure-Python inverted index used when the database has no full-text search.
+
+    Term weights mirror the Postgres engine: title over stars and directors
+    over description. A query matches movies containing every query term
+    and is ranked by the summed term weights.
+    """
+
+    _NAME_WEIGHT = 1.0
+    _PEOPLE_WEIGHT = 0.4
+    _DESCRIPTION_WEIGHT = 0.1
+
+    def __init__(self):
+        self._postings: dict[str, dict[int, float]] = defaultdict(dict)
+        self._documents: dict[int, set[str]] = {}
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    async def index_movie(self, db: AsyncSession, movie_id: int) -> None:
+        if not self._loaded:
+            return
+        result = await db.execute(self._movies_stmt().where(Movie.id == movie_id))
+        movie = result.scalar_one_or_none()
+        self._remove(movie_id)
+        if movie is not None:
+            self._add(movie)
+
+    async def index_movies(self, db: AsyncSession, movie_ids: list[int]) -> None:
+        if not self._loaded:
+            return
+        result = await db.execute(self._movies_stmt().where(Movie.id.in_(movie_ids)))
+        for movie_id in movie_ids:
+            self._remove(movie_id)
+        for movie in result.scalars():
+            self._add(movie)
+
+    async def remove_movie(self, db: AsyncSession, movie_id: int) -> None:
+        self._remove(movie_id)
+
+    async def match(
+        self, db: AsyncSession, query: str
+    ) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+        await self._ensure_loaded(db)
+
+        terms = set(tokenize(query))
+        scores: dict[int, float] | None = None
+        for term in terms:
+            postings = self._postings.get(term, {})
+            if scores is None:
+                scores = dict(postings)
+            else:
+                scores = {
+                    movie_id: score + postings[movie_id]
+                    for movie_id, score in scores.items()
+                    if movie_id in postings
+                }
+            if not scores:
+                break
+
+        if not scores:
+            return false(), literal(0.0)
+        return Movie.id.in_(list(scores)), case(scores, value=Movie.id, else_=0.0)
+
+    async def _ensure_loaded(self, db: AsyncSession) -> None:
+        if self._loaded:
+            return
+        async with self._lock:
+            if self._loaded:
+                return
+            result = await db.execute(self._movies_stmt())
+            for movie in result.scalars():
+                self._add(movie)
+            self._loaded = True
+
+    @staticmethod
+    def _movies_stmt():
+        return select(Movie).options(
+            selectinload(Movie.stars), selectinload(Movie.directors)
+        )
+
+    def _add(self, movie: Movie) -> None:
+        weights: dict[str, float] = defaultdict(float)
+        for token in tokenize(movie.name):
+            weights[token] += self._NAME_WEIGHT
+        for person in [*movie.stars, *movie.directors]:
+            for token in tokenize(person.name):
+                weights[token] += self._PEOPLE_WEIGHT
+        for token in tokenize(movie.description):
+            weights[token] += self._DESCRIPTION_WEIGHT
+
+        for token, weight in weights.items():
+            self._postings[token][movie.id] = weight
+        self._documents[movie.id] = set(weights)
+
+    def _remove(self, movie_id: int) -> None:
+        for token in self._documents.pop(movie_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(movie_id, None)
+                if not postings:
+                    del self._postings[token]
@@ -0,0 +1,57 @@
+from sqlalchemy import Select, false, func, not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.models import Director, Genre, Star
+
+
+NamedModel = type[Director] | type[Genre] | type[Star]
+
+
+class NameResolver:
+    """
+    Resolves free-text genre, director and star filters to an id subquery.
+
+    Every name containing the text matches, with no cap, exactly as the
+    plain ILIKE filter did. On Postgres, names that only match by word
+    similarity (`%>`, served by the `gin_trgm_ops` indexes on `name`) are
+    added as well, so "nolen" still resolves to "Christopher Nolan"; only
+    these fuzzy matches are ranked and capped at `candidate_limit`. Movies
+    are then filtered with `IN (subquery)` against the association tables.
+    """
+
+    def __init__(self, similarity_threshold: float, candidate_limit: int):
+        self._similarity_threshold = similarity_threshold
+        self._candidate_limit = candidate_limit
+
+    async def resolve(self, db: AsyncSession, model: NamedModel, text: str) -> Select:
+        """
+        Return a SELECT of the ids of `model` rows matching `text`.
+
+        On Postgres the similarity threshold is set for the current
+        transaction, so the returned statement must run in the same one.
+        """
+        text = text.strip()
+        if not text:
+            return select(model.id).where(false())
+
+        substring = model.name.ilike(f"%{text}%")
+        stmt = select(model.id).where(substring)
+        if db.get_bind().dialect.name != "postgresql":
+            return stmt
+
+        await db.execute(
+            select(
+                func.set_config(
+                    "pg_trgm.word_similarity_threshold",
+                    str(self._similarity_threshold),
+                    True,
+                )
+            )
+        )
+        fuzzy = (
+            select(model.id)
+            .where(model.name.op("%>")(text), not_(substring))
+            .order_by(func.word_similarity(text, model.name).desc())
+            .limit(self._candidate_limit)
+            .subquery()
+        )
+        return stmt.union(select(fuzzy.c.id))
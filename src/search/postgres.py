@@ -0,0 +1,61 @@
+from sqlalchemy import func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import to_tsvector, websearch_to_tsquery
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+from src.database.models import Movie, Star, Director, MoviesStars, MoviesDirectors
+from src.search.interfaces import MovieSearchEngineInterface
+
+
+class PostgresMovieSearchEngine(MovieSearchEngineInterface):
+    """
+    Full-text search over the weighted `movies.search_vector` column.
+
+    The vector is served by a GIN index and weights the title (A) over
+    stars and directors (B) over the description (C).
+    """
+
+    _TEXT_SEARCH_CONFIG = "english"
+
+    async def index_movie(self, db: AsyncSession, movie_id: int) -> None:
+        await self.index_movies(db, [movie_id])
+
+    async def index_movies(self, db: AsyncSession, movie_ids: list[int]) -> None:
+        stars = (
+            select(func.string_agg(Star.name, " "))
+            .join(MoviesStars, MoviesStars.c.star_id == Star.id)
+            .where(MoviesStars.c.movie_id == Movie.id)
+            .scalar_subquery()
+        )
+        directors = (
+            select(func.string_agg(Director.name, " "))
+            .join(MoviesDirectors, MoviesDirectors.c.director_id == Director.id)
+            .where(MoviesDirectors.c.movie_id == Movie.id)
+            .scalar_subquery()
+        )
+        document = (
+            self._weighted(Movie.name, "A")
+            .op("||")(self._weighted(func.concat_ws(" ", stars, directors), "B"))
+            .op("||")(self._weighted(Movie.description, "C"))
+        )
+        await db.execute(
+            update(Movie).where(Movie.id.in_(movie_ids)).values(search_vector=document)
+        )
+
+    async def remove_movie(self, db: AsyncSession, movie_id: int) -> None:
+        # The vector lives on the movie row and is deleted with it.
+        return None
+
+    async def match(
+        self, db: AsyncSession, query: str
+    ) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+        ts_query = websearch_to_tsquery(self._TEXT_SEARCH_CONFIG, query)
+        return (
+            Movie.search_vector.bool_op("@@")(ts_query),
+            func.ts_rank_cd(Movie.search_vector, ts_query),
+        )
+
+    def _weighted(self, text: ColumnElement, weight: str) -> ColumnElement:
+        return func.setweight(
+            to_tsvector(self._TEXT_SEARCH_CONFIG, func.coalesce(text, "")),
+            literal_column(f"'{weight}'"),
+        )
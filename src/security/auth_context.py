@@ -0,0 +1,86 @@
+from typing import NamedTuple
+from fastapi import Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+from src.cache import InMemoryLRUCache
+from src.config import (
+    get_settings,
+    get_current_user_id,
+    shared_instance,
+    BaseAppSettings,
+)
+from src.database import get_db
+from src.database.models import User, UserGroup, UserGroupEnum
+
+
+class AuthContext(NamedTuple):
+    user_id: int
+    group: UserGroupEnum
+    is_active: bool
+
+    @property
+    def is_admin(self) -> bool:
+        return self.group == UserGroupEnum.ADMIN
+
+    @property
+    def is_moderator(self) -> bool:
+        return self.group in (UserGroupEnum.MODERATOR, UserGroupEnum.ADMIN)
+
+
+def get_auth_context_cache(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> InMemoryLRUCache:
+    """
+    Short-lived process-local cache of auth contexts keyed by user id.
+
+    Entries must be deleted whenever a user's group or activation state
+    changes; other workers pick up the change once the TTL expires.
+    """
+    return shared_instance(
+        "auth_context_cache",
+        settings,
+        lambda: InMemoryLRUCache(
+            max_entries=settings.AUTH_CONTEXT_CACHE_SIZE,
+            ttl_seconds=settings.AUTH_CONTEXT_TTL_SECONDS,
+        ),
+    )
+
+
+async def get_auth_context(
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+    cache: InMemoryLRUCache = Depends(get_auth_context_cache),
+) -> AuthContext:
+    """
+    Resolve the current user's id, group and activation state.
+
+    FastAPI reuses the result within a request, and the cache serves it
+    without touching the database for repeat requests.
+    """
+    context = cache.get(user_id)
+    if context is None:
+        result = await db.execute(
+            select(UserGroup.name, User.is_active)
+            .join(User.group)
+            .where(User.id == user_id)
+        )
+        row = result.first()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+        context = AuthContext(user_id=user_id, group=row.name, is_active=row.is_active)
+        cache.set(user_id, context)
+    return context
+
+
+async def get_moderator_context(
+    context: AuthContext = Depends(get_auth_context),
+) -> AuthContext:
+    if not context.is_moderator:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have access to perform this action.",
+        )
+    return context
@@ -28,3 +28,20 @@ class JWTAuthManagerInterface(ABC):
     @abstractmethod
     def verify_access_token_or_raise(self, token: str) -> None:
         pass
+
+    @abstractmethod
+    def evict_cached_access_tokens(self, user_id: int) -> None:
+        """
+        Drop the user's verified tokens from this process's cache.
+
+        This is not revocation: an evicted token still verifies until it
+        expires, and caches of other workers are untouched.
+        """
+        pass
+
+    @abstractmethod
+    def access_token_cache_stats(self) -> Optional[dict]:
+        """
+        Return this process's cache size and hit ratio, or None when disabled.
+        """
+        pass
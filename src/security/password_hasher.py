@@ -0,0 +1,66 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+from passlib.context import CryptContext
+from src.exceptions import PasswordHasherBusyError
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification in a bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so the event loop keeps serving
+    other requests. At most max_pending calls may be queued or running at
+    once. Past that, calls fail fast with PasswordHasherBusyError instead of
+    piling up behind a saturated pool.
+    """
+
+    def __init__(self, rounds: int, max_workers: int, max_pending: int):
+        self._context = CryptContext(
+            schemes=["bcrypt"],
+            bcrypt__rounds=rounds,
+            bcrypt__min_rounds=rounds,
+            bcrypt__max_rounds=rounds,
+            deprecated="auto",
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._max_pending = max_pending
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._pending >= self._max_pending:
+            raise PasswordHasherBusyError
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, raw_password: str) -> str:
+        return await self._run(self._context.hash, raw_password)
+
+    async def verify(self, raw_password: str, hashed_password: str) -> bool:
+        return await self._run(self._context.verify, raw_password, hashed_password)
+
+    async def verify_and_update(
+        self, raw_password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Verify a password and return a new hash when the stored one was
+        created with a different cost than the configured one.
+        """
+        return await self._run(
+            self._context.verify_and_update, raw_password, hashed_password
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
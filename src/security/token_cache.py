@@ -0,0 +1,74 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of decoded token payloads keyed by the SHA-256 of the token.
+
+    Entries are only added after the signature has been verified and are
+    dropped once their "exp" claim has passed, so a cache hit never extends
+    a token's lifetime.
+    """
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        """
+        Return a copy of the cached payload, or None on a miss.
+
+        An expired entry is evicted and reported as a miss, leaving the
+        caller to decode the token and raise the usual expiry error.
+        """
+        key = self._key(token)
+        payload = self._entries.get(key)
+        if payload is None or payload["exp"] < int(time.time()):
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(payload)
+
+    def set(self, token: str, payload: dict) -> None:
+        if "exp" not in payload:
+            return
+        key = self._key(token)
+        self._entries[key] = dict(payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def evict(self, token: str) -> None:
+        self._entries.pop(self._key(token), None)
+
+    def evict_user(self, user_id: int) -> None:
+        stale = [
+            key
+            for key, payload in self._entries.items()
+            if payload.get("user_id") == user_id
+        ]
+        for key in stale:
+            del self._entries[key]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+        }
@@ -3,6 +3,7 @@ from typing import Optional
 from jose import jwt, JWTError, ExpiredSignatureError
 from src.exceptions import TokenExpiredError, InvalidTokenError
 from src.security.interfaces import JWTAuthManagerInterface
+from src.security.token_cache import VerifiedTokenCache
 
 
 class JWTAuthManager(JWTAuthManagerInterface):
@@ -10,10 +11,17 @@ class JWTAuthManager(JWTAuthManagerInterface):
     _ACCESS_KEY_TIMEDELTA_MINUTES = 60
     _REFRESH_KEY_TIMEDELTA_MINUTES = 60 * 24 * 7
 
-    def __init__(self, secret_key_access: str, secret_key_refresh: str, algorithm: str):
+    def __init__(
+        self,
+        secret_key_access: str,
+        secret_key_refresh: str,
+        algorithm: str,
+        access_token_cache: Optional[VerifiedTokenCache] = None,
+    ):
         self._secret_key_access = secret_key_access
         self._secret_key_refresh = secret_key_refresh
         self._algorithm = algorithm
+        self._access_token_cache = access_token_cache
 
     def _create_token(
         self, data: dict, secret_key: str, expires_delta: timedelta
@@ -43,14 +51,21 @@ class JWTAuthManager(JWTAuthManagerInterface):
         )
 
     def decode_access_token(self, token: str) -> dict:
+        if self._access_token_cache is not None:
+            payload = self._access_token_cache.get(token)
+            if payload is not None:
+                return payload
         try:
-            return jwt.decode(
+            payload = jwt.decode(
                 token, self._secret_key_access, algorithms=[self._algorithm]
             )
         except ExpiredSignatureError:
             raise TokenExpiredError
         except JWTError:
             raise InvalidTokenError
+        if self._access_token_cache is not None:
+            self._access_token_cache.set(token, payload)
+        return payload
 
     def decode_refresh_token(self, token: str) -> dict:
         try:
@@ -67,3 +82,12 @@ class JWTAuthManager(JWTAuthManagerInterface):
 
     def verify_access_token_or_raise(self, token: str) -> None:
         self.decode_access_token(token)
+
+    def evict_cached_access_tokens(self, user_id: int) -> None:
+        if self._access_token_cache is not None:
+            self._access_token_cache.evict_user(user_id)
+
+    def access_token_cache_stats(self) -> Optional[dict]:
+        if self._access_token_cache is None:
+            return None
+        return self._access_token_cache.stats()
@@ -0,0 +1,2 @@
+from src.tasks.emails import drain_email_outbox, purge_email_outbox, purge_finished_emails
+from src.tasks.tokens import delete_expired_tokens, purge_expired_tokens
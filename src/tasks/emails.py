@@ -0,0 +1,129 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from src.config import get_settings, build_email_sender, shared_instance
+from src.config.celery import celery_app
+from src.database import SyncSessionLocal
+from src.database.models import EmailOutbox, OutboxStatus
+from src.notifications.outbox import OutboxDispatcher
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on batches per task run, so one run cannot monopolise the worker.
+_MAX_BATCHES_PER_RUN = 20
+
+
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    """
+    Return this worker process's dispatcher, with its pooled EmailSender.
+    """
+    settings = get_settings()
+    return shared_instance(
+        "outbox_dispatcher",
+        settings,
+        lambda: OutboxDispatcher(
+            session_factory=SyncSessionLocal,
+            sender=build_email_sender(settings),
+            batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+            backoff_seconds=settings.EMAIL_OUTBOX_BACKOFF_SECONDS,
+            backoff_max_seconds=settings.EMAIL_OUTBOX_BACKOFF_MAX_SECONDS,
+            domain_concurrency=settings.EMAIL_OUTBOX_DOMAIN_CONCURRENCY,
+            lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+        ),
+    )
+
+
+@worker_process_init.connect
+def init_outbox_dispatcher(**kwargs) -> None:
+    """
+    Build the dispatcher in each forked worker so no SMTP session crosses a fork.
+    """
+    get_outbox_dispatcher()
+
+
+@worker_process_shutdown.connect
+def close_outbox_dispatcher(**kwargs) -> None:
+    get_outbox_dispatcher().close()
+
+
+@celery_app.task(name="src.tasks.emails.drain_email_outbox", ignore_result=True)
+def drain_email_outbox() -> int:
+    """
+    Send due outbox emails until a partial batch shows the queue is drained.
+    """
+    dispatcher = get_outbox_dispatcher()
+    sent = 0
+    for _ in range(_MAX_BATCHES_PER_RUN):
+        claimed = dispatcher.run_batch()
+        sent += claimed
+        if claimed < dispatcher.batch_size:
+            break
+    return sent
+
+
+def purge_finished_emails(
+    session_factory: Callable[[], Session],
+    batch_size: int,
+    retention: dict[OutboxStatus, timedelta],
+) -> dict[str, int]:
+    """
+    Delete sent and dead outbox rows that finished longer ago than `retention`.
+
+    Finished rows carry their completion time in next_attempt_at, so each
+    batch is picked through the (status, next_attempt_at) index; like the
+    token purge, every batch deletes at most `batch_size` rows and commits
+    on its own.
+
+    :return: Rows purged per status.
+    """
+    now = datetime.now(timezone.utc)
+    purged = {}
+    for outbox_status, keep_for in retention.items():
+        total = 0
+        while True:
+            finished_ids = (
+                select(EmailOutbox.id)
+                .where(
+                    EmailOutbox.status == outbox_status,
+                    EmailOutbox.next_attempt_at < now - keep_for,
+                )
+                .limit(batch_size)
+            )
+            with session_factory() as db:
+                result = db.execute(
+                    delete(EmailOutbox)
+                    .where(EmailOutbox.id.in_(finished_ids))
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                break
+        purged[outbox_status.value] = total
+    return purged
+
+
+@celery_app.task(name="src.tasks.emails.purge_email_outbox")
+def purge_email_outbox() -> dict[str, int]:
+    """
+    Hourly purge of finished outbox rows; the per-status counts are kept as
+    the task result and logged for monitoring.
+    """
+    settings = get_settings()
+    purged = purge_finished_emails(
+        SyncSessionLocal,
+        batch_size=settings.EMAIL_OUTBOX_PURGE_BATCH_SIZE,
+        retention={
+            OutboxStatus.sent: timedelta(days=settings.EMAIL_OUTBOX_SENT_RETENTION_DAYS),
+            OutboxStatus.dead: timedelta(days=settings.EMAIL_OUTBOX_DEAD_RETENTION_DAYS),
+        },
+    )
+    logger.info(
+        "Purged finished outbox emails: %s",
+        ", ".join(f"{status}={count}" for status, count in purged.items()),
+    )
+    return purged
@@ -0,0 +1,56 @@
+"""
+Per-request cost of resolving settings and the shared client dependencies.
+
+Times get_settings, get_jwt_auth_manager and get_s3_storage_client as one
+request resolves them. The "per-request" run reads the settings afresh
+every time, which makes the registry build new clients as well, as the
+app did before the settings and clients were shared; the "shared" run
+uses the cached settings and the process-wide instances.
+
+    python -m src.tests.benchmarks.bench_dependencies --iterations 2000
+"""
+import argparse
+import asyncio
+import os
+import timeit
+
+os.environ.setdefault("SECRET_KEY_ACCESS", "SECRET_KEY_ACCESS")
+os.environ.setdefault("SECRET_KEY_REFRESH", "SECRET_KEY_REFRESH")
+
+from src.config import (
+    close_dependencies,
+    get_jwt_auth_manager,
+    get_s3_storage_client,
+    get_settings,
+)
+
+
+def resolve_per_request() -> None:
+    settings = get_settings.__wrapped__()
+    get_jwt_auth_manager(settings)
+    get_s3_storage_client(settings)
+
+
+def resolve_shared() -> None:
+    settings = get_settings()
+    get_jwt_auth_manager(settings)
+    get_s3_storage_client(settings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    for name, resolve in (
+        ("per-request", resolve_per_request),
+        ("shared", resolve_shared),
+    ):
+        resolve()
+        seconds = timeit.timeit(resolve, number=args.iterations)
+        print(f"{name:>11}: {seconds / args.iterations * 1e6:10.1f} us per request")
+        asyncio.run(close_dependencies())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Login throughput under concurrency, with bcrypt on and off the event loop.
+
+Fires `--concurrency` simultaneous POST /accounts/login/ requests against
+the app (in-memory SQLite, rate limiting disabled) and reports logins per
+second and the longest event loop stall seen by a 5 ms ticker. The
+"inline" run verifies passwords on the event loop, as the app did before
+PasswordHasher; the "pool" run uses PasswordHasher.
+
+    python -m src.tests.benchmarks.bench_login --rounds 12 --concurrency 32
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("SECRET_KEY_ACCESS", "SECRET_KEY_ACCESS")
+os.environ.setdefault("SECRET_KEY_REFRESH", "SECRET_KEY_REFRESH")
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.config import get_password_hasher
+from src.database import get_db
+from src.database.base import Base
+from src.database.models import User, UserGroup, UserGroupEnum
+from src.main import app
+from src.rate_limiting import limit_auth_requests
+from src.security.password_hasher import PasswordHasher
+
+EMAIL, PASSWORD = "bench@example.com", "Bench-Passw0rd!"
+
+
+class InlinePasswordHasher(PasswordHasher):
+    """
+    Runs every hash on the calling thread, blocking the event loop.
+    """
+
+    async def _run(self, func, *args):
+        return func(*args)
+
+
+async def measure_stall(stop: asyncio.Event, gaps: list[float]) -> None:
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.005)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+async def run(hasher: PasswordHasher, concurrency: int) -> tuple[float, float]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        user = User(
+            email=EMAIL, group=UserGroup(name=UserGroupEnum.USER), is_active=True
+        )
+        user.set_hashed_password(await hasher.hash(PASSWORD))
+        db.add(user)
+        await db.commit()
+
+    async def get_bench_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_bench_db
+    app.dependency_overrides[get_password_hasher] = lambda: hasher
+    app.dependency_overrides[limit_auth_requests] = lambda: None
+
+    stop, gaps = asyncio.Event(), []
+    ticker = asyncio.create_task(measure_stall(stop, gaps))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await asyncio.sleep(0.02)
+        started = time.perf_counter()
+        responses = await asyncio.gather(
+            *(
+                client.post(
+                    "/accounts/login/", json={"email": EMAIL, "password": PASSWORD}
+                )
+                for _ in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+    statuses = {response.status_code for response in responses}
+    assert statuses == {201}, statuses
+    return concurrency / elapsed, max(gaps)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    args = parser.parse_args()
+
+    hashers = {
+        "inline": InlinePasswordHasher(args.rounds, 1, args.concurrency),
+        f"pool({args.workers})": PasswordHasher(
+            args.rounds, args.workers, args.concurrency
+        ),
+    }
+    for name, hasher in hashers.items():
+        throughput, stall = await run(hasher, args.concurrency)
+        hasher.close()
+        print(
+            f"{name:>10}: {throughput:6.1f} logins/s, "
+            f"max event loop stall {stall * 1000:6.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+"""
+Email throughput with a connection per message versus SMTPConnectionPool.
+
+Starts a local aiosmtpd sink that accepts any login, then sends
+`--messages` emails with up to `--concurrency` in flight: once opening,
+authenticating and quitting a session per message (what EmailSender did
+before the pool), and once through a pool of `--concurrency` sessions.
+
+    python -m src.tests.benchmarks.bench_smtp_pool --messages 400 --concurrency 20
+"""
+import argparse
+import asyncio
+import logging
+import socket
+import time
+from typing import Awaitable, Callable
+import aiosmtplib
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+from src.notifications.smtp_pool import SMTPConnectionPool
+
+MESSAGE = "Subject: Benchmark\r\n\r\nHello."
+
+# aiosmtpd logs a deprecation warning for every AUTH.
+logging.getLogger("mail.log").setLevel(logging.ERROR)
+
+
+class Sink:
+    def __init__(self):
+        self.delivered = 0
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.delivered += 1
+        return "250 OK"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def throughput(
+    send: Callable[[], Awaitable[None]], messages: int, concurrency: int
+) -> float:
+    slots = asyncio.Semaphore(concurrency)
+
+    async def send_one() -> None:
+        async with slots:
+            await send()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(send_one() for _ in range(messages)))
+    return messages / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    sink, port = Sink(), free_port()
+    controller = Controller(
+        sink,
+        hostname="127.0.0.1",
+        port=port,
+        auth_require_tls=False,
+        authenticator=lambda *_: AuthResult(success=True),
+    )
+    controller.start()
+    try:
+        async def per_message() -> None:
+            smtp = aiosmtplib.SMTP(hostname="127.0.0.1", port=port, start_tls=False)
+            await smtp.connect()
+            await smtp.login("bench", "bench")
+            await smtp.sendmail("from@example.com", ["to@example.com"], MESSAGE)
+            await smtp.quit()
+
+        pool = SMTPConnectionPool(
+            hostname="127.0.0.1",
+            port=port,
+            username="bench",
+            password="bench",
+            use_tls=False,
+            size=args.concurrency,
+            idle_timeout=60,
+        )
+
+        async def pooled() -> None:
+            await pool.send_message("from@example.com", ["to@example.com"], MESSAGE)
+
+        rate = await throughput(per_message, args.messages, args.concurrency)
+        print(f"connection per message: {rate:7.0f} msg/s")
+        rate = await throughput(pooled, args.messages, args.concurrency)
+        print(f"pooled (size {args.concurrency:>3}):     {rate:7.0f} msg/s")
+        await pool.close()
+    finally:
+        controller.stop()
+    print(f"delivered {sink.delivered} of {2 * args.messages}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
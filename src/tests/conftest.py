@@ -0,0 +1,78 @@
+import os
+
+os.environ.setdefault("SECRET_KEY_ACCESS", "SECRET_KEY_ACCESS")
+os.environ.setdefault("SECRET_KEY_REFRESH", "SECRET_KEY_REFRESH")
+
+import httpx
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.cache import CatalogCache, InMemoryLRUCache
+from src.config import (
+    close_dependencies,
+    get_catalog_cache,
+    get_jwt_auth_manager,
+    get_settings,
+)
+from src.database import get_db
+from src.database.base import Base
+from src.database.models import User, UserGroup, UserGroupEnum
+from src.main import app
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session_factory(db_engine):
+    return async_sessionmaker(db_engine, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture
+async def client(session_factory):
+    async def get_test_db():
+        async with session_factory() as session:
+            yield session
+
+    catalog_cache = CatalogCache(
+        local=InMemoryLRUCache(max_entries=100, ttl_seconds=60),
+        remote=None,
+        ttl_seconds=60,
+    )
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_catalog_cache] = lambda: catalog_cache
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+    # Shared instances such as the auth context cache must not leak between tests.
+    await close_dependencies()
+
+
+@pytest_asyncio.fixture
+async def auth_headers(session_factory):
+    """
+    Create an active user in the given group and return its bearer header.
+    """
+
+    async def create(group: UserGroupEnum) -> dict:
+        async with session_factory() as db:
+            user = User(
+                email=f"{group.value}@example.com",
+                group=UserGroup(name=group),
+                _hashed_password="hash",
+                is_active=True,
+            )
+            db.add(user)
+            await db.commit()
+        token = get_jwt_auth_manager(get_settings()).create_access_token(
+            {"user_id": user.id}
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    return create
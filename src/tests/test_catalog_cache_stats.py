@@ -0,0 +1,41 @@
+import pytest
+from src.database.models import Certification, Movie, UserGroupEnum
+
+
+@pytest.mark.asyncio
+async def test_admin_reads_catalog_cache_stats(client, session_factory, auth_headers):
+    headers = await auth_headers(UserGroupEnum.ADMIN)
+    async with session_factory() as db:
+        db.add(
+            Movie(
+                name="Heat",
+                year=1995,
+                time=170,
+                imdb=8.3,
+                description="A group of professional bank robbers.",
+                price=9.99,
+                certification=Certification(name="R"),
+            )
+        )
+        await db.commit()
+    await client.get("/movies/")
+    await client.get("/movies/")
+
+    response = await client.get("/movies/cache/stats/", headers=headers)
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "hits": 1,
+        "misses": 1,
+        "hit_ratio": 0.5,
+        "local_entries": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache_stats_are_admin_only(client, auth_headers):
+    headers = await auth_headers(UserGroupEnum.USER)
+
+    response = await client.get("/movies/cache/stats/", headers=headers)
+
+    assert response.status_code == 403
@@ -0,0 +1,119 @@
+import pytest
+from sqlalchemy import event, select, text
+from src.database.models import (
+    Certification,
+    Comment,
+    Director,
+    Genre,
+    Movie,
+    Star,
+    User,
+    UserGroup,
+    UserGroupEnum,
+)
+
+GENRES, DIRECTORS, STARS = 5, 3, 20
+
+
+async def create_movie(session_factory, comments: int) -> int:
+    async with session_factory() as db:
+        user = User(
+            email="viewer@example.com",
+            group=UserGroup(name=UserGroupEnum.USER),
+            _hashed_password="hash",
+            is_active=True,
+        )
+        movie = Movie(
+            name="Heat",
+            year=1995,
+            time=170,
+            imdb=8.3,
+            description="A group of professional bank robbers.",
+            price=9.99,
+            certification=Certification(name="R"),
+            genres=[Genre(name=f"Genre {i}") for i in range(GENRES)],
+            directors=[Director(name=f"Director {i}") for i in range(DIRECTORS)],
+            stars=[Star(name=f"Star {i}") for i in range(STARS)],
+        )
+        movie.comments = [
+            Comment(user=user, comment=f"Comment {i}") for i in range(comments)
+        ]
+        db.add(movie)
+        await db.commit()
+        return movie.id
+
+
+async def rows_fetched_by(client, db_engine, url: str) -> tuple[int, int]:
+    """
+    Request `url` and return the number of SELECTs it ran and their total rows.
+
+    Every captured SELECT is replayed after the request, so the row count is
+    what the database returned rather than what the ORM kept.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        response = await client.get(url)
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", capture)
+    assert response.status_code == 200, response.text
+
+    rows = 0
+    async with db_engine.connect() as connection:
+        for statement, parameters in statements:
+            result = await connection.exec_driver_sql(statement, parameters)
+            rows += len(result.fetchall())
+    return len(statements), rows
+
+
+@pytest.mark.asyncio
+async def test_movie_detail_fetches_one_row_per_related_item(
+    client, db_engine, session_factory
+):
+    movie_id = await create_movie(session_factory, comments=50)
+
+    queries, rows = await rows_fetched_by(client, db_engine, f"/movies/{movie_id}/")
+
+    # version check + movie with certification + one SELECT per collection
+    assert queries == 5
+    assert rows == 2 + GENRES + DIRECTORS + STARS
+
+
+@pytest.mark.asyncio
+async def test_movie_detail_rows_do_not_grow_with_comments(
+    client, db_engine, session_factory
+):
+    movie_id = await create_movie(session_factory, comments=200)
+
+    _, rows = await rows_fetched_by(client, db_engine, f"/movies/{movie_id}/")
+    async with db_engine.connect() as connection:
+        stored = await connection.scalar(text("SELECT COUNT(*) FROM comments"))
+
+    assert stored == 200
+    assert rows == 2 + GENRES + DIRECTORS + STARS
+
+
+@pytest.mark.asyncio
+async def test_each_update_bumps_the_detail_etag(
+    client, session_factory, auth_headers
+):
+    movie_id = await create_movie(session_factory, comments=0)
+    headers = await auth_headers(UserGroupEnum.MODERATOR)
+    etags = [(await client.get(f"/movies/{movie_id}/")).headers["ETag"]]
+
+    for price in (10.99, 11.99):
+        response = await client.patch(
+            f"/movies/{movie_id}/", json={"price": price}, headers=headers
+        )
+        assert response.status_code == 200, response.text
+        etags.append((await client.get(f"/movies/{movie_id}/")).headers["ETag"])
+
+    async with session_factory() as db:
+        version = await db.scalar(select(Movie.version).where(Movie.id == movie_id))
+    assert version == 3
+    assert len(set(etags)) == 3
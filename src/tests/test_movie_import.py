@@ -0,0 +1,58 @@
+import json
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.exc import DataError
+from src.catalog import MovieImporter
+from src.database.models import Genre, Movie
+from src.search.memory import InMemoryMovieSearchEngine
+
+
+class RejectingImporter(MovieImporter):
+    """
+    Fails any batch holding a movie named "Broken" after writing part of
+    it, as the database would for a value that overflows its column.
+    """
+
+    async def _import_batch(self, db, movies):
+        if any(movie.name == "Broken" for movie in movies):
+            await db.execute(
+                insert(Genre).values(name="Written before the failure")
+            )
+            raise DataError("INSERT INTO movies", {}, Exception("value too long"))
+        return await super()._import_batch(db, movies)
+
+
+def record(name: str) -> str:
+    return json.dumps(
+        {
+            "name": name,
+            "year": 2000,
+            "time": 100,
+            "imdb": 7.0,
+            "description": "A movie.",
+            "price": 4.99,
+            "genres": ["Drama"],
+            "stars": ["Jane Roe"],
+            "directors": ["John Doe"],
+            "certification": "PG",
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_rejected_batch_is_reported_and_import_continues(session_factory):
+    importer = RejectingImporter(InMemoryMovieSearchEngine(), batch_size=2)
+    records = [record("First"), record("Second"), record("Broken"), "{", record("Last")]
+
+    async with session_factory() as db:
+        report = await importer.run(db, records)
+        names = set((await db.scalars(select(Movie.name))).all())
+        genres = set((await db.scalars(select(Genre.name))).all())
+
+    assert (report.created, report.skipped, report.failed) == (3, 0, 2)
+    assert names == {"First", "Second", "Last"}
+    assert genres == {"Drama"}
+    assert report.errors == [
+        "Record 4: Invalid JSON: EOF while parsing an object at line 1 column 1",
+        "Records 3-3: batch rolled back: value too long",
+    ]
@@ -0,0 +1,65 @@
+import pytest
+from src.catalog import bump_catalog_version
+from src.database.models import Certification, Movie
+
+
+async def create_movie(
+    session_factory, name: str = "Heat", certification: str = "R"
+) -> None:
+    async with session_factory() as db:
+        db.add(
+            Movie(
+                name=name,
+                year=1995,
+                time=170,
+                imdb=8.3,
+                description="A group of professional bank robbers.",
+                price=9.99,
+                certification=Certification(name=certification),
+            )
+        )
+        await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_list_etag_is_reused_while_catalog_is_unchanged(client, session_factory):
+    await create_movie(session_factory)
+
+    first = await client.get("/movies/")
+    repeat = await client.get("/movies/", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200
+    assert repeat.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_list_etag_changes_after_write_from_another_process(
+    client, session_factory
+):
+    await create_movie(session_factory)
+    first = await client.get("/movies/")
+
+    # Another worker or the import CLI commits a change; this process's
+    # catalog cache is never invalidated.
+    async with session_factory() as db:
+        await bump_catalog_version(db)
+        await db.commit()
+    repeat = await client.get("/movies/", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert repeat.status_code == 200
+    assert repeat.headers["ETag"] != first.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_cached_total_is_dropped_after_catalog_write(client, session_factory):
+    await create_movie(session_factory)
+    first = await client.get("/movies/")
+
+    await create_movie(session_factory, name="Ronin", certification="PG-13")
+    async with session_factory() as db:
+        await bump_catalog_version(db)
+        await db.commit()
+    second = await client.get("/movies/")
+
+    assert first.json()["total_items"] == 1
+    assert second.json()["total_items"] == 2
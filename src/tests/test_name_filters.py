@@ -0,0 +1,41 @@
+import pytest
+from src.database.models import Certification, Movie, Star
+
+MATCHING_STARS = 150
+
+
+@pytest.mark.asyncio
+async def test_star_filter_is_not_capped_by_candidate_limit(client, session_factory):
+    async with session_factory() as db:
+        certification = Certification(name="PG")
+        db.add_all(
+            Movie(
+                name=f"Movie {i}",
+                year=2000,
+                time=100,
+                imdb=7.0,
+                description="A movie.",
+                price=4.99,
+                certification=certification,
+                stars=[Star(name=f"John Doe {i}")],
+            )
+            for i in range(MATCHING_STARS)
+        )
+        db.add(
+            Movie(
+                name="Other",
+                year=2000,
+                time=100,
+                imdb=7.0,
+                description="A movie.",
+                price=4.99,
+                certification=certification,
+                stars=[Star(name="Jane Roe")],
+            )
+        )
+        await db.commit()
+
+    response = await client.get("/movies/", params={"star": "john"})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["total_items"] == MATCHING_STARS
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from src.database.base import Base
+from src.database.models import EmailKind, EmailOutbox, OutboxStatus
+from src.tasks.emails import purge_finished_emails
+
+
+def test_purge_keeps_recent_and_unfinished_emails():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(engine)
+    now = datetime.now(timezone.utc)
+    rows = {
+        "old-sent": (OutboxStatus.sent, now - timedelta(days=8)),
+        "new-sent": (OutboxStatus.sent, now - timedelta(days=1)),
+        "old-dead": (OutboxStatus.dead, now - timedelta(days=31)),
+        "new-dead": (OutboxStatus.dead, now - timedelta(days=8)),
+        "old-pending": (OutboxStatus.pending, now - timedelta(days=60)),
+    }
+    with session_factory() as db:
+        db.add_all(
+            EmailOutbox(
+                kind=EmailKind.activation,
+                recipient=f"{name}@example.com",
+                payload={},
+                status=outbox_status,
+                next_attempt_at=finished_at,
+            )
+            for name, (outbox_status, finished_at) in rows.items()
+        )
+        db.commit()
+
+    purged = purge_finished_emails(
+        session_factory,
+        batch_size=1,
+        retention={
+            OutboxStatus.sent: timedelta(days=7),
+            OutboxStatus.dead: timedelta(days=30),
+        },
+    )
+
+    with session_factory() as db:
+        left = set(db.scalars(select(EmailOutbox.recipient)))
+    assert purged == {"sent": 1, "dead": 1}
+    assert left == {
+        "new-sent@example.com",
+        "new-dead@example.com",
+        "old-pending@example.com",
+    }
@@ -0,0 +1,41 @@
+import pytest
+from pydantic import ValidationError
+from starlette.requests import Request
+from src.config import BaseAppSettings
+from src.rate_limiting.dependencies import client_ip
+
+PROXIES = "10.0.0.0/8"
+
+
+def request_from(peer: str, forwarded_for: str | None = None) -> Request:
+    headers = []
+    if forwarded_for is not None:
+        headers.append((b"x-forwarded-for", forwarded_for.encode()))
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+
+def test_direct_peer_is_used_without_trusted_proxies():
+    assert client_ip(request_from("10.0.0.2", "203.0.113.7"), "") == "10.0.0.2"
+
+
+def test_forwarded_client_is_used_behind_trusted_proxy():
+    request = request_from("10.0.0.2", "203.0.113.7, 10.0.0.3")
+    assert client_ip(request, PROXIES) == "203.0.113.7"
+
+
+def test_forged_forwarded_for_does_not_override_real_client():
+    request = request_from("10.0.0.2", "198.51.100.1, 203.0.113.7")
+    assert client_ip(request, PROXIES) == "203.0.113.7"
+
+
+def test_untrusted_peer_cannot_set_forwarded_for():
+    request = request_from("203.0.113.7", "198.51.100.1")
+    assert client_ip(request, PROXIES) == "203.0.113.7"
+
+
+@pytest.mark.parametrize(
+    "setting", ["RATE_LIMIT_IP_REFILL_PER_MINUTE", "RATE_LIMIT_EMAIL_REFILL_PER_MINUTE"]
+)
+def test_refill_rates_must_be_positive(setting):
+    with pytest.raises(ValidationError):
+        BaseAppSettings(**{setting: 0})
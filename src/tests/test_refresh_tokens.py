@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import func, select
+from src.database.models import RefreshToken, User, UserGroup, UserGroupEnum
+
+CREDENTIALS = {"email": "viewer@example.com", "password": "Passw0rd!x"}
+
+
+async def login(client, session_factory) -> dict:
+    async with session_factory() as db:
+        user = User(
+            email=CREDENTIALS["email"],
+            group=UserGroup(name=UserGroupEnum.USER),
+            is_active=True,
+        )
+        user.password = CREDENTIALS["password"]
+        db.add(user)
+        await db.commit()
+    response = await client.post("/accounts/login/", json=CREDENTIALS)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def refresh(client, refresh_token: str):
+    return await client.post(
+        "/accounts/refresh/", json={"refresh_token": refresh_token}
+    )
+
+
+async def stored_tokens(session_factory) -> int:
+    async with session_factory() as db:
+        return await db.scalar(select(func.count(RefreshToken.id)))
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_the_refresh_token(client, session_factory):
+    tokens = await login(client, session_factory)
+
+    first = await refresh(client, tokens["refresh_token"])
+    assert first.status_code == 200, first.text
+    rotated = first.json()["refresh_token"]
+    assert rotated != tokens["refresh_token"]
+
+    second = await refresh(client, rotated)
+    assert second.status_code == 200, second.text
+    assert await stored_tokens(session_factory) == 1
+
+
+@pytest.mark.asyncio
+async def test_reused_refresh_token_ends_the_session(client, session_factory):
+    tokens = await login(client, session_factory)
+    rotated = (await refresh(client, tokens["refresh_token"])).json()["refresh_token"]
+
+    replay = await refresh(client, tokens["refresh_token"])
+
+    assert replay.status_code == 401
+    assert await stored_tokens(session_factory) == 0
+    assert (await refresh(client, rotated)).status_code == 401
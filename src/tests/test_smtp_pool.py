@@ -0,0 +1,87 @@
+import logging
+import socket
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+from src.notifications.smtp_pool import SMTPConnectionPool
+
+MESSAGE = "Subject: Test\r\n\r\nHello."
+
+logging.getLogger("mail.log").setLevel(logging.ERROR)
+
+
+class Mailbox:
+    def __init__(self):
+        self.delivered = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options) -> str:
+        if address.startswith("unknown@"):
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.delivered.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    mailbox = Mailbox()
+    controller = Controller(
+        mailbox,
+        hostname="127.0.0.1",
+        port=port,
+        auth_require_tls=False,
+        authenticator=lambda *_: AuthResult(success=True),
+    )
+    controller.start()
+    yield mailbox, port
+    controller.stop()
+
+
+def make_pool(port: int) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        hostname="127.0.0.1",
+        port=port,
+        username="user",
+        password="secret",
+        use_tls=False,
+        size=2,
+        idle_timeout=60,
+    )
+
+
+@pytest.mark.asyncio
+async def test_refused_recipient_keeps_session(smtp_server):
+    mailbox, port = smtp_server
+    pool = make_pool(port)
+    await pool.send_message("from@example.com", ["first@example.com"], MESSAGE)
+    [(session, _)] = pool._idle
+
+    with pytest.raises(aiosmtplib.SMTPRecipientsRefused):
+        await pool.send_message("from@example.com", ["unknown@example.com"], MESSAGE)
+    await pool.send_message("from@example.com", ["second@example.com"], MESSAGE)
+
+    assert [smtp for smtp, _ in pool._idle] == [session]
+    assert mailbox.delivered == ["first@example.com", "second@example.com"]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_dropped_session_is_replaced(smtp_server):
+    mailbox, port = smtp_server
+    pool = make_pool(port)
+    await pool.send_message("from@example.com", ["first@example.com"], MESSAGE)
+    [(session, _)] = pool._idle
+    session.close()
+
+    await pool.send_message("from@example.com", ["second@example.com"], MESSAGE)
+
+    assert [smtp for smtp, _ in pool._idle] != [session]
+    assert mailbox.delivered == ["first@example.com", "second@example.com"]
+    await pool.close()
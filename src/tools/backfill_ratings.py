@@ -0,0 +1,83 @@
+import argparse
+import asyncio
+from sqlalchemy import Float, case, cast, func, select, update
+from src.database import get_db_contextmanager
+from src.database.models import Dislike, Like, Movie, Rating
+
+
+def _count_of(model):
+    return (
+        select(func.count(model.id))
+        .where(model.movie_id == Movie.id)
+        .scalar_subquery()
+    )
+
+
+async def backfill_ratings(batch_size: int) -> int:
+    """
+    Recompute every denormalized vote column from the vote tables.
+
+    Covers like_count, dislike_count, rating_sum, rating_count,
+    rating_average and votes, which mirrors the rating count once a movie
+    has been rated (unrated movies keep their imported votes). The
+    migrations already populate these columns, so this is only needed to
+    resynchronize counters after votes were changed outside the API; run
+    it after `alembic upgrade head`.
+
+    Movies are processed in primary key batches, each in its own
+    transaction, so the command can run against a live database.
+    """
+    updated = 0
+    last_id = 0
+    async with get_db_contextmanager() as db:
+        while True:
+            ids = (
+                await db.scalars(
+                    select(Movie.id)
+                    .where(Movie.id > last_id)
+                    .order_by(Movie.id)
+                    .limit(batch_size)
+                )
+            ).all()
+            if not ids:
+                break
+
+            rating_sum = (
+                select(func.coalesce(func.sum(Rating.rating), 0))
+                .where(Rating.movie_id == Movie.id)
+                .scalar_subquery()
+            )
+            rating_count = _count_of(Rating)
+            await db.execute(
+                update(Movie)
+                .where(Movie.id.in_(ids))
+                .values(
+                    like_count=_count_of(Like),
+                    dislike_count=_count_of(Dislike),
+                    rating_sum=rating_sum,
+                    rating_count=rating_count,
+                    rating_average=func.coalesce(
+                        cast(rating_sum, Float) / func.nullif(rating_count, 0), 0.0
+                    ),
+                    votes=case((rating_count > 0, rating_count), else_=Movie.votes),
+                )
+            )
+            await db.commit()
+
+            updated += len(ids)
+            last_id = ids[-1]
+            print(f"Backfilled vote counters for {updated} movies.")
+    return updated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Recompute movie vote counters and rating aggregates."
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(backfill_ratings(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import argparse
+from pathlib import Path
+from src.config import get_settings
+from src.notifications.templates import compile_templates
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description="Precompile email templates for EMAIL_TEMPLATES_COMPILED_DIR."
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=settings.EMAIL_TEMPLATES_COMPILED_DIR or None,
+        help="Target directory; defaults to EMAIL_TEMPLATES_COMPILED_DIR.",
+    )
+    args = parser.parse_args()
+    if args.output is None:
+        parser.error("set EMAIL_TEMPLATES_COMPILED_DIR or pass --output")
+    args.output.mkdir(parents=True, exist_ok=True)
+    compile_templates(settings.PATH_TO_EMAIL_TEMPLATES_DIR, str(args.output))
+    print(f"Compiled email templates to {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
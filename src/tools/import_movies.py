@@ -0,0 +1,42 @@
+import argparse
+import asyncio
+from pathlib import Path
+from src.catalog import IMPORT_FORMATS, MovieImporter, read_records
+from src.config import get_settings
+from src.database import get_db_contextmanager
+from src.search import get_movie_search_engine
+
+
+async def import_movies(path: Path, batch_size: int) -> None:
+    import_format = IMPORT_FORMATS.get(path.suffix.lower())
+    if import_format is None:
+        raise SystemExit(f"Unsupported file type '{path.suffix}', expected .jsonl or .csv.")
+
+    async with get_db_contextmanager() as db:
+        importer = MovieImporter(
+            search_engine=get_movie_search_engine(db, get_settings()),
+            batch_size=batch_size,
+        )
+        with path.open(encoding="utf-8", newline="") as lines:
+            report = await importer.run(db, read_records(lines, import_format))
+
+    print(
+        f"Created {report.created}, skipped {report.skipped}, failed {report.failed} "
+        f"in {report.seconds}s ({report.rows_per_second} rows/sec)."
+    )
+    for error in report.errors:
+        print(error)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk import movies from a file.")
+    parser.add_argument("path", type=Path, help="A .jsonl or .csv file.")
+    parser.add_argument(
+        "--batch-size", type=int, default=get_settings().MOVIE_IMPORT_BATCH_SIZE
+    )
+    args = parser.parse_args()
+    asyncio.run(import_movies(args.path, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
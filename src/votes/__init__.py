@@ -0,0 +1,7 @@
+from src.votes.interfaces import Vote, VoteKind, VoteBufferInterface
+from src.votes.memory import InMemoryVoteBuffer
+from src.votes.redis import RedisVoteBuffer
+from src.votes.aggregates import movie_counter_values
+from src.votes.flusher import VoteFlusher
+from src.votes.toggles import ToggleResult, add_user_movie_row
+from src.votes.dependencies import get_vote_buffer, get_vote_flusher
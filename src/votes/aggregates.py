@@ -0,0 +1,31 @@
+from sqlalchemy import Float, cast
+from src.database.models import Movie
+
+
+def movie_counter_values(
+    like_delta: int = 0,
+    dislike_delta: int = 0,
+    rating_sum_delta: int = 0,
+    rating_count_delta: int = 0,
+) -> dict:
+    """
+    Build the SET clause that shifts a movie's denormalized vote counters.
+
+    Every counter is expressed relative to its current value, so the
+    resulting UPDATE is atomic regardless of concurrent writers.
+    """
+    values = {}
+    if like_delta:
+        values["like_count"] = Movie.like_count + like_delta
+    if dislike_delta:
+        values["dislike_count"] = Movie.dislike_count + dislike_delta
+    if rating_sum_delta or rating_count_delta:
+        rating_sum = Movie.rating_sum + rating_sum_delta
+        rating_count = Movie.rating_count + rating_count_delta
+        values.update(
+            rating_sum=rating_sum,
+            rating_count=rating_count,
+            rating_average=cast(rating_sum, Float) / rating_count,
+            votes=rating_count,
+        )
+    return values
@@ -0,0 +1,41 @@
+from fastapi import Depends
+from src.config import get_settings, shared_instance, BaseAppSettings
+from src.database import get_db_contextmanager
+from src.votes.flusher import VoteFlusher
+from src.votes.interfaces import VoteBufferInterface
+from src.votes.memory import InMemoryVoteBuffer
+from src.votes.redis import RedisVoteBuffer
+
+
+def get_vote_buffer(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> VoteBufferInterface | None:
+    """
+    Return the shared vote buffer, or None when votes are written synchronously.
+    """
+    if not settings.VOTE_INGESTION_ENABLED:
+        return None
+    if settings.VOTE_BUFFER_USE_REDIS:
+        return shared_instance(
+            "vote_buffer",
+            settings,
+            lambda: RedisVoteBuffer(url=settings.CELERY_BROKER_URL),
+        )
+    return shared_instance("vote_buffer", settings, InMemoryVoteBuffer)
+
+
+def get_vote_flusher(settings: BaseAppSettings) -> VoteFlusher | None:
+    vote_buffer = get_vote_buffer(settings)
+    if vote_buffer is None:
+        return None
+    return shared_instance(
+        "vote_flusher",
+        settings,
+        lambda: VoteFlusher(
+            buffer=vote_buffer,
+            session_factory=get_db_contextmanager,
+            batch_size=settings.VOTE_FLUSH_BATCH_SIZE,
+            interval_seconds=settings.VOTE_FLUSH_INTERVAL_SECONDS,
+            max_attempts=settings.VOTE_FLUSH_MAX_ATTEMPTS,
+        ),
+    )
@@ -0,0 +1,203 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import AsyncContextManager, Callable
+from sqlalchemy import delete, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.models import Dislike, Like, Movie, Rating
+from src.votes.aggregates import movie_counter_values
+from src.votes.interfaces import Vote, VoteBufferInterface, VoteKind
+
+
+class VoteFlusher:
+    """
+    Background worker that moves buffered votes into the database in bulk.
+
+    Each flush inserts likes and dislikes with ON CONFLICT DO NOTHING,
+    upserts ratings, and then issues one counter UPDATE per affected movie.
+    As in `add_user_movie_row`, a like removes the user's dislike of the
+    movie and vice versa; when a batch holds both for the same pair, the
+    later one wins. Votes for movies that no longer exist are dropped.
+
+    When a batch is rejected by the database, its votes are applied one by
+    one so that a single bad vote (e.g. from a deleted user) cannot hold
+    back the rest. A vote that keeps failing is retried from the tail of
+    the buffer and dead-lettered after `max_attempts` flushes. Any other
+    error requeues the whole batch unchanged.
+    """
+
+    _REJECTED = (IntegrityError, DataError)
+
+    def __init__(
+        self,
+        buffer: VoteBufferInterface,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        batch_size: int,
+        interval_seconds: float,
+        max_attempts: int,
+    ):
+        self._buffer = buffer
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._interval_seconds = interval_seconds
+        self._max_attempts = max_attempts
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while await self.flush() >= self._batch_size:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                while await self.flush() >= self._batch_size:
+                    pass
+            except Exception:
+                logging.exception("Vote flush failed; votes were requeued.")
+            await asyncio.sleep(self._interval_seconds)
+
+    async def flush(self) -> int:
+        votes = await self._buffer.drain(self._batch_size)
+        if not votes:
+            return 0
+        try:
+            await self._apply_in_transaction(votes)
+        except self._REJECTED:
+            await self._apply_each(votes)
+        except BaseException:
+            await self._buffer.requeue(votes)
+            raise
+        return len(votes)
+
+    async def _apply_in_transaction(self, votes: list[Vote]) -> None:
+        async with self._session_factory() as db:
+            await self._apply(db, votes)
+            await db.commit()
+
+    async def _apply_each(self, votes: list[Vote]) -> None:
+        retry, dead = [], []
+        done = 0
+        try:
+            for vote in votes:
+                try:
+                    await self._apply_in_transaction([vote])
+                except self._REJECTED as error:
+                    vote = vote._replace(attempts=vote.attempts + 1)
+                    if vote.attempts >= self._max_attempts:
+                        logging.error(
+                            f"Dead-lettering vote {vote} after "
+                            f"{vote.attempts} attempts: {error}"
+                        )
+                        dead.append(vote)
+                    else:
+                        retry.append(vote)
+                done += 1
+        except BaseException:
+            await self._buffer.requeue(votes[done:])
+            raise
+        finally:
+            for vote in retry:
+                await self._buffer.push(vote)
+            await self._buffer.dead_letter(dead)
+
+    async def _apply(self, db: AsyncSession, votes: list[Vote]) -> None:
+        movie_ids = {vote.movie_id for vote in votes}
+        known_ids = set(
+            await db.scalars(select(Movie.id).where(Movie.id.in_(movie_ids)))
+        )
+
+        reactions, ratings = {}, {}
+        for vote in votes:
+            if vote.movie_id not in known_ids:
+                continue
+            pair = (vote.user_id, vote.movie_id)
+            if vote.kind is VoteKind.RATING:
+                ratings[pair] = vote.value
+            else:
+                reactions[pair] = vote.kind
+        likes = {pair for pair, kind in reactions.items() if kind is VoteKind.LIKE}
+        dislikes = set(reactions) - likes
+
+        insert = sqlite.insert if db.get_bind().dialect.name == "sqlite" else postgresql.insert
+        like_deltas = await self._insert_pairs(db, insert, Like, likes)
+        like_deltas.subtract(await self._delete_pairs(db, Like, dislikes))
+        dislike_deltas = await self._insert_pairs(db, insert, Dislike, dislikes)
+        dislike_deltas.subtract(await self._delete_pairs(db, Dislike, likes))
+        rating_sum_deltas, rating_count_deltas = Counter(), Counter()
+
+        if ratings:
+            previous = {
+                (user_id, movie_id): rating
+                for user_id, movie_id, rating in await db.execute(
+                    select(Rating.user_id, Rating.movie_id, Rating.rating)
+                    .where(tuple_(Rating.user_id, Rating.movie_id).in_(list(ratings)))
+                    .with_for_update()
+                )
+            }
+            for (user_id, movie_id), rating in ratings.items():
+                if (user_id, movie_id) in previous:
+                    rating_sum_deltas[movie_id] += rating - previous[(user_id, movie_id)]
+                else:
+                    rating_sum_deltas[movie_id] += rating
+                    rating_count_deltas[movie_id] += 1
+
+            stmt = insert(Rating).values(
+                [
+                    {"user_id": user_id, "movie_id": movie_id, "rating": rating}
+                    for (user_id, movie_id), rating in ratings.items()
+                ]
+            )
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["user_id", "movie_id"],
+                    set_={"rating": stmt.excluded.rating},
+                )
+            )
+
+        for movie_id in known_ids:
+            values = movie_counter_values(
+                like_delta=like_deltas[movie_id],
+                dislike_delta=dislike_deltas[movie_id],
+                rating_sum_delta=rating_sum_deltas[movie_id],
+                rating_count_delta=rating_count_deltas[movie_id],
+            )
+            if values:
+                await db.execute(
+                    update(Movie).where(Movie.id == movie_id).values(**values)
+                )
+
+    @staticmethod
+    async def _insert_pairs(db: AsyncSession, insert, model, pairs: set) -> Counter:
+        if not pairs:
+            return Counter()
+        inserted = await db.scalars(
+            insert(model)
+            .values([{"user_id": user_id, "movie_id": movie_id} for user_id, movie_id in pairs])
+            .on_conflict_do_nothing(index_elements=["user_id", "movie_id"])
+            .returning(model.movie_id)
+        )
+        return Counter(inserted)
+
+    @staticmethod
+    async def _delete_pairs(db: AsyncSession, model, pairs: set) -> Counter:
+        if not pairs:
+            return Counter()
+        removed = await db.scalars(
+            delete(model)
+            .where(tuple_(model.user_id, model.movie_id).in_(list(pairs)))
+            .returning(model.movie_id)
+        )
+        return Counter(removed)
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import NamedTuple
+
+
+class VoteKind(str, Enum):
+    LIKE = "like"
+    DISLIKE = "dislike"
+    RATING = "rating"
+
+
+class Vote(NamedTuple):
+    kind: VoteKind
+    user_id: int
+    movie_id: int
+    value: int | None = None
+    attempts: int = 0
+
+
+class VoteBufferInterface(ABC):
+
+    @abstractmethod
+    async def push(self, vote: Vote) -> None:
+        """
+        Accept a vote for a later bulk flush.
+
+        :param vote: The like, dislike or rating to record.
+        """
+        pass
+
+    @abstractmethod
+    async def drain(self, limit: int) -> list[Vote]:
+        """
+        Remove and return up to `limit` buffered votes in arrival order.
+
+        :param limit: The maximum number of votes to return.
+        :return: The drained votes.
+        """
+        pass
+
+    @abstractmethod
+    async def requeue(self, votes: list[Vote]) -> None:
+        """
+        Put votes back at the head of the buffer after a failed flush.
+
+        :param votes: The votes returned by `drain`.
+        """
+        pass
+
+    @abstractmethod
+    async def dead_letter(self, votes: list[Vote]) -> None:
+        """
+        Set aside votes that repeatedly failed to apply, for inspection.
+
+        :param votes: The votes to remove from circulation.
+        """
+        pass
@@ -0,0 +1,27 @@
+from collections import deque
+from src.votes.interfaces import Vote, VoteBufferInterface
+
+
+class InMemoryVoteBuffer(VoteBufferInterface):
+    """
+    Process-local vote buffer; each worker flushes its own votes.
+    """
+
+    def __init__(self, dead_letter_size: int = 1000):
+        self._votes: deque[Vote] = deque()
+        self.dead_letters: deque[Vote] = deque(maxlen=dead_letter_size)
+
+    def __len__(self) -> int:
+        return len(self._votes)
+
+    async def push(self, vote: Vote) -> None:
+        self._votes.append(vote)
+
+    async def drain(self, limit: int) -> list[Vote]:
+        return [self._votes.popleft() for _ in range(min(limit, len(self._votes)))]
+
+    async def requeue(self, votes: list[Vote]) -> None:
+        self._votes.extendleft(reversed(votes))
+
+    async def dead_letter(self, votes: list[Vote]) -> None:
+        self.dead_letters.extend(votes)
@@ -0,0 +1,47 @@
+import json
+from redis.asyncio import Redis
+from src.votes.interfaces import Vote, VoteBufferInterface, VoteKind
+
+
+class RedisVoteBuffer(VoteBufferInterface):
+    """
+    Vote buffer backed by a Redis list shared by all workers.
+    """
+
+    def __init__(self, url: str, key: str = "votes:buffer"):
+        self._client = Redis.from_url(url)
+        self._key = key
+        self._dead_key = f"{key}:dead"
+
+    @staticmethod
+    def _dump(vote: Vote) -> str:
+        return json.dumps(
+            [vote.kind.value, vote.user_id, vote.movie_id, vote.value, vote.attempts]
+        )
+
+    @staticmethod
+    def _load(raw: bytes) -> Vote:
+        kind, user_id, movie_id, value, *attempts = json.loads(raw)
+        return Vote(VoteKind(kind), user_id, movie_id, value, *attempts)
+
+    async def push(self, vote: Vote) -> None:
+        await self._client.rpush(self._key, self._dump(vote))
+
+    async def drain(self, limit: int) -> list[Vote]:
+        raw_votes = await self._client.lpop(self._key, limit)
+        return [self._load(raw) for raw in raw_votes or []]
+
+    async def requeue(self, votes: list[Vote]) -> None:
+        if votes:
+            await self._client.lpush(
+                self._key, *(self._dump(vote) for vote in reversed(votes))
+            )
+
+    async def dead_letter(self, votes: list[Vote]) -> None:
+        if votes:
+            await self._client.rpush(
+                self._dead_key, *(self._dump(vote) for vote in votes)
+            )
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,129 @@
+from typing import NamedTuple
+from sqlalchemy import delete, func, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.models import Dislike, Like, Movie
+
+COUNTER_COLUMNS = {Like: "like_count", Dislike: "dislike_count"}
+
+
+class ToggleResult(NamedTuple):
+    movie_name: str | None
+    created_id: int | None
+
+
+async def add_user_movie_row(
+    db: AsyncSession,
+    model,
+    user_id: int,
+    movie_id: int,
+    exclusive_with=None,
+) -> ToggleResult:
+    """
+    Insert a (user_id, movie_id) row unless it already exists.
+
+    The row of `exclusive_with` for the same pair is removed and the movie's
+    denormalized counters are adjusted as part of the same write. On
+    PostgreSQL everything runs as a single statement built from
+    data-modifying CTEs; SQLite falls back to consecutive statements in the
+    current transaction.
+
+    :return: The movie name (None if the movie does not exist) and the id of
+        the created row (None if it already existed).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return await _add_in_one_statement(db, model, user_id, movie_id, exclusive_with)
+    return await _add_sequentially(db, model, user_id, movie_id, exclusive_with)
+
+
+async def _add_in_one_statement(
+    db: AsyncSession, model, user_id: int, movie_id: int, exclusive_with
+) -> ToggleResult:
+    inserted = (
+        postgresql.insert(model)
+        .from_select(
+            ["user_id", "movie_id"],
+            select(literal(user_id), Movie.id).where(Movie.id == movie_id),
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "movie_id"])
+        .returning(model.id)
+        .cte("inserted")
+    )
+    stmt = select(Movie.name, select(inserted.c.id).scalar_subquery()).where(
+        Movie.id == movie_id
+    )
+
+    counter_values = {}
+    if model in COUNTER_COLUMNS:
+        column = COUNTER_COLUMNS[model]
+        counter_values[column] = (
+            getattr(Movie, column)
+            + select(func.count()).select_from(inserted).scalar_subquery()
+        )
+    if exclusive_with is not None:
+        removed = (
+            delete(exclusive_with)
+            .where(
+                exclusive_with.user_id == user_id,
+                exclusive_with.movie_id == movie_id,
+            )
+            .returning(exclusive_with.id)
+            .cte("removed")
+        )
+        stmt = stmt.add_cte(removed)
+        if exclusive_with in COUNTER_COLUMNS:
+            column = COUNTER_COLUMNS[exclusive_with]
+            counter_values[column] = (
+                getattr(Movie, column)
+                - select(func.count()).select_from(removed).scalar_subquery()
+            )
+    if counter_values:
+        counters = (
+            update(Movie)
+            .where(Movie.id == movie_id)
+            .values(**counter_values)
+            .returning(Movie.id)
+            .cte("counters")
+        )
+        stmt = stmt.add_cte(counters)
+
+    row = (await db.execute(stmt)).one_or_none()
+    return ToggleResult(*row) if row else ToggleResult(None, None)
+
+
+async def _add_sequentially(
+    db: AsyncSession, model, user_id: int, movie_id: int, exclusive_with
+) -> ToggleResult:
+    movie_name = await db.scalar(select(Movie.name).where(Movie.id == movie_id))
+    if movie_name is None:
+        return ToggleResult(None, None)
+
+    counter_values = {}
+    created_id = await db.scalar(
+        sqlite.insert(model)
+        .values(user_id=user_id, movie_id=movie_id)
+        .on_conflict_do_nothing(index_elements=["user_id", "movie_id"])
+        .returning(model.id)
+    )
+    if created_id is not None and model in COUNTER_COLUMNS:
+        column = COUNTER_COLUMNS[model]
+        counter_values[column] = getattr(Movie, column) + 1
+    if exclusive_with is not None:
+        removed = (
+            await db.scalars(
+                delete(exclusive_with)
+                .where(
+                    exclusive_with.user_id == user_id,
+                    exclusive_with.movie_id == movie_id,
+                )
+                .returning(exclusive_with.id)
+            )
+        ).all()
+        if removed and exclusive_with in COUNTER_COLUMNS:
+            column = COUNTER_COLUMNS[exclusive_with]
+            counter_values[column] = getattr(Movie, column) - len(removed)
+    if counter_values:
+        await db.execute(
+            update(Movie).where(Movie.id == movie_id).values(**counter_values)
+        )
+    return ToggleResult(movie_name, created_id)